@@ -9,7 +9,9 @@ Coordinate system:
         At x=0 this equals the temperature, so the y-axis can be labeled in °C.
 """
 
+import functools
 import math
+from typing import NamedTuple
 
 import numpy as np
 
@@ -30,44 +32,33 @@ _C = [
 
 
 # ---------------------------------------------------------------------------
-# Scalar helper functions
+# Array helpers
 # ---------------------------------------------------------------------------
 
-def _p_sat_scalar(t) -> float:
-    """Saturation vapour pressure [Pa] for temperature *t* [°C] (scalar)."""
-    if t < 0.01:
-        return 611.0 * math.exp(
-            _C[0] + _C[1] * t + _C[2] * t**2 + _C[3] * t**3 + _C[4] * t**4
-        )
-    return 611.0 * math.exp(
-        _C[5] + _C[6] * t + _C[7] * t**2 + _C[8] * t**3 + _C[9] * t**4
-    )
+def _as_float_array(a):
+    """Array view of *a*; floating dtypes are kept, others become float64.
 
+    Python scalars stay Python floats so they do not upcast float32 arrays.
+    """
+    if isinstance(a, (int, float)):
+        return float(a)
+    a = np.asarray(a)
+    if not np.issubdtype(a.dtype, np.floating):
+        a = a.astype(float)
+    return a
 
-def _log_p_sat_scalar(t) -> float:
-    """log(saturation pressure) — used by Newton solver."""
-    if t < 0.01:
-        return math.log(611.0) + (
-            _C[0] + _C[1] * t + _C[2] * t**2 + _C[3] * t**3 + _C[4] * t**4
-        )
-    return math.log(611.0) + (
-        _C[5] + _C[6] * t + _C[7] * t**2 + _C[8] * t**3 + _C[9] * t**4
-    )
+
+def _scalar_or_array(result):
+    """Return a Python float for 0-d results, the array otherwise."""
+    return float(result) if np.ndim(result) == 0 else result
 
 
 # ---------------------------------------------------------------------------
 # Vectorised saturation-pressure (numpy)
 # ---------------------------------------------------------------------------
 
-def p_sat(t):
-    """Saturation vapour pressure [Pa] for temperature *t* [°C].
-
-    Works with scalars and numpy arrays.
-    """
-    t = np.asarray(t, dtype=float)
-    scalar = t.ndim == 0
-    t = np.atleast_1d(t)
-
+def _p_sat_exact(t: np.ndarray) -> np.ndarray:
+    """Saturation vapour pressure [Pa] from the polynomials (1-d array)."""
     lo = t < 0.01
     hi = ~lo
 
@@ -80,64 +71,202 @@ def p_sat(t):
         _C[5] + _C[6] * t[hi] + _C[7] * t[hi]**2
         + _C[8] * t[hi]**3 + _C[9] * t[hi]**4
     )
+    return result
+
+
+def p_sat(t):
+    """Saturation vapour pressure [Pa] for temperature *t* [°C].
+
+    Works with scalars and numpy arrays; floating dtypes are preserved.
+    Uses the lookup table if enabled with :func:`set_p_sat_table`.
+    """
+    t = _as_float_array(t)
+    scalar = np.ndim(t) == 0
+    t = np.atleast_1d(t)
+
+    result = _p_sat_tabulated(t) if _use_p_sat_table else _p_sat_exact(t)
 
     return float(result[0]) if scalar else result
 
 
-def temperature_p_sat(p_s) -> float:
-    """Inverse of *p_sat*: temperature [°C] from saturation pressure [Pa].
+def _log_p_sat(t, lo):
+    """log(saturation pressure) and its derivative d/dt for branch mask *lo*."""
+    c = np.where(lo[..., None], _C[:5], _C[5:])
+    log_p = math.log(611.0) + c[..., 0] + t * (c[..., 1] + t * (c[..., 2] + t * (c[..., 3] + t * c[..., 4])))
+    d_log_p = c[..., 1] + t * (2 * c[..., 2] + t * (3 * c[..., 3] + t * 4 * c[..., 4]))
+    return log_p, d_log_p
+
+
+# log(p_sat) at the branch threshold; pressures below use the ice polynomial
+_LOG_P_SAT_THRESHOLD = math.log(611.0) + sum(c * 0.01**i for i, c in enumerate(_C[:5]))
 
-    Uses Newton's method on log(p_sat) for better convergence.
-    """
-    if p_s >= math.exp(14.2):
-        raise ValueError(f"Saturation pressure too high: {p_s}")
 
-    log_p_s = math.log(p_s)
-    t = 0.0
-    eps = 1e-4
+def _temperature_p_sat_newton(log_p_s: np.ndarray, lo: np.ndarray) -> np.ndarray:
+    """Solve log(p_sat(t)) = *log_p_s* for all points with Newton's method."""
+    # NaN targets give NaN; every other point must converge
+    active = ~np.isnan(log_p_s)
+    t = np.where(active, 0.0, np.nan)
 
-    for _ in range(200):
-        residual = _log_p_sat_scalar(t) - log_p_s
-        if abs(residual) <= 1e-3:
+    for _ in range(50):
+        log_p, d_log_p = _log_p_sat(t[active], lo[active])
+        residual = log_p - log_p_s[active]
+        if not np.isfinite(residual).all():
+            break
+        t[active] -= residual / d_log_p
+        active[active] = np.abs(residual) > 1e-10
+        if not active.any():
             return t
-        deriv = (_log_p_sat_scalar(t + eps) - _log_p_sat_scalar(t - eps)) / (2 * eps)
-        t -= residual / deriv
 
     raise RuntimeError("temperature_p_sat did not converge")  # pragma: no cover
 
 
+def temperature_p_sat(p_s):
+    """Inverse of *p_sat*: temperature [°C] from saturation pressure [Pa].
+
+    Works with scalars and numpy arrays. All points are solved together with
+    Newton's method on log(p_sat) using the analytic derivative, or read from
+    the lookup table if enabled with :func:`set_p_sat_table`.
+    """
+    p_s = _as_float_array(p_s)
+    scalar = np.ndim(p_s) == 0
+    dtype = np.result_type(p_s)
+    p_s = np.atleast_1d(p_s).astype(float)
+
+    if np.any(p_s >= math.exp(14.2)):
+        raise ValueError(f"Saturation pressure too high: {p_s.max()}")
+    if np.any(p_s <= 0):
+        raise ValueError(f"Saturation pressure must be positive: {p_s.min()}")
+
+    log_p_s = np.log(p_s)
+    lo = log_p_s <= _LOG_P_SAT_THRESHOLD
+    if _use_p_sat_table:
+        t = _temperature_p_sat_tabulated(log_p_s, lo)
+    else:
+        t = _temperature_p_sat_newton(log_p_s, lo)
+
+    return float(t[0]) if scalar else t.astype(dtype, copy=False)
+
+
+# ---------------------------------------------------------------------------
+# Tabulated saturation pressure
+# ---------------------------------------------------------------------------
+
+# Table range [°C] and grid step [K]. ln(p_sat) is interpolated linearly per
+# branch of the polynomial; measured max relative error of p_sat is 1e-7 and
+# max error of temperature_p_sat is 6e-7 K versus the exact formulas, over
+# the whole range including the ice/water join.
+P_SAT_TABLE_RANGE = (-40.0, 80.0)
+P_SAT_TABLE_STEP = 0.01
+_P_SAT_TABLE_JOIN_MARGIN = 10 * P_SAT_TABLE_STEP
+
+_use_p_sat_table = False
+_p_sat_table = None
+
+
+class _PSatTable(NamedTuple):
+    """ln(p_sat) grids below and above the 0.01 °C branch threshold."""
+
+    t_lo: np.ndarray
+    log_p_lo: np.ndarray
+    t_hi: np.ndarray
+    log_p_hi: np.ndarray
+
+
+def _get_p_sat_table() -> _PSatTable:
+    """Build the lookup table on first use."""
+    global _p_sat_table
+    if _p_sat_table is None:
+        t_min, t_max = P_SAT_TABLE_RANGE
+        # Both branches run past the join: the polynomials do not meet at
+        # 0.01 °C, so the inverse of one branch can lie slightly beyond it
+        join_lo, join_hi = 0.01 - _P_SAT_TABLE_JOIN_MARGIN, 0.01 + _P_SAT_TABLE_JOIN_MARGIN
+        t_lo = np.linspace(t_min, join_hi, int(round((join_hi - t_min) / P_SAT_TABLE_STEP)) + 1)
+        t_hi = np.linspace(join_lo, t_max, int(round((t_max - join_lo) / P_SAT_TABLE_STEP)) + 1)
+        _p_sat_table = _PSatTable(
+            t_lo, _log_p_sat(t_lo, np.ones(t_lo.shape, dtype=bool))[0],
+            t_hi, _log_p_sat(t_hi, np.zeros(t_hi.shape, dtype=bool))[0],
+        )
+    return _p_sat_table
+
+
+def _p_sat_tabulated(t: np.ndarray) -> np.ndarray:
+    """Saturation vapour pressure from the lookup table, exact outside its range."""
+    table = _get_p_sat_table()
+    lo = t < 0.01
+    hi = ~lo
+
+    result = np.empty_like(t)
+    result[lo] = np.exp(np.interp(t[lo], table.t_lo, table.log_p_lo))
+    result[hi] = np.exp(np.interp(t[hi], table.t_hi, table.log_p_hi))
+
+    outside = (t < P_SAT_TABLE_RANGE[0]) | (t > P_SAT_TABLE_RANGE[1])
+    if outside.any():
+        result[outside] = _p_sat_exact(t[outside])
+    return result
+
+
+def _temperature_p_sat_tabulated(log_p_s: np.ndarray, lo: np.ndarray) -> np.ndarray:
+    """Inverse saturation pressure from the lookup table, Newton outside its range."""
+    table = _get_p_sat_table()
+    hi = ~lo
+
+    t = np.empty_like(log_p_s)
+    t[lo] = np.interp(log_p_s[lo], table.log_p_lo, table.t_lo)
+    t[hi] = np.interp(log_p_s[hi], table.log_p_hi, table.t_hi)
+
+    outside = (log_p_s < table.log_p_lo[0]) | (log_p_s > table.log_p_hi[-1])
+    if outside.any():
+        t[outside] = _temperature_p_sat_newton(log_p_s[outside], lo[outside])
+    return t
+
+
+def set_p_sat_table(enabled: bool = True) -> None:
+    """Switch :func:`p_sat` and :func:`temperature_p_sat` to the lookup table.
+
+    The table covers ``P_SAT_TABLE_RANGE`` and is built once on first use;
+    values outside the range are computed exactly.
+    """
+    global _use_p_sat_table
+    _use_p_sat_table = bool(enabled)
+
+
 # ---------------------------------------------------------------------------
-# Coordinate functions (scalar)
+# Coordinate functions
 # ---------------------------------------------------------------------------
 
-def enthalpy(x, y) -> float:
+def enthalpy(x, y):
     """Enthalpy [kJ/kg] from diagram coordinates (*x*, *y*)."""
-    return R_0 * x + C_PL * y
+    x, y = _as_float_array(x), _as_float_array(y)
+    return _scalar_or_array(R_0 * x + C_PL * y)
 
 
-def temperature(x, y) -> float:
+def temperature(x, y):
     """Temperature [°C] from diagram coordinates (*x*, *y*)."""
-    return (y * C_PL * (1 + x) + R_0 * x**2) / (C_PL + x * C_PW)
+    x, y = _as_float_array(x), _as_float_array(y)
+    return _scalar_or_array((y * C_PL * (1 + x) + R_0 * x**2) / (C_PL + x * C_PW))
 
 
-def rel_humidity(x, y, p) -> float:
+def rel_humidity(x, y, p):
     """Relative humidity [0–1] from diagram coordinates and pressure [Pa]."""
-    return x / (K + x) * p / _p_sat_scalar(temperature(x, y))
+    x, y, p = _as_float_array(x), _as_float_array(y), _as_float_array(p)
+    return _scalar_or_array(x / (K + x) * p / p_sat(temperature(x, y)))
 
 
-def density(x, y, p) -> float:
+def density(x, y, p):
     """Air density [kg/m³] from diagram coordinates and pressure [Pa]."""
+    x, p = _as_float_array(x), _as_float_array(p)
     t = temperature(x, y)
-    return p / (R_W * (K_0C + t)) * (1 + x) / (K + x) / 1000
+    return _scalar_or_array(p / (R_W * (K_0C + t)) * (1 + x) / (K + x) / 1000)
 
 
 # ---------------------------------------------------------------------------
 # Coordinate conversions
 # ---------------------------------------------------------------------------
 
-def _t_to_y(t, x) -> float:
+def _t_to_y(t, x):
     """Convert temperature + absolute humidity to y-coordinate."""
-    return (t * (C_PL + x * C_PW) - R_0 * x**2) / (C_PL * (1 + x))
+    t, x = _as_float_array(t), _as_float_array(x)
+    return _scalar_or_array((t * (C_PL + x * C_PW) - R_0 * x**2) / (C_PL * (1 + x)))
 
 
 def get_x_y(t, phi, p):
@@ -145,9 +274,10 @@ def get_x_y(t, phi, p):
 
     Works with scalars and numpy arrays.
     """
-    t = np.asarray(t, dtype=float)
-    phi = np.asarray(phi, dtype=float)
-    scalar = t.ndim == 0 and phi.ndim == 0
+    t = _as_float_array(t)
+    phi = _as_float_array(phi)
+    p = _as_float_array(p)
+    scalar = np.ndim(t) == 0 and np.ndim(phi) == 0 and np.ndim(p) == 0
 
     ps = p_sat(t)
     x_val = phi * K / (p / ps - phi)
@@ -164,48 +294,79 @@ def get_x_y_tx(t, x, p):
     return x, y
 
 
-def y_phix(phi, x, p) -> float:
-    """y-coordinate from relative humidity, absolute humidity, pressure."""
+def y_phix(phi, x, p):
+    """y-coordinate from relative humidity, absolute humidity, pressure.
+
+    Works with scalars and numpy arrays.
+    """
+    x, phi, p = _as_float_array(x), _as_float_array(phi), _as_float_array(p)
     t_s = temperature_p_sat(x * p / (phi * (K + x)))
-    return (C_PL + x * C_PW) / (C_PL * (1 + x)) * (
+    return _scalar_or_array((C_PL + x * C_PW) / (C_PL * (1 + x)) * (
         t_s - R_0 * x**2 / (C_PL + x * C_PW)
-    )
-
+    ))
 
-def x_phiy(phi, y, p) -> float:
-    """Absolute humidity from relative humidity and y-coordinate (Newton)."""
-    def _phi_of_x(xv):
-        return xv / (K + xv) * p / _p_sat_scalar(temperature(xv, y))
 
-    x = 0.0
-    eps = 1e-6
-    for _ in range(200):
-        res = _phi_of_x(x) - phi
-        if abs(res) <= 1e-5:
-            return x
-        deriv = (_phi_of_x(x + eps) - _phi_of_x(x - eps)) / (2 * eps)
-        x -= res / deriv
+def x_phiy(phi, y, p):
+    """Absolute humidity from relative humidity and y-coordinate.
 
-    raise RuntimeError("x_phiy did not converge")  # pragma: no cover
-
-
-def x_hy(h, y) -> float:
+    Works with scalars and numpy arrays. All points are solved together with
+    Newton's method using the analytic derivative of phi(x).
+    """
+    phi, y, p = _as_float_array(phi), _as_float_array(y), _as_float_array(p)
+    dtype = np.result_type(phi, y)
+    phi, y, p = np.broadcast_arrays(phi, y, p)
+    shape = phi.shape
+    phi, y, p = (np.atleast_1d(a).astype(float).ravel() for a in (phi, y, p))
+
+    # NaN inputs give NaN; every other point must converge
+    active = ~(np.isnan(phi) | np.isnan(y) | np.isnan(p))
+    x = np.where(active, 0.0, np.nan)
+
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        for _ in range(100):
+            xa, ya, pa = x[active], y[active], p[active]
+            denom = C_PL + xa * C_PW
+            t = (ya * C_PL * (1 + xa) + R_0 * xa**2) / denom
+            dt_dx = ((ya * C_PL + 2 * R_0 * xa) * denom
+                     - (ya * C_PL * (1 + xa) + R_0 * xa**2) * C_PW) / denom**2
+            log_p, d_log_p = _log_p_sat(t, t < 0.01)
+            p_ratio = pa / np.exp(log_p)
+
+            residual = xa / (K + xa) * p_ratio - phi[active]
+            deriv = p_ratio * (K / (K + xa)**2 - xa / (K + xa) * d_log_p * dt_dx)
+            step = residual / deriv
+            if not np.isfinite(step).all():
+                # diverged, e.g. no saturation state on this y-line
+                failed = np.flatnonzero(active)[~np.isfinite(step)][0]
+                raise RuntimeError(f"x_phiy did not converge for phi={phi[failed]}, y={y[failed]}, p={p[failed]}")
+            x[active] -= step
+            active[active] = np.abs(residual) > 1e-10
+            if not active.any():
+                return float(x[0]) if shape == () else x.reshape(shape).astype(dtype, copy=False)
+
+    raise RuntimeError("x_phiy did not converge")
+
+
+def x_hy(h, y):
     """Absolute humidity from enthalpy [kJ/kg] and y-coordinate."""
-    return (h - C_PL * y) / R_0
+    h, y = _as_float_array(h), _as_float_array(y)
+    return _scalar_or_array((h - C_PL * y) / R_0)
 
 
-def y_hx(h, x) -> float:
+def y_hx(h, x):
     """y-coordinate from enthalpy [kJ/kg] and absolute humidity."""
-    return (h - R_0 * x) / C_PL
+    h, x = _as_float_array(h), _as_float_array(x)
+    return _scalar_or_array((h - R_0 * x) / C_PL)
 
 
-def y_rhox(rho, x, p) -> float:
+def y_rhox(rho, x, p):
     """y-coordinate from density [kg/m³], absolute humidity, pressure [Pa]."""
-    return (C_PL + x * C_PW) / (C_PL * (1 + x)) * (
+    rho, x, p = _as_float_array(rho), _as_float_array(x), _as_float_array(p)
+    return _scalar_or_array((C_PL + x * C_PW) / (C_PL * (1 + x)) * (
         p / (R_W * rho) * (1 + x) / (K + x) * 0.001
         - K_0C
         - R_0 * x**2 / (C_PL + x * C_PW)
-    )
+    ))
 
 
 # ---------------------------------------------------------------------------
@@ -216,126 +377,136 @@ def _sort_range(r):
     return (min(r), max(r))
 
 
-def _isin(x, rng):
-    return (rng[0] < x < rng[1]) or (rng[1] < x < rng[0])
-
-
-class _ComfortBuilder:
-    """Stateful builder that traces the comfort-zone boundary."""
-
-    def __init__(self, range_x, p):
-        self.range_x = range_x
-        self.p = p
-        self.output = []
-        self.old_x = 0.0
-        self.old_y = 0.0
-        self.inrange = False
-
-    def init_point(self, x0, y0):
-        self.old_x, self.old_y = x0, y0
-        self.inrange = self.range_x[0] < x0 < self.range_x[1]
-
-    def handle_step(self, punkt_x, punkt_y, variable, func):
-        for boundary in (self.range_x[0], self.range_x[1]):
-            if _isin(boundary, (self.old_x, punkt_x)) or boundary == punkt_x:
-                ix, iy = func(variable, boundary, self.p)
-                self.output.append((ix, iy))
-                self.inrange = not self.inrange
-        if self.inrange:
-            self.output.append((punkt_x, punkt_y))
-        self.old_x, self.old_y = punkt_x, punkt_y
-
-
-def _phi_interp(phi, xv, p):
-    """Interpolation function for constant-phi boundary crossings."""
-    return get_x_y_tx(temperature(xv, y_phix(phi, xv, p)), xv, p)
-
+def _arange_inclusive(start, stop, step):
+    """Values from *start* toward *stop* (exclusive) with *step*, then *stop*.
 
-def _sweep_side(builder, values, phi_or_t, get_point, interp_func):
-    """Sweep one side of the comfort rectangle."""
-    for val in values:
-        px, py = get_point(val)
-        builder.handle_step(px, py, phi_or_t, interp_func)
+    Grid values within rounding distance of *stop* are dropped, so *stop* is
+    never duplicated.
+    """
+    n = max(int(np.ceil((stop - start) / step)), 0)
+    vals = start + step * np.arange(n)
+    tol = abs(step) * 1e-9
+    vals = vals[vals < stop - tol] if step > 0 else vals[vals > stop + tol]
+    return np.append(vals, stop)
 
 
-def create_comfort(range_t, range_phi, range_x, p):  # noqa: C901
-    """Create the comfort-zone polygon as a list of (x, y) tuples.
+def _clip_side(old_x, x, y, inrange, range_x, cross_y):
+    """Clip one side of the comfort boundary to the absolute-humidity range.
 
     Args:
-        range_t: (min, max) temperature [°C].
-        range_phi: (min, max) relative humidity [0–1].
-        range_x: (min, max) absolute humidity [kg/kg].
-        p: Pressure [Pa].
+        old_x: x-coordinate before the first point of the side.
+        x, y: Coordinates of the points along the side.
+        inrange: Whether the boundary is inside ``range_x`` before the side.
+        range_x: (min, max) absolute humidity.
+        cross_y: Function returning the y-coordinate of the side at given x.
 
     Returns:
-        List of (x, y) coordinate pairs forming a closed polygon.
+        Tuple of (x, y, inrange): the output points in boundary order and
+        the in-range state after the side.
     """
-    range_t = _sort_range(range_t)
-    range_phi = _sort_range(range_phi)
-    range_x = _sort_range(range_x)
-
+    prev_x = np.concatenate(([old_x], x[:-1]))
+    # crossings of both x boundaries per step, in the order min, max
+    bounds = np.asarray(range_x, dtype=float)
+    crossed = (((prev_x[:, None] < bounds) & (bounds < x[:, None]))
+               | ((x[:, None] < bounds) & (bounds < prev_x[:, None]))
+               | (bounds == x[:, None]))
+    # in-range state toggles at every crossing
+    toggles = np.cumsum(crossed.ravel()).reshape(crossed.shape)
+    keep_point = inrange ^ (toggles[:, -1] % 2 == 1)
+
+    cross_x = np.broadcast_to(bounds, crossed.shape)
+    out_x = np.column_stack((cross_x, x))[np.column_stack((crossed, keep_point))]
+    is_cross = np.column_stack((crossed, np.zeros_like(keep_point)))[np.column_stack((crossed, keep_point))]
+    out_y = np.column_stack((np.zeros_like(cross_x), y))[np.column_stack((crossed, keep_point))]
+    if is_cross.any():
+        out_y[is_cross] = cross_y(out_x[is_cross])
+    return out_x, out_y, bool(keep_point[-1]) if len(keep_point) else inrange
+
+
+@functools.lru_cache(maxsize=128)
+def _create_comfort_cached(range_t, range_phi, range_x, p):
+    """Comfort-zone polygon as a tuple of (x, y) tuples for sorted ranges."""
     if range_phi[1] == 0:
-        return [(0, range_t[0]), (0, range_t[1]), (0, range_t[0])]
+        return ((0, range_t[0]), (0, range_t[1]), (0, range_t[0]))
 
     dT = 0.1
     dPhi = 0.01
 
-    builder = _ComfortBuilder(range_x, p)
-    T = range_t[0]
-    Phi = range_phi[0]
-    x0, y0 = get_x_y(T, Phi, p)
-    builder.init_point(x0, y0)
+    def phi_side(phi):
+        return lambda xv: y_phix(phi, xv, p)
+
+    def t_side(t):
+        return lambda xv: _t_to_y(t, xv)
+
+    xs, ys = [], []
+    T, Phi = range_t[0], range_phi[0]
+    old_x, _ = get_x_y(T, Phi, p)
+    inrange = range_x[0] < old_x < range_x[1]
 
     # Side 1: T increases at Phi = rangePhi[0]
     if Phi != 0:
         t_vals = _arange_inclusive(T + dT, range_t[1], dT)
-        _sweep_side(builder, t_vals, Phi,
-                    lambda t: get_x_y(t, Phi, p), _phi_interp)
+        side = _clip_side(old_x, *get_x_y(t_vals, Phi, p), inrange, range_x, phi_side(Phi))
+        xs.append(side[0])
+        ys.append(side[1])
+        inrange = side[2]
+        old_x = get_x_y(t_vals[-1], Phi, p)[0]
         T = range_t[1]
     else:
         T = range_t[1]
         px, py = get_x_y(T, Phi, p)
-        builder.inrange = (range_x[0] == 0)
-        if builder.inrange:
-            builder.output.append((px, py))
-            builder.old_x, builder.old_y = px, py
-
-    # Side 2: Phi increases at T = rangeT[1]
-    phi_vals = _arange_inclusive(Phi + dPhi, range_phi[1], dPhi)
-    _sweep_side(builder, phi_vals, T,
-                lambda phi: get_x_y(T, phi, p), get_x_y_tx)
-    Phi = range_phi[1]
-
-    # Side 3: T decreases at Phi = rangePhi[1]
-    t_vals = _arange_inclusive(T - dT, range_t[0], -dT)
-    _sweep_side(builder, t_vals, Phi,
-                lambda t: get_x_y(t, Phi, p), _phi_interp)
-    T = range_t[0]
-
-    # Side 4: Phi decreases at T = rangeT[0]
-    phi_vals = _arange_inclusive(Phi - dPhi, range_phi[0], -dPhi)
-    _sweep_side(builder, phi_vals, T,
-                lambda phi: get_x_y(T, phi, p), get_x_y_tx)
-
-    if builder.output:
-        builder.output.append(builder.output[0])
+        inrange = range_x[0] == 0
+        if inrange:
+            xs.append(np.array([px]))
+            ys.append(np.array([py]))
+            old_x = px
+
+    # Sides 2-4: Phi up at T = rangeT[1], T down at Phi = rangePhi[1],
+    # Phi down at T = rangeT[0]
+    sides = (
+        (_arange_inclusive(Phi + dPhi, range_phi[1], dPhi), "phi", T),
+        (_arange_inclusive(T - dT, range_t[0], -dT), "t", range_phi[1]),
+        (_arange_inclusive(range_phi[1] - dPhi, range_phi[0], -dPhi), "phi", range_t[0]),
+    )
+    for values, variable, fixed in sides:
+        if variable == "phi":
+            px, py = get_x_y(fixed, values, p)
+            cross_y = t_side(fixed)
+        else:
+            px, py = get_x_y(values, fixed, p)
+            cross_y = phi_side(fixed)
+        side = _clip_side(old_x, px, py, inrange, range_x, cross_y)
+        xs.append(side[0])
+        ys.append(side[1])
+        inrange = side[2]
+        old_x = px[-1]
+
+    x = np.concatenate(xs)
+    y = np.concatenate(ys)
+    output = tuple(zip(x.tolist(), y.tolist()))
+    if output:
+        output += (output[0],)
+    return output
+
+
+def create_comfort(range_t, range_phi, range_x, p):
+    """Create the comfort-zone polygon as a list of (x, y) tuples.
 
-    return builder.output
+    The boundary of the (T, phi) rectangle is computed with array-native
+    solvers and clipped to the absolute-humidity range. Results are cached
+    for the last 128 distinct arguments.
 
+    Args:
+        range_t: (min, max) temperature [°C].
+        range_phi: (min, max) relative humidity [0–1].
+        range_x: (min, max) absolute humidity [kg/kg].
+        p: Pressure [Pa].
 
-def _arange_inclusive(start, stop, step):
-    """Generate values from *start* toward *stop* (inclusive) with *step*."""
-    vals = []
-    if step > 0:
-        v = start
-        while v < stop:
-            vals.append(v)
-            v += step
-        vals.append(stop)
-    else:
-        v = start
-        while v > stop:
-            vals.append(v)
-            v += step
-        vals.append(stop)
-    return vals
+    Returns:
+        List of (x, y) coordinate pairs forming a closed polygon.
+    """
+    key = (tuple(float(v) for v in _sort_range(range_t)),
+           tuple(float(v) for v in _sort_range(range_phi)),
+           tuple(float(v) for v in _sort_range(range_x)),
+           float(p))
+    return list(_create_comfort_cached(*key))
@@ -19,48 +19,237 @@ DEFAULT_COLORS = {
     "grid": "darkgrey",
 }
 
+# Binned KDE: grid steps per bandwidth, and cap on the binning grid size
+_KDE_STEPS_PER_BANDWIDTH = 8
+_KDE_MAX_BINS = 2 ** 18
+
+# Default number of points per trace of long time series plots
+DEFAULT_MAX_POINTS = 20000
+_DOWNSAMPLE_METHODS = ("minmax", "lttb")
+
+
+def silverman_bandwidth(values: np.ndarray, weights: Optional[np.ndarray] = None) -> float:
+    """
+    Silverman's rule-of-thumb bandwidth ``1.06 * std * n ** (-1/5)``.
+
+    With weights, the weighted standard deviation and the effective sample
+    size ``sum(w) ** 2 / sum(w ** 2)`` are used.
+    """
+    values = np.asarray(values, dtype=float)
+    if weights is None:
+        return float(1.06 * values.std() * values.size ** (-1 / 5))
+    weights = np.asarray(weights, dtype=float)
+    total = weights.sum()
+    mean = np.dot(weights, values) / total
+    std = np.sqrt(np.dot(weights, (values - mean) ** 2) / total)
+    n_eff = total ** 2 / np.dot(weights, weights)
+    return float(1.06 * std * n_eff ** (-1 / 5))
+
+
+def binned_kde(
+    values: np.ndarray,
+    grid: np.ndarray,
+    bandwidth: Optional[float] = None,
+    weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Gaussian kernel density estimate on an evenly spaced grid.
+
+    The samples are linearly binned onto a grid that refines *grid* to at
+    least ``_KDE_STEPS_PER_BANDWIDTH`` points per bandwidth, and the bin
+    counts are convolved with the Gaussian kernel by FFT. This costs
+    O(n + m log m) for n samples and m grid points instead of the O(n * m)
+    of summing one kernel per sample. Samples outside the grid are clipped
+    to its ends.
+
+    Args:
+        values: Sample values; NaNs are ignored.
+        grid: Evenly spaced, increasing evaluation points.
+        bandwidth: Kernel standard deviation. Default Silverman's rule,
+            see :func:`silverman_bandwidth`.
+        weights: Non-negative sample weights. Default 1 for every sample.
+
+    Returns:
+        np.ndarray: Density at the *grid* points, integrating to one. All NaN
+        when there are no samples or the bandwidth is not positive.
+    """
+    values = np.asarray(values, dtype=float)
+    grid = np.asarray(grid, dtype=float)
+    valid = ~np.isnan(values)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=float)
+        valid &= ~np.isnan(weights)
+        weights = weights[valid]
+    if not valid.all():
+        values = values[valid]
+    if bandwidth is None and values.size:
+        bandwidth = silverman_bandwidth(values, weights)
+    total = values.size if weights is None else weights.sum()
+    if not values.size or not total > 0 or not bandwidth or not bandwidth > 0:
+        return np.full(grid.size, np.nan)
+
+    # Refine the grid by an integer factor so that *grid* is a subset of it
+    step = (grid[-1] - grid[0]) / max(grid.size - 1, 1)
+    refine = int(np.clip(np.ceil(step * _KDE_STEPS_PER_BANDWIDTH / bandwidth),
+                         1, max(_KDE_MAX_BINS // max(grid.size - 1, 1), 1)))
+    step /= refine
+    m = (grid.size - 1) * refine + 1
+
+    # Linear binning: each sample splits its weight between its two nearest bins
+    pos = np.clip((values - grid[0]) / step, 0, m - 1) if step > 0 else np.zeros(values.size)
+    left = np.minimum(pos.astype(np.int64), max(m - 2, 0))
+    frac = pos - left
+    if weights is not None:
+        frac *= weights
+    counts = np.bincount(left, 1 - frac if weights is None else weights - frac, minlength=m)
+    counts[1:] += np.bincount(left, frac, minlength=m)[:m - 1]
+
+    # Convolve with the kernel over all bin offsets -(m-1)..(m-1)
+    offsets = np.arange(-(m - 1), m) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    n_fft = 1 << int(3 * m - 2).bit_length()
+    density = np.fft.irfft(np.fft.rfft(counts, n_fft) * np.fft.rfft(kernel, n_fft), n_fft)[m - 1:2 * m - 1]
+    return np.maximum(density[::refine], 0) / total
+
+
+def _numeric_x(x) -> np.ndarray:
+    """Float positions of *x*: epoch ns for datetimes, sample numbers for labels."""
+    if pd.api.types.is_datetime64_any_dtype(x):
+        i8 = pd.DatetimeIndex(x).asi8
+        return (i8 - i8[0]).astype(float)
+    if pd.api.types.is_numeric_dtype(np.asarray(x)):
+        return np.asarray(x, dtype=float)
+    return np.arange(len(x), dtype=float)
+
+
+def _bucket_starts(size: int, n_buckets: int) -> np.ndarray:
+    """Start positions of *n_buckets* equally sized buckets over ``1..size-2``."""
+    return 1 + (np.arange(n_buckets) * (size - 2)) // n_buckets
+
+
+def _minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """First, last, and the minimum and maximum of every bucket in between."""
+    starts = _bucket_starts(y.size, n_buckets)
+    positions = np.arange(y.size)
+    counts = np.diff(np.r_[starts, y.size - 1])
+    result = [[0, y.size - 1]]
+    for extreme in (np.minimum, np.maximum):
+        values = np.repeat(extreme.reduceat(y[:-1], starts), counts)
+        inner = positions[1:-1]
+        hits = np.where(y[1:-1] == values, inner, y.size)
+        result.append(np.minimum.reduceat(hits, starts - 1))
+    return np.concatenate(result)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: one point per bucket, the vertex of the
+    largest triangle with the previous selected point and the next bucket's mean."""
+    starts = _bucket_starts(y.size, n_buckets)
+    ends = np.r_[starts[1:], y.size - 1]
+    counts = ends - starts
+    mean_x = np.r_[np.add.reduceat(x[:-1], starts) / counts, x[-1]]
+    mean_y = np.r_[np.add.reduceat(y[:-1], starts) / counts, y[-1]]
+    selected = np.empty(n_buckets + 2, dtype=np.int64)
+    selected[0], selected[-1] = 0, y.size - 1
+    a = 0
+    for b in range(n_buckets):
+        s, e = starts[b], ends[b]
+        area = np.abs((x[a] - mean_x[b + 1]) * (y[s:e] - y[a]) - (x[a] - x[s:e]) * (mean_y[b + 1] - y[a]))
+        a = s + int(np.argmax(area))
+        selected[b + 1] = a
+    return selected
+
+
+def downsample_indices(x, y, max_points: Optional[int] = DEFAULT_MAX_POINTS, method: str = "minmax") -> np.ndarray:
+    """
+    Positions of the samples to draw of a long line trace.
+
+    "minmax" keeps the minimum and maximum of equally sized buckets, so every
+    peak stays visible. "lttb" (Largest-Triangle-Three-Buckets) keeps one
+    point per bucket chosen to preserve the visual shape. Both always keep
+    the first and last sample. When *y* has NaNs, the first NaN of every
+    gap is kept as well, so gaps still break the line; only when there are
+    more gaps than half of *max_points* the first NaN per bucket is kept.
+
+    Args:
+        x: Sample positions (datetimes or numbers), used by "lttb".
+        y: Sample values.
+        max_points: Upper bound of the returned positions. *None* keeps all.
+        method: "minmax" or "lttb". Default "minmax".
+
+    Returns:
+        np.ndarray: Increasing positions into *x* and *y*.
+    """
+    if method not in _DOWNSAMPLE_METHODS:
+        raise ValueError(f"method must be one of {list(_DOWNSAMPLE_METHODS)}, got '{method}'")
+    y = np.asarray(y, dtype=float)
+    if max_points is None or y.size <= max_points:
+        return np.arange(y.size)
+    if max_points < 8:
+        raise ValueError(f"max_points must be at least 8, got {max_points}")
+
+    nan = np.isnan(y)
+    # first NaN of every gap, a single one between two samples breaks the line
+    gaps = np.flatnonzero(nan & ~np.r_[False, nan[:-1]])
+    per_bucket = 2 if method == "minmax" else 1
+    reserved = 4 if gaps.size else 2  # first and last sample, and first and last valid one
+    if gaps.size <= (max_points - reserved) // 2:
+        n_buckets = max((max_points - reserved - gaps.size) // per_bucket, 1)
+    else:
+        # too many gaps to draw them all apart: keep the first one per bucket
+        n_buckets = max((max_points - reserved) // (per_bucket + 1), 1)
+        gaps = gaps[np.unique(gaps * n_buckets // y.size, return_index=True)[1]]
+
+    valid = np.flatnonzero(~nan)
+    selected = [valid, gaps, [0, y.size - 1]]
+    if valid.size > 2 + n_buckets * per_bucket:
+        if method == "minmax":
+            selected[0] = valid[_minmax_indices(y[valid], n_buckets)]
+        else:
+            selected[0] = valid[_lttb_indices(_numeric_x(x)[valid], y[valid], n_buckets)]
+    return np.unique(np.concatenate(selected))
+
 
 def prepare_hourly_seasonal_data(
-    data: pd.DataFrame,
+    data,
     confidence: float = 95.0,
     seasons: Optional[List[str]] = None,
+    compression: Optional[float] = None,
 ) -> pd.DataFrame:
     """
     Prepare hourly data grouped by season and weekday with median and quantile bands.
 
     Args:
-        data: DataFrame with columns ["timestamp", "value"].
+        data: DataFrame with columns ["timestamp", "value"], or a
+            :class:`~pyedautils.plots.ProfileCube` built from it.
         confidence: Confidence level for quantile bands (0-100).
         seasons: List of season names in display order.
+        compression: Estimate the quantiles from t-digests of this compression
+            (e.g. 100) instead of exactly; ignored for a cube.
 
     Returns:
         Aggregated DataFrame with columns: season, weekday, dayhour,
         valueMedian, valueUpper, valueLower.
     """
-    from pyedautils.data_prep.season import get_season
-
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["hour"] = df["timestamp"].dt.floor("h")
-
-    df_h = df.groupby("hour").agg({"value": "sum"}).reset_index()
-    df_h["weekday"] = df_h["hour"].dt.day_name()
-    df_h["dayhour"] = df_h["hour"].dt.hour
-    df_h["season"] = get_season(df_h["hour"])
-
-    # Rename internal English season names to custom labels
-    if seasons is not None:
-        rename_map = dict(zip(DEFAULT_SEASONS, seasons))
-        df_h["season"] = df_h["season"].map(rename_map).fillna(df_h["season"])
-
-    df_agg = df_h.groupby(["season", "weekday", "dayhour"]).agg(
-        valueMedian=("value", lambda x: x.quantile(0.5)),
-        valueUpper=("value", lambda x: x.quantile(confidence / 100)),
-        valueLower=("value", lambda x: x.quantile((100 - confidence) / 100)),
-    ).reset_index()
-
-    return df_agg
+    from pyedautils._profile_cube import ProfileCube
+
+    cube = data if isinstance(data, ProfileCube) else ProfileCube.from_data(data, k=None, compression=compression)
+    labels = list(seasons or []) + DEFAULT_SEASONS[len(seasons or []):]
+
+    median, upper, lower = cube.hourly_quantiles(
+        [0.5, confidence / 100, (100 - confidence) / 100]).reshape(3, -1)
+    season, weekday, dayhour = np.unravel_index(np.arange(median.size), (len(DEFAULT_SEASONS), 7, 24))
+    filled = np.diff(cube.hourly_offsets) > 0
+
+    df_agg = pd.DataFrame({
+        "season": np.asarray(labels, dtype=object)[season[filled]],
+        "weekday": np.asarray(DEFAULT_WEEKDAYS, dtype=object)[weekday[filled]],
+        "dayhour": dayhour[filled],
+        "valueMedian": median[filled],
+        "valueUpper": upper[filled],
+        "valueLower": lower[filled],
+    })
+    return df_agg.sort_values(["season", "weekday", "dayhour"], ignore_index=True)
 
 
 def create_seasonal_weekday_subplots(
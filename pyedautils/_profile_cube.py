@@ -0,0 +1,312 @@
+"""Precomputed daily-profile statistics shared by the profile plots."""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from pyedautils._plot_utils import DEFAULT_SEASONS
+
+N_SEASONS = len(DEFAULT_SEASONS)
+N_WEEKDAYS = 7
+N_HOURS = 24
+N_SLOTS = 24 * 60
+
+
+def _centroid_quantiles(means: np.ndarray, weights: Optional[np.ndarray], offsets: np.ndarray,
+                        q: Sequence[float]) -> np.ndarray:
+    """
+    Quantiles of sorted weighted segments ``means[offsets[i]:offsets[i + 1]]``.
+
+    Interpolates linearly between the centroid centres, so with unit weights
+    (``weights=None``) the result equals ``pd.Series.quantile``; NaN for empty
+    segments.
+    """
+    if weights is None:
+        weights = np.ones(means.size)
+    n = np.diff(offsets)
+    filled = n > 0
+    result = np.full((len(q), n.size), np.nan)
+    first, last = offsets[:-1][filled], offsets[1:][filled] - 1
+    # Centroid centres on the global cumulative weight axis
+    centers = np.cumsum(weights) - weights / 2
+    cell_start = centers[first] - weights[first] / 2
+    cell_weight = np.add.reduceat(weights, first) if first.size else first
+    for i, qi in enumerate(q):
+        # Rank within the cell, 0 at the first centre (as the numpy virtual index)
+        rank = qi * (cell_weight - 1)
+        hi = np.clip(np.searchsorted(centers, cell_start + rank + 0.5), first + 1, last)
+        lo = np.maximum(hi - 1, first)
+        span = centers[hi] - centers[lo]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frac = (rank - (centers[lo] - cell_start - 0.5)) / span
+            frac = np.clip(np.where(span > 0, frac, 0.0), 0.0, 1.0)
+        result[i, filled] = means[lo] + (means[hi] - means[lo]) * frac
+    return result
+
+
+def _compress(cell: np.ndarray, means: np.ndarray, weights: np.ndarray, n_cells: int,
+              compression: float):
+    """
+    Merges weighted values into t-digest centroids, per cell.
+
+    Sorts by (cell, value) and pools neighbours that fall into the same unit
+    interval of the t-digest scale function ``k(q) = δ / 2π · asin(2q − 1)``,
+    which keeps at most about δ / 2 centroids per cell, with the smallest ones
+    in the tails.
+
+    Returns:
+        tuple (means, weights, offsets): Centroids sorted by cell and mean,
+            and the start of each cell followed by the total length.
+    """
+    order = np.lexsort((means, cell))
+    cell, means, weights = cell[order], means[order], weights[order]
+    cell_weight = np.bincount(cell, weights=weights, minlength=n_cells)
+    cumulative = np.cumsum(weights)
+    cell_start = np.r_[0.0, np.cumsum(cell_weight)][:-1]
+    q = (cumulative - weights / 2 - cell_start[cell]) / cell_weight[cell]
+    bucket = np.floor(compression / (2 * np.pi) * np.arcsin(2 * q - 1))
+    new_group = np.r_[True, (cell[1:] != cell[:-1]) | (bucket[1:] != bucket[:-1])]
+    group = np.cumsum(new_group) - 1
+    group_weight = np.bincount(group, weights=weights)
+    group_mean = np.bincount(group, weights=weights * means) / group_weight
+    offsets = np.r_[0, np.cumsum(np.bincount(cell[new_group], minlength=n_cells))]
+    return group_mean, group_weight, offsets
+
+
+def _centered_rolling_mean(values: np.ndarray, k: int) -> np.ndarray:
+    """``pd.Series(values).rolling(k, center=True).mean()`` via cumulative sums;
+    NaN where the window is incomplete or contains NaN."""
+    n = values.size
+    csum = np.r_[0.0, np.cumsum(np.nan_to_num(values))]
+    cnan = np.r_[0, np.cumsum(np.isnan(values))]
+    lo = np.arange(n) - k // 2
+    hi = lo + k
+    full = (lo >= 0) & (hi <= n)
+    lo, hi = lo.clip(0, n), hi.clip(0, n)
+    with np.errstate(invalid="ignore"):
+        return np.where(full & (cnan[hi] == cnan[lo]), (csum[hi] - csum[lo]) / k, np.nan)
+
+
+def _dense_ids(keys: np.ndarray):
+    """Sorted unique *keys* and the index of each key into them."""
+    if keys.size and keys.max() - keys.min() <= 4 * keys.size:
+        offset = keys - keys.min()
+        present = np.bincount(offset) > 0
+        ids = np.cumsum(present) - 1
+        return np.flatnonzero(present) + keys.min(), ids[offset]
+    return np.unique(keys, return_inverse=True)
+
+
+class ProfileCube:
+    """
+    Daily-profile statistics of one time series, computed once.
+
+    Holds, per season (Spring, Summer, Fall, Winter), weekday (Monday = 0)
+    and minute of the day, the count, sum and sum of squares of the values;
+    per season, weekday and hour the sorted hourly sums for exact medians and
+    quantile bands; and the detrended values used by the ``"decomposed"``
+    daily profiles. ``plot_daily_profiles_overview``, ``plot_daily_profiles``
+    and ``plot_heatmap_median_weeks`` accept a cube instead of raw data, so
+    several views of the same meter parse and aggregate the data only once.
+    Build it with :meth:`from_data`.
+
+    With a *compression*, the hourly sums of each cell are kept as a t-digest
+    (weighted centroids) of at most about *compression* / 2 entries instead of
+    every value. Quantiles then have a bounded rank error, smallest in the
+    tails, and memory no longer grows with the length of the data. Cubes of
+    further years or of comparable meters are pooled with :meth:`merge`.
+
+    Args:
+        count: Number of valid values, shape (4, 7, 1440).
+        total: Sum of the values, shape (4, 7, 1440).
+        total_sq: Sum of the squared values, shape (4, 7, 1440).
+        hourly_values: Hourly sums (or centroid means) sorted by cell (season,
+            weekday, hour) and value.
+        hourly_offsets: Start of each of the 4·7·24 cells in *hourly_values*,
+            followed by the total length.
+        detrended_count: Number of detrended values per weekday and minute, shape (7, 1440).
+        detrended_total: Sum of the detrended values, shape (7, 1440).
+        k: Rolling window the values were detrended with, or *None*.
+        hourly_weights: Centroid weights of *hourly_values*; *None* for exact
+            values.
+        compression: t-digest compression of the hourly sums; *None* if exact.
+    """
+
+    def __init__(self, count, total, total_sq, hourly_values, hourly_offsets,
+                 detrended_count, detrended_total, k: Optional[int],
+                 hourly_weights=None, compression: Optional[float] = None):
+        self.count = count
+        self.total = total
+        self.total_sq = total_sq
+        self.hourly_values = hourly_values
+        self.hourly_offsets = hourly_offsets
+        self.detrended_count = detrended_count
+        self.detrended_total = detrended_total
+        self.k = k
+        self.hourly_weights = hourly_weights
+        self.compression = compression
+
+    @classmethod
+    def from_data(cls, data: pd.DataFrame, loc_time_zone: Optional[str] = None,
+                  k: Optional[int] = 672, compression: Optional[float] = None) -> "ProfileCube":
+        """
+        Builds the cube from raw data.
+
+        Args:
+            data: DataFrame with two columns: timestamp and value.
+            loc_time_zone: Timezone to localize naive timestamps in (e.g.
+                "Europe/Zurich"); non-existent times are shifted forward.
+                Tz-aware timestamps are used in their own wall-clock time.
+            k: Rolling window size for the trend of the ``"decomposed"``
+                profiles. Default 672 (7 days at 15-min resolution). *None*
+                skips the detrending.
+            compression: Keep the hourly sums as t-digests of this compression
+                (e.g. 100) instead of exactly. Default *None* (exact).
+
+        Returns:
+            ProfileCube: The statistics of *data*.
+        """
+        from pyedautils.data_prep.season import get_season
+
+        index = pd.DatetimeIndex(pd.to_datetime(data.iloc[:, 0]))
+        if index.tz is None and loc_time_zone is not None:
+            index = index.tz_localize(loc_time_zone, ambiguous=True, nonexistent="shift_forward")
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        values = data.iloc[:, 1].to_numpy(dtype=float)
+
+        minutes = index.to_numpy().astype("datetime64[m]").astype(np.int64)
+        hours, hour_idx = _dense_ids(minutes // 60)
+        hour_index = pd.Series(hours.astype("datetime64[h]").astype("datetime64[ns]"))
+        hour_season = pd.Series(get_season(hour_index)).map(
+            {name: i for i, name in enumerate(DEFAULT_SEASONS)}).to_numpy(dtype=np.int64)
+        hour_weekday = hour_index.dt.dayofweek.to_numpy()
+        hour_of_day = hour_index.dt.hour.to_numpy()
+
+        # Per-minute statistics of the valid values
+        weekday = hour_weekday[hour_idx]
+        slot = minutes % N_SLOTS
+        cell = (hour_season[hour_idx] * N_WEEKDAYS + weekday) * N_SLOTS + slot
+        valid = ~np.isnan(values)
+        size = N_SEASONS * N_WEEKDAYS * N_SLOTS
+        shape = (N_SEASONS, N_WEEKDAYS, N_SLOTS)
+        count = np.bincount(cell[valid], minlength=size).reshape(shape)
+        total = np.bincount(cell[valid], weights=values[valid], minlength=size).reshape(shape)
+        total_sq = np.bincount(cell[valid], weights=values[valid] ** 2, minlength=size).reshape(shape)
+
+        # Hourly sums (NaN counts as 0, like a pandas groupby sum), sorted per cell
+        hourly = np.bincount(hour_idx[valid], weights=values[valid], minlength=hours.size)
+        hour_cell = (hour_season * N_WEEKDAYS + hour_weekday) * N_HOURS + hour_of_day
+        n_cells = N_SEASONS * N_WEEKDAYS * N_HOURS
+        if compression is None:
+            order = np.lexsort((hourly, hour_cell))
+            hourly, weights = hourly[order], None
+            offsets = np.r_[0, np.cumsum(np.bincount(hour_cell, minlength=n_cells))]
+        else:
+            hourly, weights, offsets = _compress(hour_cell, hourly, np.ones(hourly.size), n_cells, compression)
+
+        # Values minus their centred rolling mean, in input order
+        detrended_count = detrended_total = None
+        if k is not None:
+            detrended = values - _centered_rolling_mean(values, k)
+            ok = ~np.isnan(detrended)
+            day_cell = weekday[ok] * N_SLOTS + slot[ok]
+            detrended_count = np.bincount(day_cell, minlength=N_WEEKDAYS * N_SLOTS).reshape(N_WEEKDAYS, N_SLOTS)
+            detrended_total = np.bincount(day_cell, weights=detrended[ok],
+                                          minlength=N_WEEKDAYS * N_SLOTS).reshape(N_WEEKDAYS, N_SLOTS)
+
+        return cls(count, total, total_sq, hourly, offsets,
+                   detrended_count, detrended_total, k, weights, compression)
+
+    def merge(self, other: "ProfileCube") -> "ProfileCube":
+        """
+        Pools the samples of two cubes, e.g. of consecutive years or of
+        comparable meters.
+
+        The result is exact if both cubes are; otherwise the hourly sums are
+        recompressed with the smaller compression of the two. Detrending does
+        not span the boundary between the two data sets.
+
+        Args:
+            other: Cube to merge with; must be detrended with the same *k*.
+
+        Returns:
+            ProfileCube: The combined statistics.
+        """
+        if self.k != other.k:
+            raise ValueError(f"Cannot merge cubes detrended with k={self.k} and k={other.k}")
+
+        n_cells = self.hourly_offsets.size - 1
+        cell = np.repeat(np.tile(np.arange(n_cells), 2),
+                         np.r_[np.diff(self.hourly_offsets), np.diff(other.hourly_offsets)])
+        means = np.r_[self.hourly_values, other.hourly_values]
+        compressions = [c for c in (self.compression, other.compression) if c is not None]
+        if compressions:
+            weights = np.r_[self._weights(), other._weights()]
+            compression = min(compressions)
+            means, weights, offsets = _compress(cell, means, weights, n_cells, compression)
+        else:
+            order = np.lexsort((means, cell))
+            means, weights, compression = means[order], None, None
+            offsets = np.r_[0, np.cumsum(np.bincount(cell, minlength=n_cells))]
+
+        detrended_count = detrended_total = None
+        if self.k is not None:
+            detrended_count = self.detrended_count + other.detrended_count
+            detrended_total = self.detrended_total + other.detrended_total
+
+        return ProfileCube(self.count + other.count, self.total + other.total,
+                           self.total_sq + other.total_sq, means, offsets,
+                           detrended_count, detrended_total, self.k, weights, compression)
+
+    def _weights(self) -> np.ndarray:
+        """Weights of the hourly values, ones if they are exact."""
+        if self.hourly_weights is None:
+            return np.ones(self.hourly_values.size)
+        return self.hourly_weights
+
+    def mean(self, by_season: bool = True) -> np.ndarray:
+        """
+        Mean value per minute of the day.
+
+        Args:
+            by_season: Keep the season axis. Default True.
+
+        Returns:
+            np.ndarray: Shape (4, 7, 1440), or (7, 1440) without seasons; NaN
+                where there is no data.
+        """
+        count, total = self.count, self.total
+        if not by_season:
+            count, total = count.sum(axis=0), total.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(count > 0, total / count, np.nan)
+
+    def std(self) -> np.ndarray:
+        """Sample standard deviation per season, weekday and minute, shape (4, 7, 1440)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.total / self.count
+            var = (self.total_sq - self.count * mean ** 2) / (self.count - 1)
+        return np.where(self.count > 1, np.sqrt(np.maximum(var, 0.0)), np.nan)
+
+    def detrended_mean(self) -> np.ndarray:
+        """Mean detrended value per weekday and minute, shape (7, 1440); NaN where empty."""
+        if self.k is None:
+            raise ValueError("The cube was built without detrending (k=None).")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.detrended_count > 0, self.detrended_total / self.detrended_count, np.nan)
+
+    def hourly_quantiles(self, q: Sequence[float]) -> np.ndarray:
+        """
+        Quantiles of the hourly sums per season, weekday and hour.
+
+        Args:
+            q: Quantiles in [0, 1].
+
+        Returns:
+            np.ndarray: Shape (len(q), 4, 7, 24); NaN for cells without data.
+                Exact unless the cube holds t-digests (see *compression*).
+        """
+        result = _centroid_quantiles(self.hourly_values, self.hourly_weights, self.hourly_offsets, q)
+        return result.reshape(len(q), N_SEASONS, N_WEEKDAYS, N_HOURS)
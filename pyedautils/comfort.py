@@ -0,0 +1,233 @@
+"""Comfort-zone membership and hours-in-zone statistics.
+
+The comfort zone is the region of the Mollier h,x-diagram bounded by a
+temperature range, a relative humidity range and an absolute humidity range,
+the same zone :func:`pyedautils._mollier.create_comfort` draws in
+:func:`pyedautils.plots.plot_mollier_hx`. Membership is checked analytically
+on these three constraints, which is exact and vectorised, so no per-point
+polygon geometry is needed.
+
+Units:
+    t — temperature [°C]
+    phi — relative humidity [0–1]
+    x — absolute humidity [kg/kg dry air]
+    p — total pressure [Pa]
+"""
+
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pyedautils import _mollier
+from pyedautils.data_prep.season import _SEASON_CODE_BY_MONTH, _SEASON_ORDER
+from pyedautils.psychro import DEFAULT_PRESSURE
+
+DEFAULT_COMFORT_ZONE = {
+    "temperature": (20, 26),
+    "rel_humidity": (0.30, 0.65),
+    "abs_humidity": (0, 0.0115),
+}
+
+SEASON_LABELS = _SEASON_ORDER
+_GROUPS = ("season", "month", "room")
+
+
+def _zone_ranges(comfort_zone: Optional[Dict[str, Tuple[float, float]]]):
+    """Sorted (min, max) ranges of temperature, rel. humidity and abs. humidity."""
+    cz = {**DEFAULT_COMFORT_ZONE, **(comfort_zone or {})}
+    return tuple(tuple(sorted(float(v) for v in cz[key]))
+                 for key in ("temperature", "rel_humidity", "abs_humidity"))
+
+
+def _excess(values, lo: float, hi: float):
+    """Signed distance of *values* outside [lo, hi]; zero inside."""
+    return np.where(values < lo, values - lo, np.where(values > hi, values - hi, 0 * values))
+
+
+def _abs_humidity(t, phi, p):
+    return phi * _mollier.K / (p / _mollier.p_sat(t) - phi)
+
+
+def in_comfort_zone(t, phi, comfort_zone: Optional[Dict[str, Tuple[float, float]]] = None,
+                    p=DEFAULT_PRESSURE, dtype=np.float64):
+    """
+    Returns whether air states lie inside the comfort zone.
+
+    Args:
+        t: Temperature [°C].
+        phi: Relative humidity [0–1].
+        comfort_zone: Dict with keys "temperature", "rel_humidity", "abs_humidity",
+            each a (min, max) tuple. Missing keys use :data:`DEFAULT_COMFORT_ZONE`.
+        p: Total pressure [Pa]. Default 101325.
+        dtype: Floating dtype of the computation. Default float64.
+
+    Returns:
+        Boolean array, or bool for scalar input. NaN samples are outside.
+    """
+    range_t, range_phi, range_x = _zone_ranges(comfort_zone)
+    t, phi, p = (np.asarray(v, dtype=dtype) for v in (t, phi, p))
+    x = _abs_humidity(t, phi, p)
+    inside = ((t >= range_t[0]) & (t <= range_t[1])
+              & (phi >= range_phi[0]) & (phi <= range_phi[1])
+              & (x >= range_x[0]) & (x <= range_x[1]))
+    return bool(inside) if inside.ndim == 0 else inside
+
+
+def comfort_distance(t, phi, comfort_zone: Optional[Dict[str, Tuple[float, float]]] = None,
+                     p=DEFAULT_PRESSURE, dtype=np.float64) -> Tuple:
+    """
+    Returns how far air states lie outside the comfort zone.
+
+    Each component is the signed distance beyond the violated bound: negative
+    below the minimum (too cold, too dry), positive above the maximum, zero
+    within the range.
+
+    Args:
+        t: Temperature [°C].
+        phi: Relative humidity [0–1].
+        comfort_zone: Dict with keys "temperature", "rel_humidity", "abs_humidity",
+            each a (min, max) tuple. Missing keys use :data:`DEFAULT_COMFORT_ZONE`.
+        p: Total pressure [Pa]. Default 101325.
+        dtype: Floating dtype of the computation and result. Default float64.
+
+    Returns:
+        tuple (dt, dphi, dx): Distances in temperature [K], relative humidity
+            [0–1] and absolute humidity [kg/kg].
+    """
+    range_t, range_phi, range_x = _zone_ranges(comfort_zone)
+    t, phi, p = (np.asarray(v, dtype=dtype) for v in (t, phi, p))
+    x = _abs_humidity(t, phi, p)
+    return tuple(_mollier._scalar_or_array(_excess(v, *r))
+                 for v, r in ((t, range_t), (phi, range_phi), (x, range_x)))
+
+
+def _sample_hours(timestamps: np.ndarray, rooms: Optional[np.ndarray]) -> np.ndarray:
+    """Duration [h] of every sample: the median sampling interval of its room."""
+    hours = timestamps.astype("datetime64[s]").astype(np.int64) / 3600.0
+    codes = np.zeros(hours.size, dtype=np.int64) if rooms is None else pd.factorize(rooms)[0]
+    order = np.lexsort((hours, codes))
+    steps = np.diff(hours[order])
+    room_of_step = codes[order][1:]
+    valid = (room_of_step == codes[order][:-1]) & (steps > 0)
+    n_rooms = codes.max() + 1 if codes.size else 0
+    medians = np.zeros(n_rooms)
+    if valid.any():
+        frame = pd.DataFrame({"room": room_of_step[valid], "step": steps[valid]})
+        median = frame.groupby("room")["step"].median()
+        medians[median.index.to_numpy()] = median.to_numpy()
+    return medians[codes]
+
+
+def _check_statistics_args(data: pd.DataFrame, by: Sequence[str], room: Optional[str],
+                           timestamp: Optional[str]) -> None:
+    """Raises ValueError for unknown grouping keys or missing room and time columns."""
+    unknown = [key for key in by if key not in _GROUPS]
+    if unknown:
+        raise ValueError(f"Unknown grouping keys {unknown}, use {list(_GROUPS)}.")
+    if "room" in by and room is None:
+        raise ValueError("Grouping by 'room' requires the room column.")
+    if timestamp is None and not isinstance(data.index, pd.DatetimeIndex):
+        raise ValueError("data needs a DatetimeIndex, or pass the timestamp column.")
+
+
+def comfort_statistics(
+    data: pd.DataFrame,
+    temperature: str = "temperature",
+    humidity: str = "humidity",
+    by: Sequence[str] = ("season",),
+    room: Optional[str] = None,
+    timestamp: Optional[str] = None,
+    comfort_zone: Optional[Dict[str, Tuple[float, float]]] = None,
+    pressure: Union[str, float] = DEFAULT_PRESSURE,
+    interval: Optional[Union[str, pd.Timedelta]] = None,
+) -> pd.DataFrame:
+    """
+    Counts samples and hours inside the comfort zone.
+
+    Seasons are meteorological (Winter = Dec–Feb). Samples with missing
+    temperature or humidity are ignored. Every sample counts for *interval*
+    hours, by default the median sampling interval of the data.
+
+    Args:
+        data (pd.DataFrame): Sensor data.
+        temperature (str, optional): Temperature column [°C]. Default "temperature".
+        humidity (str, optional): Relative humidity column [%rH]. Default "humidity".
+        by (sequence of str, optional): Grouping keys out of "season", "month"
+            and "room". An empty sequence gives one total row. Default ("season",).
+        room (str, optional): Room column, required for grouping by "room".
+        timestamp (str, optional): Timestamp column. *None* uses the index, which
+            must then be a DatetimeIndex.
+        comfort_zone: Dict with keys "temperature", "rel_humidity", "abs_humidity",
+            each a (min, max) tuple. Missing keys use :data:`DEFAULT_COMFORT_ZONE`.
+        pressure (str or float, optional): Pressure column name or constant
+            pressure [Pa]. Default 101325.
+        interval (str or pd.Timedelta, optional): Duration of one sample.
+            Default the median sampling interval, per room when *room* is given.
+
+    Returns:
+        pd.DataFrame: One row per group with the columns ``samples``, ``inside``,
+            ``share`` (inside / samples), ``hours``, ``hours_inside``,
+            ``too_cold``, ``too_warm``, ``too_dry`` and ``too_humid`` (sample counts
+            violating the temperature and humidity bounds; humidity counts
+            combine the relative and absolute humidity bounds), and the
+            distance to the zone as in :func:`comfort_distance`, unsigned:
+            ``dt_mean``, ``dt_max`` [K], ``dphi_mean``, ``dphi_max`` [0–1],
+            ``dx_mean`` and ``dx_max`` [kg/kg] (means over all samples,
+            zero inside the zone).
+    """
+    by = list(by)
+    _check_statistics_args(data, by, room, timestamp)
+
+    t = data[temperature].to_numpy(dtype=float)
+    phi = data[humidity].to_numpy(dtype=float) / 100.0
+    p = data[pressure].to_numpy(dtype=float) if isinstance(pressure, str) else pressure
+    valid = ~(np.isnan(t) | np.isnan(phi))
+    times = pd.DatetimeIndex(data.index if timestamp is None else data[timestamp])
+    rooms = data[room].to_numpy() if room is not None else None
+
+    dt, dphi, dx = (np.atleast_1d(v) for v in comfort_distance(t, phi, comfort_zone, p))
+    if interval is None:
+        hours = _sample_hours(times.to_numpy()[valid], rooms[valid] if rooms is not None else None)
+    else:
+        hours = pd.Timedelta(interval) / pd.Timedelta(hours=1)
+    frame = pd.DataFrame({
+        "inside": valid & (dt == 0) & (dphi == 0) & (dx == 0),
+        "too_cold": dt < 0,
+        "too_warm": dt > 0,
+        "too_dry": (dphi < 0) | (dx < 0),
+        "too_humid": (dphi > 0) | (dx > 0),
+        "dt": np.abs(dt),
+        "dphi": np.abs(dphi),
+        "dx": np.abs(dx),
+    })
+    months = times.month.to_numpy()
+    if "season" in by:
+        frame["season"] = pd.Categorical.from_codes(_SEASON_CODE_BY_MONTH[months - 1],
+                                                    categories=list(SEASON_LABELS))
+    if "month" in by:
+        frame["month"] = months
+    if "room" in by:
+        frame["room"] = rooms
+    frame = frame[valid]
+    frame["hours"] = hours
+    frame["hours_inside"] = frame["hours"] * frame["inside"]
+
+    counts = ["inside", "too_cold", "too_warm", "too_dry", "too_humid"]
+    distances = ["dt", "dphi", "dx"]
+    if by:
+        grouped = frame.groupby(by, observed=True, sort=True)
+    else:
+        # one total row, also without samples
+        grouped = frame.groupby(pd.Categorical(np.zeros(len(frame), dtype=int), categories=[0]), observed=False)
+    result = grouped[counts].sum().astype(np.int64)
+    result.insert(0, "samples", grouped.size().astype(np.int64))
+    result.insert(2, "share", result["inside"] / result["samples"])
+    result.insert(3, "hours", grouped["hours"].sum())
+    result.insert(4, "hours_inside", grouped["hours_inside"].sum())
+    for column in distances:
+        result[f"{column}_mean"] = grouped[column].mean()
+        result[f"{column}_max"] = grouped[column].max()
+    if not by:
+        result = result.reset_index(drop=True)
+    return result
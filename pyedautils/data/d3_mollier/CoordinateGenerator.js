@@ -11,7 +11,11 @@
 // [domainY] = °C
 // [p] = Pa = N/m^2
 
-function drawHXCoordinates(container,Width,Height,margin,domainX,domainY,p) {
+// The optional parameter 'isolines' holds precomputed lines, one entry per
+// coordinate ("t", "rho", "phi", "h") with the tick 'values' and the 'lines'
+// as arrays of {x, y} points. Coordinates given there are not recomputed.
+
+function drawHXCoordinates(container,Width,Height,margin,domainX,domainY,p,isolines) {
 
     // Color definition
     let colors = { t: "#63c1ff", rho: "#888888", phi: "#555555", h: "#CCCCCC",};
@@ -167,17 +171,23 @@ function drawHXCoordinates(container,Width,Height,margin,domainX,domainY,p) {
     }
     let domainT = d3.extent(edgevalues);
     let dimT = domainT[1]-domainT[0];
-    coordinateAxis.domain(domainT);
-    coordinatevalues = coordinateAxis.ticks(40);
-
-    coordilines = [];
-    dx = dimX/numpoints;
-    for(i=0;i<coordinatevalues.length;i++) {
-        coordilines.push([]);
-        let x = domainX[0];
-        while(x < domainX[1]+dx) {
-            coordilines[i].push(get_x_y_tx(coordinatevalues[i],x,p));
-            x += dx;
+
+    if(isolines) {
+        coordinatevalues = isolines.t.values;
+        coordilines = isolines.t.lines;
+    } else {
+        coordinateAxis.domain(domainT);
+        coordinatevalues = coordinateAxis.ticks(40);
+
+        coordilines = [];
+        dx = dimX/numpoints;
+        for(i=0;i<coordinatevalues.length;i++) {
+            coordilines.push([]);
+            let x = domainX[0];
+            while(x < domainX[1]+dx) {
+                coordilines[i].push(get_x_y_tx(coordinatevalues[i],x,p));
+                x += dx;
+            }
         }
     }
 
@@ -199,21 +209,26 @@ function drawHXCoordinates(container,Width,Height,margin,domainX,domainY,p) {
 
     //++++++++++++++++++++ density ++++++++++++++++++++
 
-    edgevalues = [];
-    for(i=0;i<4;i++) {
-        edgevalues.push(density(testpoints[i].x,testpoints[i].y,p));
-    }
-    coordinateAxis.domain(d3.extent(edgevalues));
-    coordinatevalues = coordinateAxis.ticks(8);
-
-    coordilines = [];
-    dx = dimX/numpoints;
-    for(i=0;i<coordinatevalues.length;i++) {
-        coordilines.push([]);
-        let x = domainX[0];
-        while(x < domainX[1]+dx) {
-            coordilines[i].push({x: x,y: y_rhox(coordinatevalues[i],x,p),});
-            x += dx;
+    if(isolines) {
+        coordinatevalues = isolines.rho.values;
+        coordilines = isolines.rho.lines;
+    } else {
+        edgevalues = [];
+        for(i=0;i<4;i++) {
+            edgevalues.push(density(testpoints[i].x,testpoints[i].y,p));
+        }
+        coordinateAxis.domain(d3.extent(edgevalues));
+        coordinatevalues = coordinateAxis.ticks(8);
+
+        coordilines = [];
+        dx = dimX/numpoints;
+        for(i=0;i<coordinatevalues.length;i++) {
+            coordilines.push([]);
+            let x = domainX[0];
+            while(x < domainX[1]+dx) {
+                coordilines[i].push({x: x,y: y_rhox(coordinatevalues[i],x,p),});
+                x += dx;
+            }
         }
     }
     
@@ -232,29 +247,34 @@ function drawHXCoordinates(container,Width,Height,margin,domainX,domainY,p) {
 
     //++++++++++++++++++++ relative humidity (phi) ++++
 
-    edgevalues = [];
-    for(i=0;i<4;i++) {
-        edgevalues.push(rel_humidity(testpoints[i].x,testpoints[i].y,p));
-    }
-    let domainPhi = d3.extent(edgevalues);
-    if(edgevalues[1] < 1 && rel_humidity(domainX[0]+dimX*0.99,domainY[0],p) > edgevalues[1]) {
-        domainPhi[1] = 1;
+    if(isolines) {
+        coordinatevalues = isolines.phi.values;
+        coordilines = isolines.phi.lines;
     } else {
-        domainPhi[1] = Math.min(domainPhi[1],1);
-    }
-    coordinateAxis.domain(domainPhi);
-    coordinatevalues = coordinateAxis.ticks(10);
-
-    coordilines = [];
-    dt = dimT/numpoints;
-    for(i=0;i<coordinatevalues.length;i++) {
-        coordilines.push([]);
-        let t = domainT[0];
-        let x = domainX[0];
-        while(t < domainT[1]+dt && x <= domainX[1]) {
-            let I = coordilines[i].push(get_x_y(t,coordinatevalues[i],p));
-            x = coordilines[i][I-1].x;
-            t += dt;
+        edgevalues = [];
+        for(i=0;i<4;i++) {
+            edgevalues.push(rel_humidity(testpoints[i].x,testpoints[i].y,p));
+        }
+        let domainPhi = d3.extent(edgevalues);
+        if(edgevalues[1] < 1 && rel_humidity(domainX[0]+dimX*0.99,domainY[0],p) > edgevalues[1]) {
+            domainPhi[1] = 1;
+        } else {
+            domainPhi[1] = Math.min(domainPhi[1],1);
+        }
+        coordinateAxis.domain(domainPhi);
+        coordinatevalues = coordinateAxis.ticks(10);
+
+        coordilines = [];
+        dt = dimT/numpoints;
+        for(i=0;i<coordinatevalues.length;i++) {
+            coordilines.push([]);
+            let t = domainT[0];
+            let x = domainX[0];
+            while(t < domainT[1]+dt && x <= domainX[1]) {
+                let I = coordilines[i].push(get_x_y(t,coordinatevalues[i],p));
+                x = coordilines[i][I-1].x;
+                t += dt;
+            }
         }
     }
 
@@ -290,19 +310,24 @@ function drawHXCoordinates(container,Width,Height,margin,domainX,domainY,p) {
 
     //++++++++++++++++++++ enthalpy +++++++++++++++++++
 
-    edgevalues = [];
-    for(i=0;i<4;i++) {
-        edgevalues.push(enthalpy(testpoints[i].x,testpoints[i].y));
-    }
-    coordinateAxis.domain(d3.extent(edgevalues));
-    coordinatevalues = coordinateAxis.ticks(20);
-
-    coordilines = [];
-    dt = dimT/numpoints;
-    for(i=0;i<coordinatevalues.length;i++) {
-        coordilines.push([]);
-        coordilines[i].push({x: domainX[0],y: y_hx(coordinatevalues[i],domainX[0]),});
-        coordilines[i].push({x: x_hy(coordinatevalues[i],domainY[0]),y: domainY[0],});
+    if(isolines) {
+        coordinatevalues = isolines.h.values;
+        coordilines = isolines.h.lines;
+    } else {
+        edgevalues = [];
+        for(i=0;i<4;i++) {
+            edgevalues.push(enthalpy(testpoints[i].x,testpoints[i].y));
+        }
+        coordinateAxis.domain(d3.extent(edgevalues));
+        coordinatevalues = coordinateAxis.ticks(20);
+
+        coordilines = [];
+        dt = dimT/numpoints;
+        for(i=0;i<coordinatevalues.length;i++) {
+            coordilines.push([]);
+            coordilines[i].push({x: domainX[0],y: y_hx(coordinatevalues[i],domainX[0]),});
+            coordilines[i].push({x: x_hy(coordinatevalues[i],domainY[0]),y: domainY[0],});
+        }
     }
 
     let enthalpylines = canvas.append("g").attr("id","enthalpy");
@@ -0,0 +1,173 @@
+"""Timestamp normalization and integer time keys shared by analyses and plots."""
+
+import weakref
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Units of time_codes: numpy datetime64 unit, and offset in days for weeks
+_TIME_CODE_UNITS = {"minute": "m", "hour": "h", "day": "D", "week": "D", "month": "M"}
+# 1970-01-01 was a Thursday; shift so weeks start on Monday
+_WEEK_OFFSET_DAYS = 3
+_CALENDAR_FIELDS = ("year", "month", "day", "hour", "minute", "dayofweek")
+
+# Fields derived from parsed timestamp columns, by id of the datetime64 buffer
+# owning them: (weak reference to the buffer, {view key: (sample, fields)})
+_timestamp_fields: Dict[int, Tuple[weakref.ref, dict]] = {}
+_TIMESTAMP_SAMPLES = 64
+
+
+def normalize_timeseries(data: pd.DataFrame, columns: Sequence[str], sort: bool = False) -> pd.DataFrame:
+    """
+    Names the columns of *data* and parses its first column as timestamps.
+
+    Returns a shallow copy that shares the values with *data*; assign whole
+    columns to it rather than writing into them. Timestamps that are
+    datetime64 already are not parsed again.
+
+    Args:
+        data: Input data, timestamps in the first column.
+        columns: New column names.
+        sort: Sort the rows by timestamp (skipped when sorted already) and
+            reset the index. Default False.
+
+    Returns:
+        pd.DataFrame: The renamed data.
+    """
+    df = data.copy(deep=False)
+    df.columns = list(columns)
+    timestamps = df[columns[0]]
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        df[columns[0]] = pd.to_datetime(timestamps)
+    if sort:
+        index, fields = _timestamp_index(df[columns[0]])
+        if "sorted" not in fields:
+            fields["sorted"] = index.is_monotonic_increasing
+        if not fields["sorted"]:
+            df = df.sort_values(columns[0])
+        df = df.reset_index(drop=True)
+    return df
+
+
+def _timestamp_index(timestamps) -> Tuple[pd.DatetimeIndex, dict]:
+    """
+    DatetimeIndex of *timestamps* with a dict for fields derived from it.
+
+    The dict lives as long as the datetime64 buffer of *timestamps* and is
+    shared by every Series over it, so plots of the same data reuse the
+    derived fields and nothing is kept once the data is freed. It is only
+    reused while a sample of the timestamps (every value of short columns)
+    still matches the one it was built from, so fields follow edits in place.
+    """
+    index = pd.DatetimeIndex(timestamps)
+    if not pd.api.types.is_datetime64_any_dtype(timestamps) or index.size == 0:
+        return index, {}
+    i8 = index.asi8
+    owner = i8
+    while isinstance(owner.base, np.ndarray):
+        owner = owner.base
+    entry = _timestamp_fields.get(id(owner))
+    if entry is None or entry[0]() is not owner:
+        entry = _timestamp_fields[id(owner)] = (weakref.ref(owner, _drop_timestamp_fields(id(owner))), {})
+    offset = i8.__array_interface__["data"][0] - owner.__array_interface__["data"][0]
+    key = (offset, i8.shape, i8.strides, str(index.dtype))
+    sample = np.append(i8[::max(i8.size // _TIMESTAMP_SAMPLES, 1)], i8[-1])
+    cached = entry[1].get(key)
+    if cached is None or not np.array_equal(cached[0], sample):
+        cached = entry[1][key] = (sample, {})
+    return index, cached[1]
+
+
+def _drop_timestamp_fields(owner_id: int):
+    """Callback of the weak reference to a timestamp buffer, drops its fields."""
+    def drop(ref):
+        if _timestamp_fields.get(owner_id, (None,))[0] is ref:
+            del _timestamp_fields[owner_id]
+    return drop
+
+
+def _cached_field(timestamps, name: str, compute) -> np.ndarray:
+    """Field *name* of *timestamps*, computed by ``compute(wall_index)`` once per buffer."""
+    index, fields = _timestamp_index(timestamps)
+    if name not in fields:
+        wall = index.tz_localize(None) if index.tz is not None else index
+        values = compute(wall)
+        values.flags.writeable = False
+        fields[name] = values
+    return fields[name]
+
+
+def calendar_field(timestamps, field: str) -> pd.Series:
+    """
+    Calendar field of timestamps in wall-clock time, cached per data buffer.
+
+    Equivalent to ``timestamps.dt.<field>``, but computed once for all plots
+    of the same data.
+
+    Args:
+        timestamps: Datetime-like Series or array.
+        field: "year", "month", "day", "hour", "minute" or "dayofweek".
+
+    Returns:
+        pd.Series: Field values aligned with *timestamps*.
+    """
+    if field not in _CALENDAR_FIELDS:
+        raise ValueError(f"field must be one of {list(_CALENDAR_FIELDS)}, got '{field}'")
+    values = _cached_field(timestamps, field, lambda wall: getattr(wall, field).to_numpy())
+    return pd.Series(values, index=getattr(timestamps, "index", None), copy=False)
+
+
+def _time_code_values(wall: pd.DatetimeIndex, unit: str) -> np.ndarray:
+    """int64 codes of *wall* timestamps (undefined for NaT)."""
+    codes = wall.to_numpy().astype(f"datetime64[{_TIME_CODE_UNITS[unit]}]").view(np.int64)
+    if unit == "week":
+        codes = (codes + _WEEK_OFFSET_DAYS) // 7
+    return codes
+
+
+def time_codes(timestamps, unit: str = "day") -> pd.Series:
+    """
+    Integer group keys of timestamps, in wall-clock time.
+
+    Codes count whole units since 1970-01-01 (weeks start on Monday, months
+    are calendar months), so they sort chronologically and replace
+    ``dt.date`` / ``dt.floor`` keys without creating one Python object per
+    row. Tz-aware timestamps are keyed in their own local time, like
+    ``dt.date``.
+
+    Args:
+        timestamps: Datetime-like Series or array.
+        unit: "minute", "hour", "day", "week" or "month". Default "day".
+
+    Returns:
+        pd.Series: int64 codes aligned with *timestamps*; nullable Int64 with
+            <NA> for NaT, which group-bys drop like NaT.
+    """
+    if unit not in _TIME_CODE_UNITS:
+        raise ValueError(f"unit must be one of {list(_TIME_CODE_UNITS)}, got '{unit}'")
+    codes = _cached_field(timestamps, f"code_{unit}", lambda wall: _time_code_values(wall, unit))
+    nat = _cached_field(timestamps, "nat", lambda wall: np.isnat(wall.to_numpy()))
+    result = pd.Series(codes, index=getattr(timestamps, "index", None), copy=False)
+    if nat.any():
+        result = result.astype("Int64").mask(nat)
+    return result
+
+
+def time_code_starts(codes, unit: str = "day") -> pd.DatetimeIndex:
+    """
+    Start timestamps of :func:`time_codes` periods.
+
+    Args:
+        codes: Integer codes.
+        unit: Unit the codes were made with. Default "day".
+
+    Returns:
+        pd.DatetimeIndex: Naive start of each period.
+    """
+    if unit not in _TIME_CODE_UNITS:
+        raise ValueError(f"unit must be one of {list(_TIME_CODE_UNITS)}, got '{unit}'")
+    codes = np.asarray(codes, dtype=np.int64)
+    if unit == "week":
+        codes = codes * 7 - _WEEK_OFFSET_DAYS
+    return pd.DatetimeIndex(codes.astype(f"datetime64[{_TIME_CODE_UNITS[unit]}]").astype("datetime64[ns]"))
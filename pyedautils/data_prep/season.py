@@ -3,6 +3,7 @@
 from datetime import datetime
 import ephem
 from typing import List
+import numpy as np
 import pandas as pd
 
 TYPE_ASTRONOMICAL = "astronomical"
@@ -22,6 +23,40 @@ HEMISPHERE_SEASON_SWAP = {
     STATE_WINTER: STATE_SUMMER
 }
 
+# Meteorological season code (index into _SEASON_ORDER) for each month, January first
+_SEASON_ORDER = ("Winter", "Spring", "Summer", "Fall")
+_SEASON_CODE_BY_MONTH = np.array((0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0), dtype=np.uint8)
+
+
+def _season_starts(year: int, tracking_type: str):
+    """Start of spring, summer, autumn and winter of *year* as naive datetimes."""
+    if tracking_type == TYPE_ASTRONOMICAL:
+        spring_start = ephem.next_equinox(str(year)).datetime().replace(tzinfo=None)
+        summer_start = ephem.next_solstice(str(year)).datetime().replace(tzinfo=None)
+        autumn_start = ephem.next_equinox(spring_start).datetime().replace(tzinfo=None)
+        winter_start = ephem.next_solstice(summer_start).datetime().replace(tzinfo=None)
+    else:
+        spring_start = datetime(year, 3, 1)
+        summer_start = datetime(year, 6, 1)
+        autumn_start = datetime(year, 9, 1)
+        winter_start = datetime(year, 12, 1)
+    return spring_start, summer_start, autumn_start, winter_start
+
+
+def _get_season_series(date: pd.Series, hemisphere: str, labels: List[str], tracking_type: str) -> pd.Series:
+    """Vectorised get_season for a Series of naive datetimes without NaT."""
+    values = date.to_numpy(dtype="datetime64[ns]")
+    years, year_idx = np.unique(date.dt.year.to_numpy(), return_inverse=True)
+    starts = np.array([_season_starts(int(y), tracking_type) for y in years], dtype="datetime64[ns]")
+    starts = starts[year_idx]
+
+    codes = np.full(len(values), STATE_WINTER)
+    for state in (STATE_SPRING, STATE_SUMMER, STATE_FALL):
+        codes[(values >= starts[:, state]) & (values < starts[:, state + 1])] = state
+    if hemisphere == SOUTHERN:
+        codes = np.array([HEMISPHERE_SEASON_SWAP[s] for s in range(4)])[codes]
+    return pd.Series(np.asarray(labels, dtype=object)[codes], index=date.index, name=date.name)
+
 
 def get_season(
     date,
@@ -43,18 +78,12 @@ def get_season(
         A string with season name or a pandas series with strings, depending on the input
     """
     if isinstance(date, pd.Series):
+        # Season starts are computed once per year for naive datetime Series
+        if pd.api.types.is_datetime64_dtype(date.dtype) and not date.hasnans:
+            return _get_season_series(date, hemisphere, labels, tracking_type)
         return date.apply(lambda x: get_season(x, hemisphere, labels, tracking_type))
 
-    if tracking_type == TYPE_ASTRONOMICAL:
-        spring_start = ephem.next_equinox(str(date.year)).datetime().replace(tzinfo=None)
-        summer_start = ephem.next_solstice(str(date.year)).datetime().replace(tzinfo=None)
-        autumn_start = ephem.next_equinox(spring_start).datetime().replace(tzinfo=None)
-        winter_start = ephem.next_solstice(summer_start).datetime().replace(tzinfo=None)
-    else:
-        spring_start = datetime(date.year, 3, 1)
-        summer_start = datetime(date.year, 6, 1)
-        autumn_start = datetime(date.year, 9, 1)
-        winter_start = datetime(date.year, 12, 1)
+    spring_start, summer_start, autumn_start, winter_start = _season_starts(date.year, tracking_type)
 
     if spring_start <= date < summer_start:
         season = STATE_SPRING
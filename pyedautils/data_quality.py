@@ -1,10 +1,13 @@
 """Functions for detecting and visualizing gaps in time series data."""
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+from pyedautils._plot_utils import DEFAULT_MAX_POINTS, downsample_indices
+
 
 def calc_gap_duration(
     df: pd.DataFrame,
@@ -108,6 +111,51 @@ def calc_isna_percentage(
     return round(pct, decimals)
 
 
+def calc_na_runs(
+    df: pd.DataFrame,
+    column: Optional[str] = None,
+    merge_within: Optional[Union[str, pd.Timedelta]] = None,
+) -> pd.DataFrame:
+    """
+    Find the runs of consecutive NaN values in a column.
+
+    Runs are found by vectorised run-length encoding of the NaN mask. A run
+    lasts from its first to its last NaN sample.
+
+    Args:
+        df: DataFrame with a DatetimeIndex.
+        column: Column to check. If *None*, uses the first column.
+        merge_within: Merge runs whose last and next first NaN sample are at
+            most this far apart, e.g. ``"1h"``. Default *None* keeps all runs
+            apart.
+
+    Returns:
+        DataFrame with one row per run and the columns ``start``, ``end``
+        and ``samples`` (number of NaN samples).
+    """
+    if column is None:
+        column = df.columns[0]
+
+    is_na = df[column].isna().to_numpy()
+    edges = np.diff(np.r_[False, is_na, False].view(np.int8))
+    first = np.flatnonzero(edges == 1)
+    stop = np.flatnonzero(edges == -1)
+    samples = stop - first
+
+    index = df.index
+    start = index[first]
+    end = index[stop - 1]
+    if merge_within is not None and len(first) > 1:
+        # A run opens a new block unless it follows the previous run closely
+        new_block = np.r_[True, (start[1:] - end[:-1]) > pd.Timedelta(merge_within)]
+        block = np.cumsum(new_block) - 1
+        last = np.r_[np.flatnonzero(new_block)[1:], len(first)] - 1
+        start, end = start[new_block], end[last]
+        samples = np.bincount(block, samples)
+
+    return pd.DataFrame({"start": start, "end": end, "samples": np.asarray(samples, dtype=np.int64)})
+
+
 def plot_missing_values(
     df: pd.DataFrame,
     column: Optional[str] = None,
@@ -116,12 +164,18 @@ def plot_missing_values(
     ylab: str = "Value",
     missing_color: str = "rgba(255,0,0,0.2)",
     line_color: str = "green",
+    max_points: Optional[int] = DEFAULT_MAX_POINTS,
+    downsample: str = "minmax",
+    merge_within: Optional[Union[str, pd.Timedelta]] = None,
 ) -> go.Figure:
     """
     Plot a time series and highlight regions with missing (NaN) values.
 
     Creates a Plotly step plot of the data with red vertical rectangles
-    marking NaN regions.
+    marking NaN regions (see :func:`calc_na_runs`) below the data line. All
+    rectangles are drawn by one filled trace, so thousands of gaps render
+    quickly; the y-axis range is fixed to the data range plus 5% so that they
+    span the full height.
 
     Args:
         df: DataFrame with a DatetimeIndex.
@@ -132,6 +186,12 @@ def plot_missing_values(
         missing_color: Fill color for NaN regions.
             Default ``"rgba(255,0,0,0.2)"``.
         line_color: Line color for the data trace. Default ``"green"``.
+        max_points: Maximum points of the data trace; gaps stay visible.
+            *None* draws every point. Default 20000.
+        downsample: Downsampling method, ``"minmax"`` (keeps peaks) or
+            ``"lttb"`` (Largest-Triangle-Three-Buckets). Default ``"minmax"``.
+        merge_within: Draw NaN regions separated by at most this duration
+            as one region, e.g. ``"1h"``. Default *None*.
 
     Returns:
         go.Figure: Plotly figure with the time series and NaN highlights.
@@ -147,29 +207,42 @@ def plot_missing_values(
 
     fig = go.Figure()
 
+    # One closed full-height rectangle per NaN run, separated by gaps, drawn
+    # first so that it stays below the data line
+    runs = calc_na_runs(df, column=column, merge_within=merge_within)
+    if not runs.empty:
+        values = series.to_numpy(dtype=float)
+        finite = values[np.isfinite(values)]
+        lo, hi = (finite.min(), finite.max()) if finite.size else (0.0, 1.0)
+        pad = 0.05 * (hi - lo) if hi > lo else 0.5
+        y_range = [lo - pad, hi + pad]
+        n = len(runs)
+        corners = np.empty((n, 6), dtype=object)
+        corners[:, [0, 1, 4]] = runs["start"].to_numpy()[:, None]
+        corners[:, [2, 3]] = runs["end"].to_numpy()[:, None]
+        corners[:, 5] = None
+        fig.add_trace(go.Scatter(
+            x=corners.ravel(),
+            y=np.tile([y_range[0], y_range[1], y_range[1], y_range[0], y_range[0], None], n),
+            mode="lines",
+            fill="toself",
+            fillcolor=missing_color,
+            line=dict(width=0),
+            hoverinfo="skip",
+            showlegend=False,
+            name="Missing",
+        ))
+        fig.update_layout(yaxis_range=y_range)
+
+    idx = downsample_indices(df.index, series, max_points, downsample)
     fig.add_trace(go.Scatter(
-        x=df.index,
-        y=series,
+        x=df.index[idx],
+        y=series.iloc[idx],
         mode="lines",
         line=dict(color=line_color, width=1, shape="hv"),
         name=column,
     ))
 
-    # Find NaN regions and add vertical rectangles
-    is_na = series.isna()
-    if is_na.any():
-        # Identify contiguous NaN blocks
-        blocks = is_na.ne(is_na.shift()).cumsum()
-        for _, group in is_na[is_na].groupby(blocks):
-            x0 = group.index[0]
-            x1 = group.index[-1]
-            fig.add_vrect(
-                x0=x0, x1=x1,
-                fillcolor=missing_color,
-                line_width=0,
-                layer="below",
-            )
-
     fig.update_layout(
         title_text=f"<b>{title}</b>",
         title_font=dict(size=20),
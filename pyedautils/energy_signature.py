@@ -14,6 +14,7 @@ from typing import NamedTuple
 import numpy as np
 import pandas as pd
 
+from pyedautils.data_prep._timestamps import calendar_field, normalize_timeseries, time_codes
 from pyedautils.data_prep.season import get_season
 
 
@@ -79,14 +80,12 @@ def compute_pes(
     Raises:
         ValueError: If convergence is not reached within *max_iter*.
     """
-    df = data.copy()
-    df.columns = ["timestamp", "outside_temp", "power", "room_temp"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    df = normalize_timeseries(data, ["timestamp", "outside_temp", "power", "room_temp"])
 
     df["season"] = get_season(df["timestamp"])
-    df["day"] = df["timestamp"].dt.date
-    df["month"] = df["timestamp"].dt.month
-    df["hour"] = df["timestamp"].dt.hour
+    df["day"] = time_codes(df["timestamp"], "day")
+    df["month"] = calendar_field(df["timestamp"], "month")
+    df["hour"] = calendar_field(df["timestamp"], "hour")
 
     # Total actual power sum (all hours) for Tb scan
     total_power_actual = df["power"].sum()
@@ -98,25 +97,29 @@ def compute_pes(
         (df["month"].isin([12, 1, 2])) & (df["hour"].between(0, 4))
     ].copy()
 
+    # Daily aggregates, independent of Tb
+    daily = df.groupby("day").agg(
+        max_temp=("outside_temp", "max"),
+        mean_temp=("outside_temp", "mean"),
+        min_power=("power", "min"),
+    )
+
     # Initial balance temperature
     tb = 12.0
 
     for _ in range(max_iter):
         # === P_dhwc (Section 3.2.2) ===
         # Days with at least one hour where T_oa > Tb
-        daily_max_temp_all = df.groupby("day")["outside_temp"].max()
-        warm_days = daily_max_temp_all[daily_max_temp_all > tb].index
-        warm_day_data = df[df["day"].isin(warm_days)]
+        warm_days = daily["max_temp"] > tb
 
-        if warm_day_data.empty:
+        if not warm_days.any():
             raise ValueError(
                 f"No warm days found with Tb={tb:.1f}. "
                 "Check that data spans warm periods."
             )
 
         # Min power per warm day, then average
-        daily_min_power = warm_day_data.groupby("day")["power"].min()
-        p_dhwc = daily_min_power.mean()
+        p_dhwc = daily.loc[warm_days, "min_power"].mean()
 
         # === P_dhw (Section 3.2.3) ===
         # Mean of all hourly power where T_oa > Tb, minus P_dhwc
@@ -141,9 +144,8 @@ def compute_pes(
         # Use 1-day averaged outdoor temps to account for thermal
         # mass (Section 3.2.1, Table 3)
         night_cold = night_cold.copy()
-        daily_mean_t_oa = df.groupby("day")["outside_temp"].mean()
         night_cold["daily_t_oa"] = (
-            night_cold["day"].map(daily_mean_t_oa)
+            night_cold["day"].map(daily["mean_temp"])
         )
         denom = night_cold["room_temp"] - night_cold["daily_t_oa"]
         numer = night_cold["power"] + p_ihg - p_dhwc
@@ -1,76 +1,402 @@
+from collections import OrderedDict
 from geopy.geocoders import Nominatim
 import pgeocode
-import requests
 import pandas as pd
+import threading
 import time
-from typing import List, Union, Tuple
+from typing import List, NamedTuple, Optional, Sequence, Union, Tuple
 import math
 
+import numpy as np
+
+from pyedautils.http_client import async_http_get, get_async_http_client, http_get
+
 
 class GeocodingError(Exception):
     pass
 
 
-def convert_wsg84_to_lv95(lat: float, long: float) -> List[float]:
+def _check_lv95_range(lat: float, long: float) -> None:
+    """Raises GeocodingError for WGS84 coordinates outside the LV95 area."""
+    if not (5.2 <= long <= 11) or not (45.4 <= lat <= 48.2):
+        raise GeocodingError("Coordinates not in range for Swiss coordinate system LV95")
+
+
+def _wgs84_to_lv95_query(lat: float, long: float) -> str:
+    """Validates WGS84 coordinates and builds the geodesy.geo.admin.ch query."""
+    _check_lv95_range(lat, long)
+    latitude = str(lat)
+    longitude = str(long)
+    return f'http://geodesy.geo.admin.ch/reframe/wgs84tolv95?easting={longitude}&northing={latitude}'
+
+
+def wgs84_to_lv95(lat, long):
+    """
+    Converts WGS84 coordinates to LV95 locally with the swisstopo approximate formulas.
+
+    The formulas are accurate to about 1 m within Switzerland. Works with
+    scalars and numpy arrays.
+
+    Args:
+        lat: Latitude in decimal degrees.
+        long: Longitude in decimal degrees.
+
+    Returns:
+        tuple: (easting, northing) in LV95 [m], floats or numpy arrays.
+    """
+    lat = np.asarray(lat, dtype=float)
+    long = np.asarray(long, dtype=float)
+    scalar = lat.ndim == 0 and long.ndim == 0
+
+    # Auxiliary values: differences to Bern in 10000" units
+    phi = (lat * 3600 - 169028.66) / 10000
+    lam = (long * 3600 - 26782.5) / 10000
+
+    easting = (2600072.37 + 211455.93 * lam - 10938.51 * lam * phi
+               - 0.36 * lam * phi**2 - 44.54 * lam**3)
+    northing = (1200147.07 + 308807.95 * phi + 3745.25 * lam**2
+                + 76.63 * phi**2 - 194.56 * lam**2 * phi + 119.79 * phi**3)
+
+    if scalar:
+        return float(easting), float(northing)
+    return easting, northing
+
+
+def lv95_to_wgs84(easting, northing):
+    """
+    Converts LV95 coordinates to WGS84 locally with the swisstopo approximate formulas.
+
+    The formulas are accurate to about 1 m within Switzerland. Works with
+    scalars and numpy arrays.
+
+    Args:
+        easting: LV95 easting (E) [m].
+        northing: LV95 northing (N) [m].
+
+    Returns:
+        tuple: (lat, long) in decimal degrees, floats or numpy arrays.
+    """
+    easting = np.asarray(easting, dtype=float)
+    northing = np.asarray(northing, dtype=float)
+    scalar = easting.ndim == 0 and northing.ndim == 0
+
+    # Auxiliary values: differences to Bern in 1000 km units
+    y = (easting - 2600000) / 1000000
+    x = (northing - 1200000) / 1000000
+
+    lam = (2.6779094 + 4.728982 * y + 0.791484 * y * x
+           + 0.1306 * y * x**2 - 0.0436 * y**3)
+    phi = (16.9023892 + 3.238272 * x - 0.270978 * y**2
+           - 0.002528 * x**2 - 0.0447 * y**2 * x - 0.0140 * x**3)
+
+    # Unit 10000" to degrees
+    lat = phi * 100 / 36
+    long = lam * 100 / 36
+
+    if scalar:
+        return float(lat), float(long)
+    return lat, long
+
+
+def convert_wsg84_to_lv95(lat: float, long: float, offline: bool = False) -> List[float]:
     """
     Converts WGS84 latitude and longitude coordinates to Swiss coordinate system LV95.
 
     Args:
         lat (float): Latitude in decimal degrees.
         long (float): Longitude in decimal degrees.
+        offline (bool, optional): If True, use the local approximate formulas
+            (:func:`wgs84_to_lv95`, ~1 m accuracy) instead of the
+            geodesy.geo.admin.ch api. Default is False.
 
     Returns:
         List[float]: A list containing x and y coordinates in LV95 system, e.g., [xcoord, ycoord].
     """
-    if not (5.2 <= long <= 11) or not (45.4 <= lat <= 48.2):
-        raise GeocodingError("Coordinates not in range for Swiss coordinate system LV95")
+    if offline:
+        _check_lv95_range(lat, long)
+        return list(wgs84_to_lv95(lat, long))
 
-    latitude = str(lat)
-    longitude = str(long)
-    query = f'http://geodesy.geo.admin.ch/reframe/wgs84tolv95?easting={longitude}&northing={latitude}'
+    query = _wgs84_to_lv95_query(lat, long)
     try:
-        r = requests.get(query, timeout=30).json()
+        r = http_get(query, timeout=30).json()
         coord_list_lv95 = r.get("coordinates", [])
         return coord_list_lv95
     except Exception as e:
         raise GeocodingError(f"Failed to convert WGS84 to LV95: {e}") from e
 
 
-def get_altitude_lv95(coord_list_lv95: List[float]) -> float:
+async def aconvert_wsg84_to_lv95(lat: float, long: float, offline: bool = False) -> List[float]:
     """
-    Returns altitude in meters above sea level for the given LV95 coordinates.
-    The geo.admin.ch api gets used.
+    Async counterpart of :func:`convert_wsg84_to_lv95`.
 
     Args:
-        coord_list_lv95 (List[float]): LV95 coordinates as [xcoord, ycoord].
+        lat (float): Latitude in decimal degrees.
+        long (float): Longitude in decimal degrees.
+        offline (bool, optional): If True, use the local approximate formulas
+            (:func:`wgs84_to_lv95`, ~1 m accuracy) instead of the
+            geodesy.geo.admin.ch api. Default is False.
 
     Returns:
-        float: Altitude in meters above sea level.
+        List[float]: A list containing x and y coordinates in LV95 system, e.g., [xcoord, ycoord].
+    """
+    if offline:
+        return convert_wsg84_to_lv95(lat, long, offline=True)
+
+    query = _wgs84_to_lv95_query(lat, long)
+    try:
+        r = (await async_http_get(query, timeout=30)).json()
+        return r.get("coordinates", [])
+    except Exception as e:
+        raise GeocodingError(f"Failed to convert WGS84 to LV95: {e}") from e
+
+
+class DemTile(NamedTuple):
+    """A north-up digital elevation model raster in LV95 coordinates.
+
+    Attributes:
+        source: 2-D numpy array, path to a ``.npy`` file (read memory-mapped)
+            or path to a GeoTIFF (requires ``rasterio``). Row 0 is the
+            northern edge.
+        west: LV95 easting of the western raster edge [m].
+        north: LV95 northing of the northern raster edge [m].
+        cell_size: Cell size [m].
+        nodata: Cell value marking missing data, or *None*.
+    """
+
+    source: Union[str, np.ndarray]
+    west: float
+    north: float
+    cell_size: float
+    nodata: Optional[float] = None
+
+    @classmethod
+    def from_geotiff(cls, path: str) -> "DemTile":
+        """
+        Creates a tile from the georeference of a GeoTIFF in LV95 (EPSG:2056).
+
+        Args:
+            path (str): Path to the GeoTIFF file.
+
+        Returns:
+            DemTile: The tile.
+        """
+        rasterio = _import_rasterio()
+        with rasterio.open(path) as ds:
+            transform = ds.transform
+            return cls(path, transform.c, transform.f, transform.a, ds.nodata)
+
+
+def _import_rasterio():
+    try:
+        import rasterio
+    except ImportError as e:  # pragma: no cover
+        raise ImportError("Reading GeoTIFF tiles requires rasterio: pip install rasterio") from e
+    return rasterio
+
+
+def _read_tile(tile: DemTile) -> np.ndarray:
+    """Returns the raster of *tile*; ``.npy`` files are memory-mapped."""
+    if isinstance(tile.source, np.ndarray):
+        return tile.source
+    if str(tile.source).endswith(".npy"):
+        return np.load(tile.source, mmap_mode="r")
+    rasterio = _import_rasterio()
+    with rasterio.open(tile.source) as ds:
+        return ds.read(1)
+
+
+class DemAltitudeProvider:
+    """
+    Local altitude lookup from a set of DEM tiles in LV95 coordinates.
+
+    Altitudes are bilinearly interpolated between cell centres. Tiles are
+    loaded on first use and kept in an LRU cache, so batch lookups touch the
+    disk only for tiles that contain query points.
+
+    Args:
+        tiles (Sequence[DemTile]): DEM tiles covering the area of interest.
+        cache_size (int, optional): Maximum number of tiles kept in memory. Default 16.
     """
-    query = (
+
+    def __init__(self, tiles: Sequence[DemTile], cache_size: int = 16):
+        self.tiles = list(tiles)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        shapes = np.array([self._tile_shape(t) for t in self.tiles], dtype=float).reshape(-1, 2)
+        cell = np.array([t.cell_size for t in self.tiles], dtype=float)
+        self._west = np.array([t.west for t in self.tiles], dtype=float)
+        self._north = np.array([t.north for t in self.tiles], dtype=float)
+        self._east = self._west + shapes[:, 1] * cell
+        self._south = self._north - shapes[:, 0] * cell
+
+    @staticmethod
+    def _tile_shape(tile: DemTile) -> Tuple[int, int]:
+        if isinstance(tile.source, np.ndarray) or str(tile.source).endswith(".npy"):
+            return _read_tile(tile).shape
+        rasterio = _import_rasterio()
+        with rasterio.open(tile.source) as ds:
+            return ds.height, ds.width
+
+    def _load(self, i: int) -> np.ndarray:
+        """Returns the raster of tile *i* through the LRU cache."""
+        if i in self._cache:
+            self._cache.move_to_end(i)
+            return self._cache[i]
+        raster = _read_tile(self.tiles[i])
+        self._cache[i] = raster
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return raster
+
+    def _sample(self, i: int, easting: np.ndarray, northing: np.ndarray) -> np.ndarray:
+        """Bilinear interpolation in tile *i* at points inside its bounds."""
+        tile = self.tiles[i]
+        raster = self._load(i)
+        n_rows, n_cols = raster.shape
+
+        col = np.clip((easting - tile.west) / tile.cell_size - 0.5, 0, n_cols - 1)
+        row = np.clip((tile.north - northing) / tile.cell_size - 0.5, 0, n_rows - 1)
+        c0 = np.minimum(np.floor(col).astype(np.intp), max(n_cols - 2, 0))
+        r0 = np.minimum(np.floor(row).astype(np.intp), max(n_rows - 2, 0))
+        c1 = np.minimum(c0 + 1, n_cols - 1)
+        r1 = np.minimum(r0 + 1, n_rows - 1)
+        fc = col - c0
+        fr = row - r0
+
+        z00 = np.asarray(raster[r0, c0], dtype=float)
+        z01 = np.asarray(raster[r0, c1], dtype=float)
+        z10 = np.asarray(raster[r1, c0], dtype=float)
+        z11 = np.asarray(raster[r1, c1], dtype=float)
+        if tile.nodata is not None:
+            for z in (z00, z01, z10, z11):
+                z[z == tile.nodata] = np.nan
+
+        top = z00 * (1 - fc) + z01 * fc
+        bottom = z10 * (1 - fc) + z11 * fc
+        return top * (1 - fr) + bottom * fr
+
+    def altitude(self, easting, northing):
+        """
+        Returns altitudes for LV95 coordinates.
+
+        Works with scalars and numpy arrays. Points outside all tiles yield NaN.
+
+        Args:
+            easting: LV95 easting (E) [m].
+            northing: LV95 northing (N) [m].
+
+        Returns:
+            float or np.ndarray: Altitude in meters above sea level.
+        """
+        easting, northing = np.broadcast_arrays(
+            np.asarray(easting, dtype=float), np.asarray(northing, dtype=float))
+        scalar = easting.ndim == 0
+        e = easting.ravel()
+        n = northing.ravel()
+        result = np.full(e.shape, np.nan)
+        todo = np.ones(e.shape, dtype=bool)
+
+        candidates = np.nonzero(
+            (self._west <= e.max(initial=-np.inf)) & (self._east >= e.min(initial=np.inf))
+            & (self._south <= n.max(initial=-np.inf)) & (self._north >= n.min(initial=np.inf))
+        )[0]
+        for i in candidates:
+            inside = (todo & (e >= self._west[i]) & (e <= self._east[i])
+                      & (n >= self._south[i]) & (n <= self._north[i]))
+            if not inside.any():
+                continue
+            result[inside] = self._sample(i, e[inside], n[inside])
+            todo &= ~inside
+
+        if scalar:
+            return float(result[0])
+        return result.reshape(easting.shape)
+
+    def altitude_lat_long(self, lat, long):
+        """
+        Returns altitudes for WGS84 coordinates.
+
+        The coordinates are converted with :func:`wgs84_to_lv95`.
+
+        Args:
+            lat: Latitude in decimal degrees.
+            long: Longitude in decimal degrees.
+
+        Returns:
+            float or np.ndarray: Altitude in meters above sea level.
+        """
+        return self.altitude(*wgs84_to_lv95(lat, long))
+
+
+def _altitude_lv95_query(coord_list_lv95: List[float]) -> str:
+    """Builds the api3.geo.admin.ch height query for LV95 coordinates."""
+    return (
         f'https://api3.geo.admin.ch/rest/services/height'
         f'?easting={coord_list_lv95[0]}&northing={coord_list_lv95[1]}'
     )
+
+
+def _provider_altitude(altitude: float) -> float:
+    """Raises GeocodingError for points without DEM coverage."""
+    if math.isnan(altitude):
+        raise GeocodingError("Coordinates not covered by the DEM tiles")
+    return altitude
+
+
+def get_altitude_lv95(coord_list_lv95: List[float],
+                      provider: Optional[DemAltitudeProvider] = None) -> float:
+    """
+    Returns altitude in meters above sea level for the given LV95 coordinates.
+    The geo.admin.ch api gets used unless a local DEM *provider* is given.
+
+    Args:
+        coord_list_lv95 (List[float]): LV95 coordinates as [xcoord, ycoord].
+        provider (DemAltitudeProvider, optional): Local DEM backend. For batch
+            lookups call ``provider.altitude`` with arrays directly.
+
+    Returns:
+        float: Altitude in meters above sea level.
+    """
+    if provider is not None:
+        return _provider_altitude(provider.altitude(coord_list_lv95[0], coord_list_lv95[1]))
+
+    query = _altitude_lv95_query(coord_list_lv95)
     try:
-        r = requests.get(query, timeout=30).json()
+        r = http_get(query, timeout=30).json()
         altitude = float(r.get("height", 0))
         return altitude
     except Exception as e:
         raise GeocodingError(f"Failed to get altitude for LV95 coordinates, Error: {e}") from e
 
 
-def get_altitude_lat_long(lat: float, long: float) -> float:
+async def aget_altitude_lv95(coord_list_lv95: List[float],
+                             provider: Optional[DemAltitudeProvider] = None) -> float:
     """
-    Returns altitude in meters above sea level for the given WGS84 coordinates.
-    The opentopodata.org api gets used.
+    Async counterpart of :func:`get_altitude_lv95`.
+
+    A local DEM *provider* reads its tiles in a worker thread of the shared
+    async HTTP client.
 
     Args:
-        lat (float): Latitude in decimal degrees.
-        long (float): Longitude in decimal degrees.
+        coord_list_lv95 (List[float]): LV95 coordinates as [xcoord, ycoord].
+        provider (DemAltitudeProvider, optional): Local DEM backend.
 
     Returns:
         float: Altitude in meters above sea level.
     """
+    if provider is not None:
+        return await get_async_http_client().run(get_altitude_lv95, coord_list_lv95, provider)
+
+    query = _altitude_lv95_query(coord_list_lv95)
+    try:
+        r = (await async_http_get(query, timeout=30)).json()
+        return float(r.get("height", 0))
+    except Exception as e:
+        raise GeocodingError(f"Failed to get altitude for LV95 coordinates, Error: {e}") from e
+
+
+def _altitude_lat_long_query(lat: float, long: float) -> str:
+    """Validates WGS84 coordinates and builds the opentopodata.org query."""
     switzerland_lat_min = 45.67
     switzerland_lat_max = 47.92
     switzerland_long_min = 5.7
@@ -82,15 +408,67 @@ def get_altitude_lat_long(lat: float, long: float) -> float:
 
     latitude = str(lat)
     longitude = str(long)
-    query = f'https://api.opentopodata.org/v1/eudem25m?locations={latitude},{longitude}'
+    return f'https://api.opentopodata.org/v1/eudem25m?locations={latitude},{longitude}'
+
+
+def _parse_altitude_lat_long(r: dict) -> float:
+    """Extracts the elevation from an opentopodata.org response."""
+    if pd.json_normalize(r, 'results')['elevation'][0] is None:
+        altitude = 0
+    else:
+        altitude = float(pd.json_normalize(r, 'results')['elevation'].values[0])
+    return round(altitude, 1)
+
+
+def get_altitude_lat_long(lat: float, long: float,
+                          provider: Optional[DemAltitudeProvider] = None) -> float:
+    """
+    Returns altitude in meters above sea level for the given WGS84 coordinates.
+    The opentopodata.org api gets used unless a local DEM *provider* is given.
+    Api requests are rate limited to one per second by the shared HTTP client.
+
+    Args:
+        lat (float): Latitude in decimal degrees.
+        long (float): Longitude in decimal degrees.
+        provider (DemAltitudeProvider, optional): Local DEM backend. For batch
+            lookups call ``provider.altitude_lat_long`` with arrays directly.
+
+    Returns:
+        float: Altitude in meters above sea level.
+    """
+    query = _altitude_lat_long_query(lat, long)
+    if provider is not None:
+        return round(_provider_altitude(provider.altitude_lat_long(lat, long)), 1)
+
     try:
-        r = requests.get(query, timeout=30).json()
-        if pd.json_normalize(r, 'results')['elevation'][0] is None:
-            altitude = 0
-        else:
-            altitude = float(pd.json_normalize(r, 'results')['elevation'].values[0])
-        time.sleep(1)  # API rate limiting
-        return round(altitude, 1)
+        r = http_get(query, timeout=30).json()
+        return _parse_altitude_lat_long(r)
+    except Exception as e:
+        raise GeocodingError(f"Failed to get altitude for WGS84 coordinates: {e}") from e
+
+
+async def aget_altitude_lat_long(lat: float, long: float,
+                                 provider: Optional[DemAltitudeProvider] = None) -> float:
+    """
+    Async counterpart of :func:`get_altitude_lat_long`.
+
+    A local DEM *provider* reads its tiles in a worker thread of the shared
+    async HTTP client.
+
+    Args:
+        lat (float): Latitude in decimal degrees.
+        long (float): Longitude in decimal degrees.
+        provider (DemAltitudeProvider, optional): Local DEM backend.
+
+    Returns:
+        float: Altitude in meters above sea level.
+    """
+    query = _altitude_lat_long_query(lat, long)
+    if provider is not None:
+        return await get_async_http_client().run(get_altitude_lat_long, lat, long, provider)
+    try:
+        r = (await async_http_get(query, timeout=30)).json()
+        return _parse_altitude_lat_long(r)
     except Exception as e:
         raise GeocodingError(f"Failed to get altitude for WGS84 coordinates: {e}") from e
 
@@ -121,6 +499,66 @@ def get_lat_long_address(address: str) -> Union[List[float], None]:
         raise GeocodingError(f"Failed to geocode address, Error: {e}") from e
 
 
+async def aget_lat_long_address(address: str) -> Union[List[float], None]:
+    """
+    Async counterpart of :func:`get_lat_long_address`.
+
+    The geocoder runs in a worker thread of the shared async HTTP client.
+
+    Args:
+        address (str): The address to geocode.
+
+    Returns:
+        Union[List[float], None]: A list containing latitude and longitude coordinates,
+            e.g., [latitude, longitude].
+    """
+    return await get_async_http_client().run(get_lat_long_address, address)
+
+
+# Swiss postal codes are four digits; the index is a dense array over 1000..9999
+_PLZ_FIRST = 1000
+_PLZ_END = 10000
+_plz_index: Optional[Tuple[np.ndarray, np.ndarray]] = None
+_plz_index_lock = threading.Lock()
+
+
+def _get_plz_index() -> Tuple[np.ndarray, np.ndarray]:
+    """Returns latitude and longitude arrays indexed by postal code - 1000, loading them on first use."""
+    global _plz_index
+    if _plz_index is None:
+        with _plz_index_lock:
+            if _plz_index is None:
+                nomi = pgeocode.Nominatim('ch')
+                data = nomi.query_postal_code([str(code) for code in range(_PLZ_FIRST, _PLZ_END)])
+                _plz_index = (data["latitude"].to_numpy(dtype=float),
+                              data["longitude"].to_numpy(dtype=float))
+    return _plz_index
+
+
+def get_coordinates_ch_plz_many(plzs) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns latitudes and longitudes for many Swiss postal codes at once.
+
+    The postal code table is loaded once per process and kept in memory.
+
+    Args:
+        plzs: Postal codes (Postleitzahlen) as integers or numeric strings.
+
+    Returns:
+        tuple (lat: np.ndarray, lon: np.ndarray): Coordinates, NaN for unknown postal codes.
+    """
+    codes = np.asarray(plzs, dtype=float)
+    index_lat, index_lon = _get_plz_index()
+    valid = (np.isfinite(codes) & (codes >= _PLZ_FIRST) & (codes < _PLZ_END)
+             & (codes == np.floor(codes)))
+    lat = np.full(codes.shape, np.nan)
+    lon = np.full(codes.shape, np.nan)
+    idx = codes[valid].astype(np.intp) - _PLZ_FIRST
+    lat[valid] = index_lat[idx]
+    lon[valid] = index_lon[idx]
+    return lat, lon
+
+
 def get_coordindates_ch_plz(plz: int) -> Tuple[float, float]:
     """
     Returns latitude and longitude for a Swiss postal code.
@@ -132,15 +570,35 @@ def get_coordindates_ch_plz(plz: int) -> Tuple[float, float]:
         tuple (lat: float, lon: float)
     """
     try:
-        nomi = pgeocode.Nominatim('ch')
-        data = nomi.query_postal_code(plz)
-        coordinates = data.latitude.astype(float), data.longitude.astype(float)
-        if str(coordinates[0]) == "nan":
-            raise GeocodingError(f"Failed to get lat/long from plz {plz}")
+        lat, lon = get_coordinates_ch_plz_many([plz])
     except Exception:
         raise GeocodingError(f"Failed to get lat/long for plz {plz}")
+    if np.isnan(lat[0]):
+        raise GeocodingError(f"Failed to get lat/long for plz {plz}")
+
+    return float(lat[0]), float(lon[0])
 
-    return coordinates
+
+async def aget_coordindates_ch_plz(plz: int) -> Tuple[float, float]:
+    """
+    Async counterpart of :func:`get_coordindates_ch_plz`.
+
+    The postal code table is loaded in a worker thread of the shared async
+    HTTP client on first use (pgeocode may download it); later lookups are
+    in-memory and run directly.
+
+    Args:
+        plz (int): Postal Code (Postleitzahl)
+
+    Returns:
+        tuple (lat: float, lon: float)
+    """
+    if _plz_index is None:
+        try:
+            await get_async_http_client().run(_get_plz_index)
+        except Exception:
+            raise GeocodingError(f"Failed to get lat/long for plz {plz}")
+    return get_coordindates_ch_plz(plz)
 
 
 def get_distance_between_two_points(coord1, coord2):
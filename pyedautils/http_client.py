@@ -0,0 +1,271 @@
+"""Shared HTTP client for all network-facing functions.
+
+All web requests of pyedautils (geocoding, altitude lookups, weather data)
+go through one ``requests.Session`` with a keep-alive connection pool,
+automatic retries with exponential backoff, and optional per-host rate
+limits. Batch workloads therefore reuse TCP/TLS connections instead of
+opening a new one for every call.
+
+The async API (:class:`AsyncHttpClient`, :func:`async_http_get`) runs the same
+pooled session in worker threads behind an ``asyncio.Semaphore``, so
+coroutines never block the event loop and the number of requests in flight
+stays bounded. It is not a native asyncio client: ``requests`` has no async
+transport and no async HTTP library is a dependency, so every request in
+flight occupies a worker thread of the default executor.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Minimum interval in seconds between two requests to the same host
+DEFAULT_RATE_LIMITS = {
+    "api.opentopodata.org": 1.0,
+}
+
+DEFAULT_USER_AGENT = "pyedautils"
+
+
+class HttpClient:
+    """
+    Pooled HTTP client with retries and per-host rate limiting.
+
+    Args:
+        pool_maxsize: Maximum number of keep-alive connections per host.
+        retries: Number of retries for failed requests.
+        backoff_factor: Exponential backoff factor between retries in seconds.
+        status_forcelist: HTTP status codes that trigger a retry.
+        rate_limits: Minimum interval in seconds between two requests per
+            host name. Merged with ``DEFAULT_RATE_LIMITS``.
+        user_agent: User-Agent header sent with every request.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 10,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        status_forcelist: tuple = (429, 500, 502, 503, 504),
+        rate_limits: Optional[Dict[str, float]] = None,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = user_agent
+        self.pool_maxsize = pool_maxsize
+        self.rate_limits = {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _throttle(self, host: Optional[str]) -> None:
+        """Block until the rate limit of *host* allows the next request."""
+        interval = self.rate_limits.get(host)
+        if not interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + interval
+        wait = slot - now
+        if wait > 0:
+            logger.debug("Rate limit for %s, waiting %.2f s", host, wait)
+            time.sleep(wait)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a GET request through the pooled session.
+
+        Args:
+            url (str): Request URL.
+            **kwargs: Passed on to ``requests.Session.get`` (e.g. ``timeout``).
+
+        Returns:
+            requests.Response: The response object.
+        """
+        self._throttle(urlsplit(url).hostname)
+        return self.session.get(url, **kwargs)
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Returns the shared HTTP client, creating it with default settings on first use.
+
+    Returns:
+        HttpClient: The shared client instance.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+def configure_http_client(**kwargs) -> HttpClient:
+    """
+    Replaces the shared HTTP client with a newly configured one.
+
+    The previous client's connections are closed.
+
+    Args:
+        **kwargs: Keyword arguments for :class:`HttpClient`, e.g.
+            ``pool_maxsize``, ``retries``, ``backoff_factor`` or ``rate_limits``.
+
+    Returns:
+        HttpClient: The new shared client instance.
+    """
+    global _client
+    with _client_lock:
+        old = _client
+        _client = HttpClient(**kwargs)
+    if old is not None:
+        old.close()
+    return _client
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """
+    Sends a GET request through the shared HTTP client.
+
+    Args:
+        url (str): Request URL.
+        **kwargs: Passed on to ``requests.Session.get`` (e.g. ``timeout``).
+
+    Returns:
+        requests.Response: The response object.
+    """
+    return get_http_client().get(url, **kwargs)
+
+
+class AsyncHttpClient:
+    """
+    Asyncio front end for the shared :class:`HttpClient` with bounded concurrency.
+
+    Args:
+        client: HTTP client to use. If *None*, the shared client returned by
+            :func:`get_http_client` is used at request time.
+        max_concurrency: Maximum number of requests in flight at once.
+    """
+
+    def __init__(self, client: Optional[HttpClient] = None, max_concurrency: int = 10):
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._loop = None
+        self._semaphore = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Returns the semaphore bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Runs a blocking function in a worker thread within the concurrency limit.
+
+        Args:
+            func: Blocking callable.
+            *args: Positional arguments for *func*.
+            **kwargs: Keyword arguments for *func*.
+
+        Returns:
+            The return value of *func*.
+        """
+        async with self._get_semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a GET request through the pooled session without blocking the event loop.
+
+        Args:
+            url (str): Request URL.
+            **kwargs: Passed on to ``requests.Session.get`` (e.g. ``timeout``).
+
+        Returns:
+            requests.Response: The response object.
+        """
+        client = self.client or get_http_client()
+        return await self.run(client.get, url, **kwargs)
+
+
+_async_client: Optional[AsyncHttpClient] = None
+
+
+def get_async_http_client() -> AsyncHttpClient:
+    """
+    Returns the shared async HTTP client, creating it with default settings on first use.
+
+    Returns:
+        AsyncHttpClient: The shared async client instance.
+    """
+    global _async_client
+    if _async_client is None:
+        with _client_lock:
+            if _async_client is None:
+                _async_client = AsyncHttpClient()
+    return _async_client
+
+
+def configure_async_http_client(max_concurrency: int = 10) -> AsyncHttpClient:
+    """
+    Replaces the shared async HTTP client with a newly configured one.
+
+    Args:
+        max_concurrency: Maximum number of requests in flight at once. Should
+            not exceed the ``pool_maxsize`` of the shared :class:`HttpClient`,
+            otherwise connections beyond the pool are not kept alive.
+
+    Returns:
+        AsyncHttpClient: The new shared async client instance.
+    """
+    global _async_client
+    with _client_lock:
+        _async_client = AsyncHttpClient(max_concurrency=max_concurrency)
+    return _async_client
+
+
+async def async_http_get(url: str, **kwargs) -> requests.Response:
+    """
+    Sends a GET request through the shared async HTTP client.
+
+    Args:
+        url (str): Request URL.
+        **kwargs: Passed on to ``requests.Session.get`` (e.g. ``timeout``).
+
+    Returns:
+        requests.Response: The response object.
+    """
+    return await get_async_http_client().get(url, **kwargs)
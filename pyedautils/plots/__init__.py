@@ -1,5 +1,6 @@
 """Plot functions for energy data analysis and visualization."""
 
+from pyedautils._profile_cube import ProfileCube  # noqa: F401
 from pyedautils.plots.profiles import *  # noqa: F401,F403
 from pyedautils.plots.heatmaps import *  # noqa: F401,F403
 from pyedautils.plots.energy import *  # noqa: F401,F403
@@ -1,10 +1,14 @@
 """Thermal comfort and psychrometric chart plots."""
 
-from typing import Dict, Optional, Tuple
+import functools
+from typing import Dict, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+from pyedautils.comfort import DEFAULT_COMFORT_ZONE
+from pyedautils.data_prep.season import _SEASON_CODE_BY_MONTH, _SEASON_ORDER
 from pyedautils.plots._constants import DEFAULT_SEASON_COLORS, _SEASON_LABELS_DE
 
 
@@ -29,14 +33,13 @@ def plot_comfort_sia180(
     Returns:
         go.Figure
     """
+    from pyedautils.data_prep._timestamps import normalize_timeseries
     from pyedautils.data_prep.season import get_season
 
     c = {**DEFAULT_SEASON_COLORS, **(colors or {})}
 
     # Outdoor: hourly mean, fill gaps, 48h rolling mean
-    df_oa = data_outdoor.copy()
-    df_oa.columns = ["timestamp", "value"]
-    df_oa["timestamp"] = pd.to_datetime(df_oa["timestamp"])
+    df_oa = normalize_timeseries(data_outdoor, ["timestamp", "value"])
     df_oa["hour"] = df_oa["timestamp"].dt.floor("h")
     df_oa = df_oa.groupby("hour")["value"].mean().reset_index()
     df_oa.columns = ["timestamp", "temp_oa"]
@@ -48,9 +51,7 @@ def plot_comfort_sia180(
     df_oa.columns = ["timestamp", "temp_oa", "temp_oa_48h"]
 
     # Room: hourly mean
-    df_r = data_room.copy()
-    df_r.columns = ["timestamp", "value"]
-    df_r["timestamp"] = pd.to_datetime(df_r["timestamp"])
+    df_r = normalize_timeseries(data_room, ["timestamp", "value"])
     df_r["hour"] = df_r["timestamp"].dt.floor("h")
     df_r = df_r.groupby("hour")["value"].mean().reset_index()
     df_r.columns = ["timestamp", "temp_r"]
@@ -146,20 +147,20 @@ def plot_comfort_temp_humidity(
     Returns:
         go.Figure
     """
+    from pyedautils.data_prep._timestamps import normalize_timeseries, time_code_starts, time_codes
     from pyedautils.data_prep.season import get_season
 
     c = {**DEFAULT_SEASON_COLORS, **(colors or {})}
 
-    df = data.copy()
-    df.columns = ["timestamp", "temperature", "humidity"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["day"] = df["timestamp"].dt.date
+    df = normalize_timeseries(data, ["timestamp", "temperature", "humidity"])
+    df["day"] = time_codes(df["timestamp"], "day")
 
     daily = df.groupby("day").agg(
         temperature=("temperature", "mean"),
         humidity=("humidity", "mean"),
     ).reset_index()
-    daily["timestamp"] = pd.to_datetime(daily["day"])
+    daily["timestamp"] = time_code_starts(daily["day"], "day")
+    daily["day"] = daily["timestamp"].dt.strftime("%Y-%m-%d")
     daily["season"] = get_season(daily["timestamp"])
 
     fig = go.Figure()
@@ -227,20 +228,266 @@ def _load_d3_js():
     return {
         "mollier_functions": (d3_dir / "mollier_functions.js").read_text(encoding="utf-8"),
         "coordinate_generator": (d3_dir / "CoordinateGenerator.js").read_text(encoding="utf-8"),
-        "draw_comfort": (d3_dir / "drawComfort.js").read_text(encoding="utf-8"),
     }
 
 
-def _get_season_fast(dt):
-    """Fast season detection without ephem (for D3 data prep)."""
-    m = dt.month
-    if m in (12, 1, 2):
-        return "Winter"
-    elif m in (3, 4, 5):
-        return "Spring"
-    elif m in (6, 7, 8):
-        return "Summer"
-    return "Fall"
+_D3_CDN_URL = "https://d3js.org/d3.v5.min.js"
+
+
+def _d3_script_tag(offline) -> str:
+    """Script tag loading D3 v5 from the CDN, or inlining a local copy if *offline*."""
+    from pathlib import Path
+    from importlib import resources as _res
+
+    if not offline:
+        return f'<script src="{_D3_CDN_URL}"></script>'
+    if offline is True:
+        path = _res.files("pyedautils") / "data" / "d3_mollier" / "d3.v5.min.js"
+    else:
+        path = Path(offline)
+    return "<script>" + path.read_text(encoding="utf-8") + "</script>"
+
+
+# Above this many points render="auto" draws on a canvas instead of SVG
+_SVG_MAX_POINTS = 5000
+
+
+def _b64_column(values) -> str:
+    """Base64 string of the raw bytes of a little-endian numpy array."""
+    import base64
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _smallest_uint(values) -> Tuple[str, str]:
+    """JS typed-array name and numpy dtype of the smallest unsigned type holding *values*."""
+    for name, dtype in (("Uint8", "u1"), ("Uint16", "<u2"), ("Uint32", "<u4")):
+        if values.max(initial=0) <= np.iinfo(dtype).max:
+            break
+    return name, dtype
+
+
+def _d3_ticks(start: float, stop: float, count: int) -> list:
+    """Tick values as returned by ``d3.ticks`` (d3-array v1) for [start, stop]."""
+    import math
+
+    if start == stop:
+        return [start]
+    reverse = stop < start
+    if reverse:
+        start, stop = stop, start
+    step = (stop - start) / max(0, count)
+    power = math.floor(math.log(step) / math.log(10))
+    error = step / 10 ** power
+    factor = 10 if error >= math.sqrt(50) else 5 if error >= math.sqrt(10) else 2 if error >= math.sqrt(2) else 1
+    if power >= 0:
+        step = factor * 10 ** power
+        lo, hi = math.ceil(start / step), math.floor(stop / step)
+        ticks = [(lo + i) * step for i in range(math.ceil(hi - lo + 1))]
+    else:
+        step = 10 ** -power / factor
+        lo, hi = math.ceil(start * step), math.floor(stop * step)
+        ticks = [(lo + i) / step for i in range(math.ceil(hi - lo + 1))]
+    return ticks[::-1] if reverse else ticks
+
+
+def _js_grid(start: float, stop: float, step: float) -> list:
+    """Values of the JS loop ``for (v = start; v < stop + step; v += step)``."""
+    values, v = [], start
+    while v < stop + step and step > 0:
+        values.append(v)
+        v += step
+    return values or [start]
+
+
+def _encode_isolines(values, xs, ys, lengths=None) -> dict:
+    """One iso-line family as float32 base64 columns.
+
+    Without *lengths* all lines share the x-coordinates *xs*; otherwise *xs*
+    and *ys* hold the concatenated lines of the given lengths.
+    """
+    return {
+        "values": [float(v) for v in values],
+        "lengths": [len(xs)] * len(values) if lengths is None else [int(n) for n in lengths],
+        "shared": lengths is None,
+        "x": _b64_column(np.asarray(xs, dtype="<f4")),
+        "y": _b64_column(np.asarray(ys, dtype="<f4").ravel()),
+    }
+
+
+def _thin_grid(grid, lines, tolerance: float):
+    """Coarsest subset of the shared *grid* that keeps linear interpolation of
+    all *lines* within *tolerance*; returns the thinned grid and lines."""
+    for stride in (20, 10, 5, 2):
+        idx = np.unique(np.r_[np.arange(0, grid.size, stride), grid.size - 1])
+        upper = np.searchsorted(idx, np.arange(grid.size)).clip(1, idx.size - 1)
+        lo, hi = idx[upper - 1], idx[upper]
+        w = (grid - grid[lo]) / (grid[hi] - grid[lo])
+        approx = lines[:, lo] * (1 - w) + lines[:, hi] * w
+        if np.nanmax(np.abs(approx - lines), initial=0.0) <= tolerance:
+            return grid[idx], lines[:, idx]
+    return grid, lines
+
+
+@functools.lru_cache(maxsize=32)
+def _mollier_isolines(domain_x: Tuple[float, float], domain_y: Tuple[float, float],
+                      pressure: float) -> str:
+    """
+    Iso-line geometry of the Mollier diagram as JSON for ``drawHXCoordinates``.
+
+    Reproduces the temperature, density, relative humidity and enthalpy lines
+    of CoordinateGenerator.js (same tick values and sampling) with the
+    vectorised ``_mollier`` functions. The nearly straight temperature and
+    density lines are thinned to a coarser grid where interpolation stays
+    within 1e-4 of the y-range (well below a pixel). Cached per domain and
+    pressure.
+    """
+    import json
+
+    from pyedautils import _mollier
+
+    x0, x1 = domain_x
+    y0, y1 = domain_y
+    corners_x = np.array([x0, x1, x0, x1])
+    corners_y = np.array([y0, y0, y1, y1])
+    num_points = 100
+    tolerance = 1e-4 * abs(y1 - y0)
+
+    edges = _mollier.temperature(corners_x, corners_y)
+    domain_t = (float(edges.min()), float(edges.max()))
+    grid_x = np.array(_js_grid(x0, x1, (x1 - x0) / num_points))
+
+    values_t = _d3_ticks(*domain_t, 40)
+    grid_t_x, lines_t = _thin_grid(grid_x, _mollier._t_to_y(np.array(values_t)[:, None], grid_x), tolerance)
+
+    edges = _mollier.density(corners_x, corners_y, pressure)
+    values_rho = _d3_ticks(float(edges.min()), float(edges.max()), 8)
+    grid_rho_x, lines_rho = _thin_grid(grid_x, _mollier.y_rhox(np.array(values_rho)[:, None], grid_x, pressure),
+                                       tolerance)
+
+    edges = _mollier.rel_humidity(corners_x, corners_y, pressure)
+    domain_phi = [float(edges.min()), float(edges.max())]
+    if edges[1] < 1 and _mollier.rel_humidity(x0 + (x1 - x0) * 0.99, y0, pressure) > edges[1]:
+        domain_phi[1] = 1.0
+    else:
+        domain_phi[1] = min(domain_phi[1], 1.0)
+    values_phi = _d3_ticks(*domain_phi, 10)
+    grid_t = np.array(_js_grid(domain_t[0], domain_t[1], (domain_t[1] - domain_t[0]) / num_points))
+    phi_x, phi_y = _mollier.get_x_y(grid_t, np.array(values_phi)[:, None], pressure)
+    phi_x, phi_y = np.broadcast_arrays(phi_x, phi_y)
+    # each line ends with its first point beyond the x-domain
+    beyond = phi_x > x1
+    lengths_phi = np.where(beyond.any(axis=1), beyond.argmax(axis=1) + 1, grid_t.size)
+    keep = np.arange(grid_t.size) < lengths_phi[:, None]
+
+    edges = _mollier.enthalpy(corners_x, corners_y)
+    values_h = np.array(_d3_ticks(float(edges.min()), float(edges.max()), 20))
+    h_x = np.stack([np.full(values_h.size, x0), _mollier.x_hy(values_h, y0)], axis=1)
+    h_y = np.stack([_mollier.y_hx(values_h, x0), np.full(values_h.size, y0)], axis=1)
+
+    return json.dumps({
+        "t": _encode_isolines(values_t, grid_t_x, lines_t),
+        "rho": _encode_isolines(values_rho, grid_rho_x, lines_rho),
+        "phi": _encode_isolines(values_phi, phi_x[keep], phi_y[keep], lengths_phi),
+        "h": _encode_isolines(values_h, h_x.ravel(), h_y.ravel(), [2] * values_h.size),
+    })
+
+
+def _mollier_samples(data: Optional[pd.DataFrame], pressure: float):
+    """
+    Mollier coordinates of the valid samples in *data*, sorted by time.
+
+    Returns a tuple (minutes, x, y, season) of numpy arrays with epoch
+    minutes, Mollier coordinates and season codes, or *None* without valid data.
+    """
+    from pyedautils._mollier import get_x_y
+
+    if data is None or data.empty:
+        return None
+    df = data.set_axis(["timestamp", "humidity", "temperature"], axis=1)
+    df = df.dropna(subset=["humidity", "temperature"])
+    if df.empty:
+        return None
+
+    timestamps = pd.to_datetime(df["timestamp"], utc=True).dt.tz_localize(None)
+    minutes = timestamps.to_numpy().astype("datetime64[m]").astype(np.int64)
+    order = np.argsort(minutes, kind="stable")
+    x, y = get_x_y(df["temperature"].to_numpy(dtype=float)[order],
+                   df["humidity"].to_numpy(dtype=float)[order] / 100.0, pressure)
+    months = timestamps.dt.month.to_numpy()[order]
+    season = _SEASON_CODE_BY_MONTH[months - 1]
+    return minutes[order], x, y, season
+
+
+def _pack_mollier_data(data: Optional[pd.DataFrame], pressure: float,
+                       max_points: Optional[int] = None) -> Optional[Dict[str, str]]:
+    """
+    Packs measured data as base64 typed-array columns for the D3 diagram.
+
+    Samples are sorted by time and, above *max_points*, randomly downsampled
+    (reproducibly) to *max_points*. Returns the sample count ``n``, Float32
+    Mollier coordinates ``x`` and ``y``, Uint8 season codes ``season``, and
+    timestamps as the first epoch minute ``ts0`` plus minute deltas ``dts`` in
+    the smallest unsigned type ``dtsType`` that fits. Returns *None* without
+    valid data.
+    """
+    samples = _mollier_samples(data, pressure)
+    if samples is None:
+        return None
+    minutes, x, y, season = samples
+    if max_points is not None and len(minutes) > max_points:
+        keep = np.sort(np.random.default_rng(0).choice(len(minutes), size=max_points, replace=False))
+        minutes, x, y, season = minutes[keep], x[keep], y[keep], season[keep]
+
+    deltas = np.diff(minutes)
+    dts_type, dtype = _smallest_uint(deltas)
+
+    return {
+        "n": len(minutes),
+        "x": _b64_column(np.asarray(x, dtype="<f4")),
+        "y": _b64_column(np.asarray(y, dtype="<f4")),
+        "season": _b64_column(season),
+        "ts0": int(minutes[0]),
+        "dts": _b64_column(deltas.astype(dtype)),
+        "dtsType": dts_type,
+    }
+
+
+def _bin_mollier_data(data: Optional[pd.DataFrame], pressure: float,
+                      domain_x: Tuple[float, float], domain_y: Tuple[float, float],
+                      bins: Union[int, Tuple[int, int]], by_season: bool) -> Optional[Dict]:
+    """
+    Bins measured data into a 2-D histogram over the Mollier diagram domain.
+
+    Returns the grid size ``nx``, ``ny``, the number of ``layers`` (1, or 4
+    seasons in ``_SEASON_ORDER``), the maximum total bin count ``max`` and the
+    base64 ``counts`` of shape (layers, ny, nx) with the top row first, in the
+    smallest unsigned type ``countsType`` that fits. Returns *None* without
+    valid data.
+    """
+    samples = _mollier_samples(data, pressure)
+    if samples is None:
+        return None
+    _, x, y, season = samples
+    nx, ny = (bins, bins) if np.isscalar(bins) else bins
+    hist_range = [sorted(domain_x), sorted(domain_y)]
+
+    codes = range(len(_SEASON_ORDER)) if by_season else [None]
+    layers = []
+    for code in codes:
+        mask = slice(None) if code is None else season == code
+        counts, _, _ = np.histogram2d(x[mask], y[mask], bins=(nx, ny), range=hist_range)
+        layers.append(counts.T[::-1])
+    counts = np.stack(layers).astype(np.int64)
+    counts_type, dtype = _smallest_uint(counts)
+
+    return {
+        "nx": int(nx),
+        "ny": int(ny),
+        "layers": len(layers),
+        "max": int(counts.sum(axis=0).max()),
+        "counts": _b64_column(np.ascontiguousarray(counts, dtype=dtype)),
+        "countsType": counts_type,
+    }
 
 
 def plot_mollier_hx(
@@ -250,13 +497,22 @@ def plot_mollier_hx(
     domain_y: Tuple[float, float] = (-20.0, 50.0),
     comfort_zone: Optional[Dict[str, Tuple[float, float]]] = None,
     height: int = 700,
+    render: str = "auto",
+    max_points: Optional[int] = 500_000,
+    mode: str = "scatter",
+    bins: Union[int, Tuple[int, int]] = 100,
+    by_season: bool = False,
+    offline: Union[bool, str] = False,
 ) -> str:
     """
     Create a Mollier h,x-diagram (psychrometric chart) as self-contained HTML.
 
     Uses D3.js for fast SVG rendering with iso-lines for temperature, enthalpy,
     relative humidity and density, a comfort zone, and optional measured data
-    points colour-coded by season with interactive hover tooltips.
+    points colour-coded by season with interactive hover tooltips. Large data
+    sets are drawn on a canvas layer with quadtree-based hover. The iso-line
+    geometry is computed in Python, cached per domain and pressure, and
+    embedded as float32 arrays.
 
     Args:
         data: Optional DataFrame with columns [timestamp, humidity, temperature].
@@ -265,9 +521,23 @@ def plot_mollier_hx(
         domain_x: Range of absolute humidity [kg/kg] for the x-axis.
         domain_y: Range of the y-coordinate (≈ temperature at x=0) for the y-axis.
         comfort_zone: Dict with keys "temperature", "rel_humidity", "abs_humidity",
-            each a (min, max) tuple. Defaults: T=[20, 26], phi=[0.30, 0.65],
-            x=[0, 0.0115]. Pass ``False`` to disable the comfort zone.
+            each a (min, max) tuple. Missing keys use
+            :data:`pyedautils.comfort.DEFAULT_COMFORT_ZONE`. Pass ``False`` to
+            disable the comfort zone.
         height: Diagram height in pixels. Default 700.
+        render: "svg" (one SVG circle per point), "canvas" (points drawn on a
+            canvas) or "auto" (canvas above 5000 points). Default "auto".
+        max_points: Randomly downsample the data to at most this many points.
+            *None* disables downsampling. Default 500,000.
+        mode: "scatter" draws one point per sample, "density" bins all samples
+            into a 2-D histogram over the diagram domain and draws it as a
+            heatmap under the iso-lines. Default "scatter".
+        bins: Number of density bins, or (x bins, y bins). Default 100.
+        by_season: In density mode, colour each bin by its dominant season
+            with opacity by density instead of a single colour scale.
+        offline: Inline D3 instead of loading it from the CDN. *True* uses
+            the bundled D3 v5.7.0 (``pyedautils/data/d3_mollier/d3.v5.min.js``),
+            a path uses that file. Default False.
 
     Returns:
         str: Self-contained HTML string with inline D3.js rendering.
@@ -276,47 +546,34 @@ def plot_mollier_hx(
     """
     import json
 
-    from pyedautils._mollier import (
-        get_x_y,
-        rel_humidity as m_rel_humidity,
-        temperature as m_temperature,
-    )
+    from pyedautils._mollier import create_comfort
 
     js = _load_d3_js()
-
-    # Prepare data JSON
-    data_json = "null"
-    if data is not None and not data.empty:
-        df = data.copy()
-        df.columns = ["timestamp", "humidity", "temperature"]
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True).dt.tz_localize(None)
-        df = df.dropna(subset=["humidity", "temperature"])
-        if not df.empty:
-            t_arr = df["temperature"].values
-            phi_arr = df["humidity"].values / 100.0
-            x_arr, y_arr = get_x_y(t_arr, phi_arr, pressure)
-            df["season"] = df["timestamp"].apply(_get_season_fast)
-            records = []
-            for i in range(len(df)):
-                ts = df.iloc[i]["timestamp"]
-                xv, yv = float(x_arr[i]), float(y_arr[i])
-                records.append({
-                    "x": xv, "y": yv,
-                    "season": _SEASON_LABELS_DE.get(df.iloc[i]["season"], "?"),
-                    "ts": ts.strftime("%Y-%m-%d %H:%M"),
-                    "temp": round(float(m_temperature(xv, yv)), 2),
-                    "phi": round(float(m_rel_humidity(xv, yv, pressure) * 100), 2),
-                    "xg": round(xv * 1000, 2),
-                })
-            data_json = json.dumps(records)
+    d3_script = _d3_script_tag(offline)
+    isolines_js = _mollier_isolines(tuple(float(v) for v in domain_x),
+                                    tuple(float(v) for v in domain_y), float(pressure))
+
+    if render not in ("auto", "svg", "canvas"):
+        raise ValueError(f"render must be 'auto', 'svg' or 'canvas', got {render!r}")
+    if mode not in ("scatter", "density"):
+        raise ValueError(f"mode must be 'scatter' or 'density', got {mode!r}")
+
+    packed, density_js = None, "null"
+    if mode == "density":
+        binned = _bin_mollier_data(data, pressure, domain_x, domain_y, bins, by_season)
+        density_js = "null" if binned is None else json.dumps(binned)
+    else:
+        packed = _pack_mollier_data(data, pressure, max_points)
+    data_js = "null" if packed is None else f"decodeRecords({json.dumps(packed)})"
+    if render == "auto":
+        render = "canvas" if packed is not None and packed["n"] > _SVG_MAX_POINTS else "svg"
 
     if comfort_zone is False:
-        comfort_t, comfort_phi, comfort_x = "[0,0]", "[0,0]", "[0,0]"
+        comfort_polygon = []
     else:
-        cz = comfort_zone or {}
-        comfort_t = json.dumps(list(cz.get("temperature", (20, 26))))
-        comfort_phi = json.dumps(list(cz.get("rel_humidity", (0.30, 0.65))))
-        comfort_x = json.dumps(list(cz.get("abs_humidity", (0, 0.0115))))
+        cz = {**DEFAULT_COMFORT_ZONE, **(comfort_zone or {})}
+        comfort_polygon = create_comfort(cz["temperature"], cz["rel_humidity"], cz["abs_humidity"], pressure)
+    comfort_js = json.dumps([[round(cx, 7), round(cy, 4)] for cx, cy in comfort_polygon])
     domain_x_js = json.dumps(list(domain_x))
     domain_y_js = json.dumps(list(domain_y))
 
@@ -329,27 +586,70 @@ def plot_mollier_hx(
 
     season_colors = json.dumps(
         {v: DEFAULT_SEASON_COLORS[k] for k, v in _SEASON_LABELS_DE.items()})
+    season_labels = json.dumps([_SEASON_LABELS_DE[k] for k in _SEASON_ORDER])
 
     return f"""<div id="{diagram_id}" style="width:100%;background:white;"></div>
 <div id="{tooltip_id}" style="position:absolute;background:rgba(255,255,255,0.9);\
 border-radius:4px;padding:6px 8px;pointer-events:none;\
 font-family:Tahoma,Geneva,sans-serif;font-size:11px;\
 box-shadow:2px 2px 6px rgba(0,0,0,0.2);opacity:0;"></div>
-<script src="https://d3js.org/d3.v5.min.js"></script>
+{d3_script}
 <script>
 (function() {{
 {js["mollier_functions"]}
 {js["coordinate_generator"]}
-{js["draw_comfort"]}
   let p = {pressure};
   let domainX = {domain_x_js};
   let domainY = {domain_y_js};
-  let rangeT = {comfort_t};
-  let rangePhi = {comfort_phi};
-  let rangeX = {comfort_x};
-  let dataRecords = {data_json};
+  let comfortPolygon = {comfort_js};
+  let renderMode = "{render}";
+  let seasonLabels = {season_labels};
   let colorMap = {season_colors};
 
+  function decodeColumn(b64, ArrayType) {{
+    let bin = atob(b64);
+    let bytes = new Uint8Array(bin.length);
+    for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+    return new ArrayType(bytes.buffer);
+  }}
+  function decodeRecords(cols) {{
+    let xs = decodeColumn(cols.x, Float32Array);
+    let ys = decodeColumn(cols.y, Float32Array);
+    let ss = decodeColumn(cols.season, Uint8Array);
+    let dts = decodeColumn(cols.dts, window[cols.dtsType + "Array"]);
+    let records = new Array(xs.length);
+    let ts = cols.ts0;
+    for (let i = 0; i < xs.length; i++) {{
+      if (i > 0) ts += dts[i - 1];
+      records[i] = {{x: xs[i], y: ys[i], ts: ts, season: seasonLabels[ss[i]]}};
+    }}
+    return records;
+  }}
+  function formatMinutes(m) {{
+    return new Date(m * 60000).toISOString().slice(0, 16).replace("T", " ");
+  }}
+  function decodeIsolines(families) {{
+    let result = {{}};
+    for (let key in families) {{
+      let f = families[key];
+      let xs = decodeColumn(f.x, Float32Array);
+      let ys = decodeColumn(f.y, Float32Array);
+      let lines = [];
+      for (let i = 0, k = 0; i < f.lengths.length; i++) {{
+        let line = new Array(f.lengths[i]);
+        for (let j = 0; j < f.lengths[i]; j++, k++) {{
+          line[j] = {{x: f.shared ? xs[j] : xs[k], y: ys[k]}};
+        }}
+        lines.push(line);
+      }}
+      result[key] = {{values: f.values, lines: lines}};
+    }}
+    return result;
+  }}
+  let isolines = decodeIsolines({isolines_js});
+  let dataRecords = {data_js};
+  let densityGrid = {density_js};
+
   let Height = {height};
   let container = document.getElementById("{diagram_id}");
   let Width = container.getBoundingClientRect().width || 900;
@@ -368,19 +668,55 @@ box-shadow:2px 2px 6px rgba(0,0,0,0.2);opacity:0;"></div>
     .attr("transform", "translate(" + margin.left + "," + margin.top + ")")
     .attr("clip-path", "url(#{clip_id})");
 
-  drawHXCoordinates(bg, Width, Height, margin, domainX, domainY, p);
+  drawHXCoordinates(bg, Width, Height, margin, domainX, domainY, p, isolines);
 
   let x = d3.scaleLinear().range([0, width]).domain(domainX);
   let y = d3.scaleLinear().range([height, 0]).domain(domainY);
 
+  if (densityGrid && densityGrid.max > 0) {{
+    let counts = decodeColumn(densityGrid.counts, window[densityGrid.countsType + "Array"]);
+    let nPix = densityGrid.nx * densityGrid.ny;
+    let raster = document.createElement("canvas");
+    raster.width = densityGrid.nx;
+    raster.height = densityGrid.ny;
+    let rctx = raster.getContext("2d");
+    let img = rctx.createImageData(densityGrid.nx, densityGrid.ny);
+    let logMax = Math.log1p(densityGrid.max);
+    for (let i = 0; i < nPix; i++) {{
+      let total = 0, best = 0;
+      for (let k = 0; k < densityGrid.layers; k++) {{
+        let c = counts[k * nPix + i];
+        total += c;
+        if (c > counts[best * nPix + i]) best = k;
+      }}
+      if (total === 0) continue;
+      let level = Math.log1p(total) / logMax;
+      let color = d3.rgb(densityGrid.layers > 1
+        ? colorMap[seasonLabels[best]] : d3.interpolateYlOrRd(0.15 + 0.85 * level));
+      img.data[4 * i] = color.r;
+      img.data[4 * i + 1] = color.g;
+      img.data[4 * i + 2] = color.b;
+      img.data[4 * i + 3] = densityGrid.layers > 1 ? 255 * (0.25 + 0.75 * level) : 220;
+    }}
+    rctx.putImageData(img, 0, 0);
+    // insert below the iso-lines of drawHXCoordinates
+    d3.select(bg.select(".coordinate-lines").node().parentNode)
+      .insert("image", ".coordinate-lines")
+      .attr("href", raster.toDataURL())
+      .attr("width", width).attr("height", height)
+      .attr("preserveAspectRatio", "none")
+      .style("image-rendering", "pixelated");
+  }}
+
   let line = d3.line().x(d => x(d.x)).y(d => y(d.y));
-  let pathos = createComfort(rangeT, rangePhi, rangeX, p);
-  if (pathos && pathos.length > 0) {{
+  let pathos = comfortPolygon.map(c => ({{x: c[0], y: c[1]}}));
+  if (pathos.length > 0) {{
     plot.append("path").datum(pathos).attr("d", line)
       .attr("fill", "yellowgreen").attr("fill-opacity", 0.4)
       .attr("stroke", "yellowgreen");
   }}
 
+  let overlay = svg;
   if (dataRecords && dataRecords.length > 0) {{
     let tooltip = d3.select("#{tooltip_id}");
 
@@ -389,34 +725,88 @@ box-shadow:2px 2px 6px rgba(0,0,0,0.2);opacity:0;"></div>
       [dataRecords[i], dataRecords[j]] = [dataRecords[j], dataRecords[i]];
     }}
 
-    plot.selectAll("circle").data(dataRecords).enter().append("circle")
-      .attr("cx", d => x(d.x)).attr("cy", d => y(d.y))
-      .attr("r", 5).attr("fill", d => colorMap[d.season] || "#999")
-      .attr("opacity", 0.4).attr("shape-rendering", "optimizeSpeed")
-      .on("mouseover", function(d) {{
-        d3.select(this).attr("r", 10).attr("opacity", 0.9);
-        tooltip.style("opacity", 1)
-          .style("background-color", colorMap[d.season] || "#999")
-          .style("color",
-            (d.season === "Winter" || d.season === "Herbst") ? "white" : "black")
-          .html(d.ts + "<br>x: " + d.xg + " g/kg<br>T: " + d.temp
-            + " °C<br>φ: " + d.phi + " %")
-          .style("left", (d3.event.pageX + 15) + "px")
-          .style("top", (d3.event.pageY - 40) + "px");
+    function showTooltip(d) {{
+      tooltip.style("opacity", 1)
+        .style("background-color", colorMap[d.season] || "#999")
+        .style("color",
+          (d.season === "Winter" || d.season === "Herbst") ? "white" : "black")
+        .html(formatMinutes(d.ts) + "<br>x: " + (d.x * 1000).toFixed(2)
+          + " g/kg<br>T: " + temperature(d.x, d.y).toFixed(2)
+          + " °C<br>φ: " + (rel_humidity(d.x, d.y, p) * 100).toFixed(2) + " %")
+        .style("left", (d3.event.pageX + 15) + "px")
+        .style("top", (d3.event.pageY - 40) + "px");
+    }}
+
+    if (renderMode === "canvas") {{
+      container.style.position = "relative";
+      let dpr = window.devicePixelRatio || 1;
+      let canvas = d3.select("#{diagram_id}").append("canvas")
+        .attr("width", width * dpr).attr("height", height * dpr)
+        .style("position", "absolute")
+        .style("left", margin.left + "px").style("top", margin.top + "px")
+        .style("width", width + "px").style("height", height + "px");
+      overlay = d3.select("#{diagram_id}").append("svg")
+        .attr("width", Width).attr("height", Height)
+        .style("position", "absolute").style("left", "0px").style("top", "0px")
+        .style("pointer-events", "none");
+
+      let ctx = canvas.node().getContext("2d");
+      ctx.scale(dpr, dpr);
+      ctx.globalAlpha = 0.4;
+      for (let d of dataRecords) {{
+        d.px = x(d.x);
+        d.py = y(d.y);
+        ctx.fillStyle = colorMap[d.season] || "#999";
+        ctx.beginPath();
+        ctx.arc(d.px, d.py, 5, 0, 2 * Math.PI);
+        ctx.fill();
+      }}
+
+      let tree = d3.quadtree().x(d => d.px).y(d => d.py).addAll(dataRecords);
+      let highlight = overlay.append("circle").attr("r", 10)
+        .attr("opacity", 0).attr("pointer-events", "none");
+      canvas.on("mousemove", function() {{
+        let m = d3.mouse(this);
+        let d = tree.find(m[0], m[1], 10);
+        if (d) {{
+          highlight.attr("cx", d.px + margin.left).attr("cy", d.py + margin.top)
+            .attr("fill", colorMap[d.season] || "#999").attr("opacity", 0.9);
+          showTooltip(d);
+        }} else {{
+          highlight.attr("opacity", 0);
+          tooltip.style("opacity", 0);
+        }}
       }})
-      .on("mouseout", function(d) {{
-        d3.select(this).attr("r", 5).attr("opacity", 0.4);
+      .on("mouseout", function() {{
+        highlight.attr("opacity", 0);
         tooltip.style("opacity", 0);
       }});
+    }} else {{
+      plot.selectAll("circle").data(dataRecords).enter().append("circle")
+        .attr("cx", d => x(d.x)).attr("cy", d => y(d.y))
+        .attr("r", 5).attr("fill", d => colorMap[d.season] || "#999")
+        .attr("opacity", 0.4).attr("shape-rendering", "optimizeSpeed")
+        .on("mouseover", function(d) {{
+          d3.select(this).attr("r", 10).attr("opacity", 0.9);
+          showTooltip(d);
+        }})
+        .on("mouseout", function(d) {{
+          d3.select(this).attr("r", 5).attr("opacity", 0.4);
+          tooltip.style("opacity", 0);
+        }});
+    }}
+  }}
 
-    let legendItems = [
-      {{label: "Komfortzone", color: "#9ACD32", type: "rect"}},
-      {{label: "Frühling", color: colorMap["Frühling"], type: "circle"}},
-      {{label: "Sommer", color: colorMap["Sommer"], type: "circle"}},
-      {{label: "Herbst", color: colorMap["Herbst"], type: "circle"}},
-      {{label: "Winter", color: colorMap["Winter"], type: "circle"}}
-    ];
-    let legend = svg.append("g")
+  if ((dataRecords && dataRecords.length > 0) || densityGrid) {{
+    let legendItems = [{{label: "Komfortzone", color: "#9ACD32", type: "rect"}}];
+    if (!densityGrid || densityGrid.layers > 1) {{
+      legendItems.push(
+        {{label: "Frühling", color: colorMap["Frühling"], type: "circle"}},
+        {{label: "Sommer", color: colorMap["Sommer"], type: "circle"}},
+        {{label: "Herbst", color: colorMap["Herbst"], type: "circle"}},
+        {{label: "Winter", color: colorMap["Winter"], type: "circle"}});
+    }}
+    let legend = overlay.append("g")
       .attr("transform", "translate(" + (margin.left + 10) + ","
         + (margin.top + 10) + ")");
     legend.append("rect").attr("x", -5).attr("y", -5)
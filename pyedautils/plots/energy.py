@@ -32,21 +32,21 @@ def plot_energy_signature(
     Returns:
         go.Figure: Plotly figure with the scatter plot.
     """
+    from pyedautils.data_prep._timestamps import normalize_timeseries, time_code_starts, time_codes
     from pyedautils.data_prep.season import get_season
 
     c = {**DEFAULT_SEASON_COLORS, **(colors or {})}
 
-    df = data.copy()
-    df.columns = ["timestamp", "temperature", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["day"] = df["timestamp"].dt.date
+    df = normalize_timeseries(data, ["timestamp", "temperature", "value"])
+    df["day"] = time_codes(df["timestamp"], "day")
 
     daily = df.groupby("day").agg(
         temperature=("temperature", "mean"),
         value=("value", "sum"),
     ).reset_index()
 
-    daily["timestamp"] = pd.to_datetime(daily["day"])
+    daily["timestamp"] = time_code_starts(daily["day"], "day")
+    daily["day"] = daily["timestamp"].dt.strftime("%Y-%m-%d")
     daily["season"] = get_season(daily["timestamp"])
 
     fig = go.Figure()
@@ -118,23 +118,23 @@ def plot_energy_signature_pes(
         go.Figure: Plotly figure with scatter and regression lines.
     """
     from pyedautils.energy_signature import compute_pes
+    from pyedautils.data_prep._timestamps import normalize_timeseries, time_code_starts, time_codes
     from pyedautils.data_prep.season import get_season
 
     c = {**DEFAULT_SEASON_COLORS, **(colors or {})}
 
     pes = compute_pes(data, p_ihg=p_ihg)
 
-    df = data.copy()
-    df.columns = ["timestamp", "outside_temp", "power", "room_temp"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["day"] = df["timestamp"].dt.date
+    df = normalize_timeseries(data, ["timestamp", "outside_temp", "power", "room_temp"])
+    df["day"] = time_codes(df["timestamp"], "day")
 
     daily = df.groupby("day").agg(
         outside_temp=("outside_temp", "mean"),
         power=("power", "mean"),
     ).reset_index()
 
-    daily["timestamp"] = pd.to_datetime(daily["day"])
+    daily["timestamp"] = time_code_starts(daily["day"], "day")
+    daily["day"] = daily["timestamp"].dt.strftime("%Y-%m-%d")
     daily["season"] = get_season(daily["timestamp"])
 
     fig = go.Figure()
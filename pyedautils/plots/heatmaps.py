@@ -1,16 +1,18 @@
 """Heatmap visualization plots."""
 
-from typing import List, Optional
+from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from pyedautils._plot_utils import DEFAULT_SEASONS
+from pyedautils._profile_cube import ProfileCube
 
 
 def plot_heatmap_median_weeks(
-    data: pd.DataFrame,
+    data: Union[pd.DataFrame, ProfileCube],
     title: str = "Heatmap Median per Hour by Weekday and Season",
     ylab: str = "Energy Consumption (kWh/h)",
     seasons: Optional[List[str]] = None,
@@ -24,7 +26,8 @@ def plot_heatmap_median_weeks(
     and the color intensity represents the median value.
 
     Args:
-        data: DataFrame with two columns: timestamp and value.
+        data: DataFrame with two columns: timestamp and value, or a
+            :class:`ProfileCube` built from it.
         title: Plot title.
         ylab: Colorbar title / value label.
         seasons: Custom season names in column order.
@@ -34,35 +37,13 @@ def plot_heatmap_median_weeks(
     Returns:
         go.Figure: Plotly figure with one heatmap subplot per season.
     """
-    from pyedautils.data_prep.season import get_season
-
     if seasons is None:
         seasons = DEFAULT_SEASONS
 
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["hour"] = df["timestamp"].dt.floor("h")
-
-    df_h = df.groupby("hour").agg({"value": "sum"}).reset_index()
-    df_h["weekday"] = df_h["hour"].dt.day_name()
-    df_h["dayhour"] = df_h["hour"].dt.hour
-    df_h["season"] = get_season(df_h["hour"])
-
-    # Rename internal English season names to custom labels
-    rename_map = dict(zip(DEFAULT_SEASONS, seasons))
-    df_h["season"] = df_h["season"].map(rename_map).fillna(df_h["season"])
-
-    df_median = (
-        df_h.groupby(["season", "weekday", "dayhour"])["value"]
-        .median()
-        .reset_index()
-    )
+    cube = data if isinstance(data, ProfileCube) else ProfileCube.from_data(data, k=None)
+    # Median hourly sum per season × weekday × hour; seasons map by position
+    median = cube.hourly_quantiles([0.5])[0]
 
-    weekday_full = [
-        "Monday", "Tuesday", "Wednesday", "Thursday",
-        "Friday", "Saturday", "Sunday",
-    ]
     weekday_abbr = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
     fig = make_subplots(
@@ -72,20 +53,20 @@ def plot_heatmap_median_weeks(
         horizontal_spacing=0.05,
     )
 
-    # Build a full grid per season so empty cells show as blank
-    zmin = df_median["value"].min()
-    zmax = df_median["value"].max()
+    # Full grid per season so empty cells show as blank
+    filled = ~np.isnan(median)
+    zmin = median[filled].min() if filled.any() else np.nan
+    zmax = median[filled].max() if filled.any() else np.nan
 
     for col_idx, season in enumerate(seasons, start=1):
-        subset = df_median[df_median["season"] == season]
-
-        # Pivot to weekday × hour matrix
-        pivot = subset.pivot(index="weekday", columns="dayhour", values="value")
-        pivot = pivot.reindex(index=weekday_full, columns=range(24))
+        if col_idx <= len(median):
+            z = median[col_idx - 1]
+        else:
+            z = np.full_like(median[0], np.nan)
 
         fig.add_trace(
             go.Heatmap(
-                z=pivot.values,
+                z=z,
                 x=list(range(24)),
                 y=weekday_abbr,
                 colorscale=colorscale,
@@ -150,12 +131,13 @@ def plot_heatmap_calendar(
     Returns:
         go.Figure: Plotly figure with one subplot row per year.
     """
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["day"] = df["timestamp"].dt.floor("D")
+    from pyedautils.data_prep._timestamps import normalize_timeseries, time_code_starts, time_codes
+
+    df = normalize_timeseries(data, ["timestamp", "value"])
+    df["day"] = time_codes(df["timestamp"], "day")
 
     df_daily = df.groupby("day")["value"].sum().reset_index()
+    df_daily["day"] = time_code_starts(df_daily["day"], "day")
     df_daily["weekday"] = df_daily["day"].dt.dayofweek  # 0=Mon
     df_daily["year"] = df_daily["day"].dt.year
     df_daily["month"] = df_daily["day"].dt.month
@@ -174,15 +156,30 @@ def plot_heatmap_calendar(
 
     years = sorted(df_daily["year"].unique())
     weekday_abbr = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    all_weeks = list(range(0, 54))
 
     zmin = df_daily["value"].min()
     zmax = df_daily["value"].max()
 
+    # Year × weekday × week grid of all years at once; each (weekday, week)
+    # cell of a year holds at most one day
+    year_idx = np.searchsorted(years, df_daily["year"].to_numpy())
+    weekday = df_daily["weekday"].to_numpy()
+    week = df_daily["week"].to_numpy()
+    z = np.full((len(years), 7, len(all_weeks)), np.nan)
+    z[year_idx, weekday, week] = df_daily["value"].to_numpy()
+    # Hover labels: date and weekday per cell, the value comes from z
+    labels = np.full(z.shape, None, dtype=object)
+    labels[year_idx, weekday, week] = (
+        np.datetime_as_string(df_daily["day"].to_numpy().astype("datetime64[D]")).astype(object)
+        + " (" + np.asarray(weekday_abbr, dtype=object)[weekday] + ")"
+    )
+
     fig = make_subplots(
         rows=len(years), cols=1,
         subplot_titles=[str(y) for y in years],
         shared_xaxes=True,
-        vertical_spacing=0.08,
+        vertical_spacing=min(0.08, 0.5 / max(len(years) - 1, 1)),
     )
 
     # Month labels: find the week where each month starts
@@ -190,38 +187,14 @@ def plot_heatmap_calendar(
         "Jan", "Feb", "Mar", "Apr", "May", "Jun",
         "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
     ]
+    # First day of each month in the data (weeks increase within a month)
+    month_starts = df_daily.groupby(["year", "month"])[["week", "weekday"]].first().reset_index()
 
+    shapes = []
     for row_idx, year in enumerate(years, start=1):
-        year_data = df_daily[df_daily["year"] == year]
-
-        # Pivot to weekday × week matrix
-        all_weeks = list(range(0, 54))
-        pivot = year_data.pivot_table(
-            index="weekday", columns="week", values="value", aggfunc="sum",
-        ).reindex(index=range(7), columns=all_weeks)
-
-        day_pivot = year_data.pivot_table(
-            index="weekday", columns="week", values="day", aggfunc="first",
-        ).reindex(index=range(7), columns=all_weeks)
-
-        hover_text = []
-        for wd in range(7):
-            row_text = []
-            for wk in all_weeks:
-                val = pivot.loc[wd, wk] if wd in pivot.index else None
-                day = day_pivot.loc[wd, wk] if wd in day_pivot.index else None
-                if pd.notna(val) and pd.notna(day):
-                    row_text.append(
-                        f"{pd.Timestamp(day).strftime('%Y-%m-%d')} ({weekday_abbr[wd]})"
-                        f"<br>Value: {val:.0f}"
-                    )
-                else:
-                    row_text.append("")
-            hover_text.append(row_text)
-
         fig.add_trace(
             go.Heatmap(
-                z=pivot.values,
+                z=z[row_idx - 1],
                 x=all_weeks,
                 y=weekday_abbr,
                 colorscale=colorscale,
@@ -229,8 +202,9 @@ def plot_heatmap_calendar(
                 zmax=zmax,
                 showscale=(row_idx == len(years)),
                 colorbar=dict(title="Legend") if row_idx == len(years) else None,
-                hoverinfo="text",
-                text=hover_text,
+                customdata=labels[row_idx - 1],
+                hovertemplate="%{customdata}<br>Value: %{z:.0f}<extra></extra>",
+                hoverongaps=False,
                 xgap=1,
                 ygap=1,
             ),
@@ -239,71 +213,41 @@ def plot_heatmap_calendar(
         )
 
         # Month tick labels and border lines
-        month_ticks = []
-        month_labels = []
-        for m in range(1, 13):
-            month_data = year_data[year_data["month"] == m]
-            if not month_data.empty:
-                week_start = month_data["week"].min()
-                month_ticks.append(week_start)
-                month_labels.append(month_names[m - 1])
-
-                # Add vertical month separator line
-                if m > 1:
-                    # Line at left edge of first week of new month
-                    x_pos = week_start - 0.5
-                    # Find which weekday the month starts on
-                    first_day = month_data.loc[
-                        month_data["week"] == week_start, "weekday"
-                    ].min()
-                    # Draw line from top to the start weekday
-                    # then horizontal to previous week, then down
-                    ax = fig.get_subplot(row_idx, 1)
-                    xref = ax.xaxis.plotly_name.replace("axis", "")
-                    yref = ax.yaxis.plotly_name.replace("axis", "")
-
-                    if first_day > 0:
-                        # Partial week: L-shaped border
-                        # Vertical line from top to first_day
-                        fig.add_shape(
-                            type="line",
-                            x0=x_pos, x1=x_pos,
-                            y0=-0.5, y1=first_day - 0.5,
-                            xref=xref, yref=yref,
-                            line=dict(color="white", width=4),
-                        )
-                        # Horizontal line at first_day to previous week
-                        fig.add_shape(
-                            type="line",
-                            x0=x_pos, x1=x_pos - 1,
-                            y0=first_day - 0.5, y1=first_day - 0.5,
-                            xref=xref, yref=yref,
-                            line=dict(color="white", width=4),
-                        )
-                        # Vertical line from first_day to bottom
-                        fig.add_shape(
-                            type="line",
-                            x0=x_pos - 1, x1=x_pos - 1,
-                            y0=first_day - 0.5, y1=6.5,
-                            xref=xref, yref=yref,
-                            line=dict(color="white", width=4),
-                        )
-                    else:
-                        # Month starts on Monday: simple vertical line
-                        fig.add_shape(
-                            type="line",
-                            x0=x_pos, x1=x_pos,
-                            y0=-0.5, y1=6.5,
-                            xref=xref, yref=yref,
-                            line=dict(color="white", width=4),
-                        )
+        ax = fig.get_subplot(row_idx, 1)
+        xref = ax.xaxis.plotly_name.replace("axis", "")
+        yref = ax.yaxis.plotly_name.replace("axis", "")
+        line = dict(color="white", width=4)
+        starts = month_starts[month_starts["year"] == year]
+        for m, week_start, first_day in starts[["month", "week", "weekday"]].itertuples(index=False):
+            if m == 1:
+                continue
+            # Line at left edge of first week of new month
+            x_pos = week_start - 0.5
+            if first_day > 0:
+                # Partial week: L-shaped border from the top to the start
+                # weekday, across to the previous week, then down
+                shapes += [
+                    dict(type="line", x0=x_pos, x1=x_pos, y0=-0.5, y1=first_day - 0.5,
+                         xref=xref, yref=yref, line=line),
+                    dict(type="line", x0=x_pos, x1=x_pos - 1, y0=first_day - 0.5, y1=first_day - 0.5,
+                         xref=xref, yref=yref, line=line),
+                    dict(type="line", x0=x_pos - 1, x1=x_pos - 1, y0=first_day - 0.5, y1=6.5,
+                         xref=xref, yref=yref, line=line),
+                ]
+            else:
+                # Month starts on Monday: simple vertical line
+                shapes.append(dict(type="line", x0=x_pos, x1=x_pos, y0=-0.5, y1=6.5,
+                                   xref=xref, yref=yref, line=line))
 
         fig.update_xaxes(
-            tickvals=month_ticks,
-            ticktext=month_labels,
+            tickvals=starts["week"].tolist(),
+            ticktext=[month_names[m - 1] for m in starts["month"]],
             row=row_idx, col=1,
         )
 
+    # One layout update: adding shapes one by one re-validates all earlier ones
+    fig.update_layout(shapes=shapes)
+
     fig.update_layout(
         title_text=f"<b>{title}</b>",
         title_font=dict(size=20),
@@ -1,7 +1,8 @@
 """Daily profile analysis plots."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -15,16 +16,19 @@ from pyedautils._plot_utils import (
     prepare_hourly_seasonal_data,
     style_subplot_axes,
 )
+from pyedautils._profile_cube import ProfileCube
+from pyedautils.data_prep._timestamps import normalize_timeseries, time_code_starts, time_codes
 
 
 def plot_daily_profiles_overview(
-    data: pd.DataFrame,
+    data: Union[pd.DataFrame, ProfileCube],
     title: str = "Daily Profiles Overview by Weekday and Season",
     ylab: str = "Value",
     confidence: float = 95.0,
     colors: Optional[Dict[str, str]] = None,
     seasons: Optional[List[str]] = None,
     weekdays: Optional[List[str]] = None,
+    compression: Optional[float] = None,
 ) -> go.Figure:
     """
     Create a 4x7 subplot grid showing daily profiles by season and weekday.
@@ -34,13 +38,17 @@ def plot_daily_profiles_overview(
     weekdays (Monday through Sunday).
 
     Args:
-        data: DataFrame with two columns: timestamp and value.
+        data: DataFrame with two columns: timestamp and value, or a
+            :class:`ProfileCube` built from it.
         title: Plot title.
         ylab: Y-axis label (shown on first column).
         confidence: Confidence level for quantile bands (0-100). Default 95.
         colors: Optional color overrides. Keys: "median", "bounds", "fill".
         seasons: Custom season names in row order. Default: Spring, Summer, Fall, Winter.
         weekdays: Custom weekday names in column order. Default: Monday through Sunday.
+        compression: Estimate median and bands from mergeable t-digests of this
+            compression (e.g. 100) instead of exactly, see :class:`ProfileCube`.
+            Default *None* (exact).
 
     Returns:
         go.Figure: Plotly figure with the subplot grid.
@@ -50,7 +58,8 @@ def plot_daily_profiles_overview(
     if weekdays is None:
         weekdays = DEFAULT_WEEKDAYS
 
-    df = prepare_hourly_seasonal_data(data, confidence=confidence, seasons=seasons)
+    df = prepare_hourly_seasonal_data(data, confidence=confidence, seasons=seasons,
+                                      compression=compression)
     fig, seasons, weekdays = create_seasonal_weekday_subplots(
         title=title, seasons=seasons, weekdays=weekdays,
     )
@@ -69,8 +78,28 @@ def plot_daily_profiles_overview(
     return fig
 
 
+def _weekday_profiles(data, method: str, loc_time_zone: str, k: int):
+    """Profile per weekday × minute of the day and the mask of minutes with data."""
+    if isinstance(data, ProfileCube):
+        cube = data
+    else:
+        cube = ProfileCube.from_data(data, loc_time_zone=loc_time_zone,
+                                     k=k if method == "decomposed" else None)
+
+    if method == "decomposed":
+        # Seasonal component of the detrended values
+        profile = cube.detrended_mean()
+        present = cube.detrended_count > 0
+        # Per-weekday: subtract value at midnight so each day starts at 0;
+        # weekdays without a midnight value are dropped
+        present &= present[:, :1]
+        return profile - profile[:, :1], present
+    # Simple mean
+    return cube.mean(by_season=False), cube.count.sum(axis=0) > 0
+
+
 def plot_daily_profiles(
-    data: pd.DataFrame,
+    data: Union[pd.DataFrame, ProfileCube],
     method: str = "mean",
     loc_time_zone: str = "UTC",
     title: Optional[str] = None,
@@ -89,8 +118,12 @@ def plot_daily_profiles(
     - ``"overlayed"``: All individual daily profiles overlaid in blue.
       Hovering highlights the entire day-line in orange (requires JS).
 
+    ``"mean"`` and ``"decomposed"`` also accept a :class:`ProfileCube`, whose
+    time zone and *k* then apply instead of *loc_time_zone* and *k*.
+
     Args:
-        data: DataFrame with two columns: timestamp and value.
+        data: DataFrame with two columns: timestamp and value, or a
+            :class:`ProfileCube` built from it.
         method: Aggregation method — ``"mean"``, ``"decomposed"``, or
             ``"overlayed"``.
         loc_time_zone: Timezone for localization (e.g. "Europe/Zurich"). Default "UTC".
@@ -125,49 +158,69 @@ def plot_daily_profiles(
 
     import plotly.express as px
 
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-
     weekdays = DEFAULT_WEEKDAYS
     viridis_colors = px.colors.sample_colorscale(
         "Viridis", [i / max(len(weekdays) - 1, 1) for i in range(len(weekdays))]
     )
 
     if method == "overlayed":
+        if isinstance(data, ProfileCube):
+            raise ValueError("method 'overlayed' needs the raw data, not a ProfileCube")
         import json as _json
         import uuid
 
-        df["x"] = df["timestamp"].dt.hour + df["timestamp"].dt.minute / 60
-        df["weekday"] = df["timestamp"].dt.day_name()
-        df["day"] = df["timestamp"].dt.date
+        df = normalize_timeseries(data, ["timestamp", "value"])
+        if df["timestamp"].isna().any():
+            df = df[df["timestamp"].notna()]
+
+        ts = df["timestamp"]
+        x = (ts.dt.hour + ts.dt.minute / 60).to_numpy(dtype=float)
+        y = df["value"].to_numpy(dtype=float).copy()
+        # wall-clock days, like hour and weekday
+        day = time_codes(ts, "day").to_numpy(dtype=np.int64)
+        weekday = ts.dt.dayofweek.to_numpy()
 
         # Set value at exact midnight to NaN (avoid line jumping back to 0)
-        df.loc[df["x"] == 0.0, "value"] = None
+        y[x == 0.0] = np.nan
 
         base_color = "rgba(31, 119, 180, 0.15)"
         color_map = dict(zip(weekdays, viridis_colors))
 
+        # One trace per weekday: days sorted in time, separated by NaN points
+        order = np.lexsort((x, day))
+        x, y, day, weekday = x[order], y[order], day[order], weekday[order]
+
+        traces_json, day_starts, day_labels = [], [], []
+        for i, day_name in enumerate(weekdays):
+            mask = weekday == i
+            wx, wy, wday = x[mask], y[mask], day[mask]
+            new_day = np.flatnonzero(wday[1:] != wday[:-1]) + 1
+            # Position of each day's first point once the separators are inserted
+            starts = np.r_[0, new_day + np.arange(1, new_day.size + 1)] if wday.size else np.array([], dtype=int)
+            wx = np.insert(wx, new_day, np.nan)
+            wy = np.insert(wy, new_day, np.nan)
+            traces_json.append({
+                "x": np.where(np.isnan(wx), None, np.round(wx, 4)).tolist(),
+                "y": np.where(np.isnan(wy), None, np.round(wy, digits)).tolist(),
+                "mode": "lines", "name": day_name,
+                "type": "scatter",
+                "legendgroup": day_name,
+                "showlegend": True,
+                "line": {"color": base_color, "width": 1},
+                "hoverinfo": "none",
+            })
+            day_starts.append(starts.tolist())
+            day_labels.append(time_code_starts(wday[np.r_[0, new_day]] if wday.size else wday, "day")
+                              .strftime("%Y-%m-%d").tolist())
+        # Hovered day, drawn on top
+        traces_json.append({
+            "x": [], "y": [], "mode": "lines", "type": "scatter", "name": "",
+            "showlegend": False, "hoverinfo": "skip",
+            "line": {"color": "orange", "width": 3},
+        })
+
+        max_val = np.nanmax(y) if np.isfinite(y).any() else None
         fig = go.Figure()
-
-        for day_name in weekdays:
-            day_data = df[df["weekday"] == day_name]
-            legend_shown = False
-            for date, grp in day_data.groupby("day"):
-                grp = grp.sort_values("x")
-                fig.add_trace(go.Scatter(
-                    x=grp["x"],
-                    y=grp["value"],
-                    mode="lines",
-                    name=f"{day_name} ({date})",
-                    legendgroup=day_name,
-                    showlegend=not legend_shown,
-                    line=dict(color=base_color, width=1),
-                    hoverinfo="none",
-                ))
-                legend_shown = True
-
-        max_val = df["value"].max()
         fig.update_layout(
             title_text=f"<b>{title}</b>",
             title_font=dict(size=20),
@@ -181,20 +234,6 @@ def plot_daily_profiles(
         )
 
         # Build traces as plain JSON (avoid plotly's binary encoding)
-        traces_json = []
-        for trace in fig.data:
-            x_vals = [float(v) for v in trace.x] if trace.x is not None else []
-            y_vals = [None if (v is None or pd.isna(v)) else float(v)
-                      for v in trace.y] if trace.y is not None else []
-            traces_json.append({
-                "x": x_vals, "y": y_vals,
-                "mode": trace.mode, "name": trace.legendgroup if trace.showlegend else trace.name,
-                "type": "scatter",
-                "legendgroup": trace.legendgroup,
-                "showlegend": trace.showlegend,
-                "line": {"color": trace.line.color, "width": trace.line.width},
-                "hoverinfo": "none",
-            })
         layout_json = _json.loads(fig.to_json())["layout"]
         fig_json = _json.dumps({"data": traces_json, "layout": layout_json})
         uid = uuid.uuid4().hex[:8]
@@ -211,12 +250,28 @@ display:none;z-index:9999;"></div>
 <script>
 (function() {{
   var figData = {fig_json};
-  var baseColor = "{base_color}";
-  var highlightColor = "orange";
+  var dayStarts = {_json.dumps(day_starts)};
+  var dayLabels = {_json.dumps(day_labels)};
   var el = document.getElementById("{div_id}");
   var tt = document.getElementById("{tt_id}");
   var colorMap = {color_map_json};
-  var prevIdx = -1;
+  var highlightIdx = figData.data.length - 1;
+  var prevKey = null;
+
+  // Index of the day segment containing point *idx* of weekday trace *trace*
+  function daySegment(trace, idx) {{
+    var starts = dayStarts[trace], lo = 0, hi = starts.length - 1;
+    while (lo < hi) {{
+      var mid = (lo + hi + 1) >> 1;
+      if (starts[mid] <= idx) lo = mid; else hi = mid - 1;
+    }}
+    return lo;
+  }}
+
+  function clearHighlight() {{
+    prevKey = null;
+    Plotly.restyle(el, {{x: [[]], y: [[]]}}, [highlightIdx]);
+  }}
 
   Plotly.newPlot(el, figData.data, figData.layout, {{
     displaylogo: false,
@@ -224,51 +279,37 @@ display:none;z-index:9999;"></div>
   }}).then(function() {{
 
     el.on("plotly_hover", function(eventData) {{
-      var traceIdx = eventData.points[0].curveNumber;
-      if (traceIdx === prevIdx) return;
-      prevIdx = traceIdx;
+      var pt = eventData.points[0];
+      var traceIdx = pt.curveNumber;
+      if (traceIdx >= dayStarts.length) return;
+      var seg = daySegment(traceIdx, pt.pointNumber);
+      var key = traceIdx + ":" + seg;
 
-      var traceName = el.data[traceIdx].name;
-      var parts = traceName.match(/^(.+?)\\s*\\((.+)\\)$/);
-      var dayName = parts ? parts[1] : traceName;
-      var date = parts ? parts[2] : "";
-      var val = eventData.points[0].y;
-      var hour = eventData.points[0].x;
+      var dayName = el.data[traceIdx].name;
+      var val = pt.y;
+      var hour = pt.x;
 
       // Show tooltip
-      tt.innerHTML = "<b>" + date + " (" + dayName + ")</b><br>"
+      tt.innerHTML = "<b>" + dayLabels[traceIdx][seg] + " (" + dayName + ")</b><br>"
         + "Time: " + hour.toFixed(2) + "h<br>"
         + "Value: " + (val != null ? val.toFixed(0) : "—");
       tt.style.display = "block";
-
-      // Highlight hovered trace
-      var colors = [];
-      var widths = [];
-      var opacities = [];
-      for (var i = 0; i < el.data.length; i++) {{
-        if (i === traceIdx) {{
-          colors.push(highlightColor);
-          widths.push(3);
-          opacities.push(1.0);
-        }} else {{
-          colors.push(baseColor);
-          widths.push(1);
-          opacities.push(1.0);
-        }}
-      }}
-      Plotly.restyle(el, {{"line.color": colors, "line.width": widths, "opacity": opacities}});
+      if (key === prevKey) return;
+      prevKey = key;
+
+      // Highlight the hovered day
+      var starts = dayStarts[traceIdx];
+      var start = starts[seg];
+      var end = seg + 1 < starts.length ? starts[seg + 1] - 1 : el.data[traceIdx].x.length;
+      Plotly.restyle(el, {{
+        x: [el.data[traceIdx].x.slice(start, end)],
+        y: [el.data[traceIdx].y.slice(start, end)]
+      }}, [highlightIdx]);
     }});
 
     el.on("plotly_unhover", function() {{
-      prevIdx = -1;
       tt.style.display = "none";
-      var colors = [];
-      var widths = [];
-      for (var i = 0; i < el.data.length; i++) {{
-        colors.push(baseColor);
-        widths.push(1);
-      }}
-      Plotly.restyle(el, {{"line.color": colors, "line.width": widths}});
+      clearHighlight();
     }});
 
     // Move tooltip with mouse
@@ -278,62 +319,21 @@ display:none;z-index:9999;"></div>
     }});
 
     // Double-click to reset
-    el.on("plotly_doubleclick", function() {{
-      var colors = [];
-      var widths = [];
-      for (var i = 0; i < el.data.length; i++) {{
-        colors.push(baseColor);
-        widths.push(1);
-      }}
-      Plotly.restyle(el, {{"line.color": colors, "line.width": widths}});
-    }});
+    el.on("plotly_doubleclick", clearHighlight);
   }});
 }})();
 </script>"""
 
     # --- mean / decomposed ---
-    df = df.set_index("timestamp")
-    df.index = pd.to_datetime(df.index)
-    df = df.tz_localize(tz=loc_time_zone, ambiguous=True, nonexistent="shift_forward")
-
-    df["weekday"] = df.index.dayofweek
-    df["dayhour"] = df.index.hour
-    df["dayminute"] = df.index.minute
-
-    if method == "decomposed":
-        # Detrend
-        roll_mean = df["value"].rolling(window=k, center=True).mean()
-        df["valueDetrended"] = df["value"] - roll_mean
-        df = df.dropna(subset=["valueDetrended"])
-
-        # Seasonal component
-        seasonal = df.groupby(["weekday", "dayhour", "dayminute"])["valueDetrended"].mean().reset_index()
-
-        # Per-weekday: subtract value at midnight so each day starts at 0
-        start_values = seasonal.loc[
-            (seasonal["dayhour"] == 0) & (seasonal["dayminute"] == 0),
-            ["weekday", "valueDetrended"],
-        ].rename(columns={"valueDetrended": "valueStart"})
-        seasonal = seasonal.merge(start_values, on="weekday")
-        seasonal["value"] = seasonal["valueDetrended"] - seasonal["valueStart"]
-        df_plot = seasonal
-    else:
-        # Simple mean
-        df_plot = df.groupby(["weekday", "dayhour", "dayminute"])["value"].mean().reset_index()
-
-    # Prepare plot data
-    df_plot["time"] = df_plot["dayhour"] + df_plot["dayminute"] / 60
-    df_plot["value"] = df_plot["value"].round(digits)
-    df_plot = df_plot.sort_values(by=["weekday", "time"])
-
-    df_plot["weekday"] = df_plot["weekday"].map(lambda x: weekdays[x])
+    profile, present = _weekday_profiles(data, method, loc_time_zone, k)
+    time = np.arange(profile.shape[1]) / 60
+    profile = np.round(profile, digits)
 
     fig = make_subplots(rows=1, cols=1)
 
     for i, day in enumerate(weekdays):
-        subset = df_plot[df_plot["weekday"] == day]
         fig.add_trace(go.Scatter(
-            x=subset["time"], y=subset["value"],
+            x=time[present[i]], y=profile[i, present[i]],
             mode="lines", name=str(day),
             line=dict(color=viridis_colors[i]),
         ), row=1, col=1)
@@ -2,9 +2,11 @@
 
 from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+from pyedautils.data_prep._timestamps import calendar_field, normalize_timeseries
 from pyedautils.plots._constants import DEFAULT_SEASON_COLORS
 
 
@@ -27,11 +29,9 @@ def plot_seasonal_overlapping(
     """
     import plotly.express as px
 
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["year"] = df["timestamp"].dt.year
-    df["month"] = df["timestamp"].dt.month
+    df = normalize_timeseries(data, ["timestamp", "value"])
+    df["year"] = calendar_field(df["timestamp"], "year")
+    df["month"] = calendar_field(df["timestamp"], "month")
 
     years = sorted(df["year"].unique())
     colors = px.colors.sample_colorscale(
@@ -84,11 +84,9 @@ def plot_seasonal_miniplots(
     import plotly.express as px
     from plotly.subplots import make_subplots
 
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["year"] = df["timestamp"].dt.year
-    df["month"] = df["timestamp"].dt.month
+    df = normalize_timeseries(data, ["timestamp", "value"])
+    df["year"] = calendar_field(df["timestamp"], "year")
+    df["month"] = calendar_field(df["timestamp"], "month")
 
     years = sorted(df["year"].unique())
     colors = px.colors.sample_colorscale(
@@ -172,11 +170,9 @@ def plot_seasonal_before_after(
     """
     import plotly.express as px
 
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["year"] = df["timestamp"].dt.year
-    df["month"] = df["timestamp"].dt.month
+    df = normalize_timeseries(data, ["timestamp", "value"])
+    df["year"] = calendar_field(df["timestamp"], "year")
+    df["month"] = calendar_field(df["timestamp"], "month")
 
     opt_date = pd.to_datetime(date_optimization)
     before = df[df["timestamp"] < opt_date]
@@ -272,11 +268,9 @@ def plot_seasonal_polar(
     """
     import plotly.express as px
 
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["year"] = df["timestamp"].dt.year
-    df["month"] = df["timestamp"].dt.month
+    df = normalize_timeseries(data, ["timestamp", "value"])
+    df["year"] = calendar_field(df["timestamp"], "year")
+    df["month"] = calendar_field(df["timestamp"], "month")
 
     years = sorted(df["year"].unique())
     colors = px.colors.sample_colorscale(
@@ -315,10 +309,14 @@ def plot_density_seasons(
     xlab: str = "Value",
     ylab: str = "Density",
     colors: Optional[Dict[str, str]] = None,
+    weights: Optional[str] = None,
 ) -> go.Figure:
     """
     Create a kernel density plot of a value column, one curve per season.
 
+    The Gaussian kernel density uses Silverman's bandwidth and is computed
+    by linear binning and FFT convolution, so it scales to millions of samples.
+
     Args:
         data: DataFrame with two columns: timestamp and value.
         title: Plot title.
@@ -326,48 +324,43 @@ def plot_density_seasons(
         ylab: Y-axis label.
         colors: Season color overrides keyed by season name.
             Default uses ``DEFAULT_SEASON_COLORS``.
+        weights: Optional column of *data* with sample weights
+            (e.g. sample durations). Default weighs all samples equally.
 
     Returns:
         go.Figure: Plotly figure with one density trace per season.
     """
-    import numpy as np
+    from pyedautils._plot_utils import binned_kde
     from pyedautils.data_prep.season import get_season
 
     c = {**DEFAULT_SEASON_COLORS, **(colors or {})}
 
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["season"] = get_season(df["timestamp"])
+    df = normalize_timeseries(data.iloc[:, :2], ["timestamp", "value"])
+    if weights is not None:
+        df["weight"] = data[weights].to_numpy(dtype=float)
+    df = df[df["value"].notna()]
+    season = get_season(df["timestamp"]).to_numpy()
 
     fig = go.Figure()
 
-    for season in ["Spring", "Summer", "Fall", "Winter"]:
-        subset = df[df["season"] == season]["value"].dropna()
-        if subset.empty:
+    for name in ["Spring", "Summer", "Fall", "Winter"]:
+        mask = season == name
+        if not mask.any():
             continue
 
-        # Kernel density estimation using numpy histogram
-        values = subset.values
-        n_bins = 200
+        values = df["value"].to_numpy(dtype=float)[mask]
         x_min, x_max = values.min(), values.max()
         padding = (x_max - x_min) * 0.15
-        x_grid = np.linspace(x_min - padding, x_max + padding, n_bins)
-
-        # Gaussian KDE via scipy-free approach: histogram + smoothing
-        from numpy import exp, sqrt, pi
-        bandwidth = 1.06 * values.std() * len(values) ** (-1 / 5)
-        density = np.zeros_like(x_grid)
-        for v in values:
-            density += exp(-0.5 * ((x_grid - v) / bandwidth) ** 2)
-        density /= (len(values) * bandwidth * sqrt(2 * pi))
+        x_grid = np.linspace(x_min - padding, x_max + padding, 200)
+        w = df["weight"].to_numpy()[mask] if weights is not None else None
+        density = binned_kde(values, x_grid, weights=w)
 
         fig.add_trace(go.Scatter(
             x=x_grid,
             y=density,
             mode="lines",
-            name=season,
-            line=dict(color=c.get(season, "#999"), width=2),
+            name=name,
+            line=dict(color=c.get(name, "#999"), width=2),
         ))
 
     fig.update_layout(
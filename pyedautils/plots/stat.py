@@ -2,10 +2,13 @@
 
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from pyedautils._plot_utils import DEFAULT_MAX_POINTS
+
 
 def plot_sum_frequency(
     data: pd.DataFrame,
@@ -36,23 +39,16 @@ def plot_sum_frequency(
     Returns:
         go.Figure
     """
-    import numpy as np
+    from pyedautils.data_prep._timestamps import calendar_field, normalize_timeseries, time_codes
 
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    df = normalize_timeseries(data, ["timestamp", "value"])
 
     if year is not None:
-        df = df[df["timestamp"].dt.year == year]
+        df = df[calendar_field(df["timestamp"], "year") == year]
 
-    if resolution == "daily":
-        df["day"] = df["timestamp"].dt.date
-        agg = df.groupby("day")["value"].mean().dropna()
-        freq_label = "days"
-    else:
-        df["hour"] = df["timestamp"].dt.floor("h")
-        agg = df.groupby("hour")["value"].mean().dropna()
-        freq_label = "hours"
+    unit = "day" if resolution == "daily" else "hour"
+    agg = df.groupby(time_codes(df["timestamp"], unit))["value"].mean().dropna()
+    freq_label = f"{unit}s"
 
     sorted_vals = np.sort(agg.values)
     if reverse:
@@ -92,6 +88,8 @@ def plot_decomposition(
     title: str = "Time Series Decomposition",
     ylab: str = "Value",
     digits: int = 1,
+    max_points: Optional[int] = DEFAULT_MAX_POINTS,
+    downsample: str = "minmax",
 ) -> go.Figure:
     """
     Decompose a time series into trend, seasonal, and remainder using STL.
@@ -109,17 +107,20 @@ def plot_decomposition(
         title: Plot title.
         ylab: Y-axis label for the raw data panel.
         digits: Decimal places for rounding. Default 1.
+        max_points: Maximum points drawn per component; the decomposition
+            itself uses all data. *None* draws every point. Default 20000.
+        downsample: Downsampling method, "minmax" (keeps peaks) or "lttb"
+            (Largest-Triangle-Three-Buckets). Default "minmax".
 
     Returns:
         go.Figure: Plotly figure with 4 subplot rows
         (observed, trend, seasonal, remainder).
     """
     from statsmodels.tsa.seasonal import STL
+    from pyedautils._plot_utils import downsample_indices
+    from pyedautils.data_prep._timestamps import normalize_timeseries
 
-    df = data.copy()
-    df.columns = ["timestamp", "value"]
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df = df.sort_values("timestamp").reset_index(drop=True)
+    df = normalize_timeseries(data, ["timestamp", "value"], sort=True)
 
     # Auto-detect period from frequency
     if period is None:
@@ -159,11 +160,12 @@ def plot_decomposition(
     timestamps = df["timestamp"]
 
     for i, (name, values) in enumerate(components.items(), start=1):
-        rounded = [round(v, digits) for v in values]
+        values = np.asarray(values, dtype=float)
+        idx = downsample_indices(timestamps, values, max_points, downsample)
         fig.add_trace(
             go.Scatter(
-                x=timestamps,
-                y=rounded,
+                x=timestamps.iloc[idx],
+                y=np.round(values[idx], digits),
                 mode="lines",
                 name=name,
                 line=dict(color="black", width=1),
@@ -193,6 +195,8 @@ def plot_timeseries(
     ylab: str = "Value",
     range_slider: bool = True,
     height: int = 400,
+    max_points: Optional[int] = DEFAULT_MAX_POINTS,
+    downsample: str = "minmax",
 ) -> go.Figure:
     """
     Create an interactive line plot with an optional range slider.
@@ -207,17 +211,31 @@ def plot_timeseries(
         ylab: Y-axis label.
         range_slider: Show a range slider below the plot. Default True.
         height: Figure height in pixels. Default 400.
+        max_points: Maximum points per trace. Long series are downsampled
+            with a budget of ``max_points / len(columns)`` per column, and the
+            rows kept for any column are drawn for all. *None* draws every
+            point. Default 20000.
+        downsample: Downsampling method, "minmax" (keeps peaks) or "lttb"
+            (Largest-Triangle-Three-Buckets). Default "minmax".
 
     Returns:
         go.Figure: Plotly figure with line traces and optional range slider.
     """
     import plotly.express as px
+    from pyedautils._plot_utils import downsample_indices
 
-    df = data.copy()
+    df = data
 
     if columns is None:
         columns = list(df.columns)
 
+    if max_points is not None and len(df) > max_points:
+        budget = max(max_points // max(len(columns), 1), 8)
+        idx = np.unique(np.concatenate(
+            [downsample_indices(df.index, df[c], budget, downsample) for c in columns]
+        ))
+        df = df.iloc[idx]
+
     fig = px.line(df, y=columns, title=title)
 
     if range_slider:
@@ -357,6 +375,8 @@ def plot_outliers(
     title: Optional[str] = None,
     ylab: str = "Value",
     height: int = 400,
+    max_points: Optional[int] = DEFAULT_MAX_POINTS,
+    downsample: str = "minmax",
 ) -> go.Figure:
     """
     Visualize IQR-based outliers on a time series plot.
@@ -371,10 +391,15 @@ def plot_outliers(
         title: Plot title. Auto-generated if *None*.
         ylab: Y-axis label.
         height: Figure height in pixels. Default 400.
+        max_points: Maximum points of the time series line; outlier markers
+            are always drawn. *None* draws every point. Default 20000.
+        downsample: Downsampling method, "minmax" (keeps peaks) or "lttb"
+            (Largest-Triangle-Three-Buckets). Default "minmax".
 
     Returns:
         go.Figure: Plotly figure with time series, outlier markers, and fences.
     """
+    from pyedautils._plot_utils import downsample_indices
     from pyedautils.data_quality import calc_outliers
 
     if column is None:
@@ -390,9 +415,10 @@ def plot_outliers(
 
     fig = go.Figure()
 
+    idx = downsample_indices(data.index, data[column], max_points, downsample)
     fig.add_trace(go.Scatter(
-        x=data.index,
-        y=data[column],
+        x=data.index[idx],
+        y=data[column].iloc[idx],
         mode="lines",
         name="Normal",
         line=dict(width=0.5),
@@ -558,7 +584,6 @@ def plot_autocorrelation(
         go.Figure: Plotly bar chart of autocorrelation values with a
         95% confidence band.
     """
-    import numpy as np
     from statsmodels.tsa.stattools import acf
 
     df = data.copy()
@@ -0,0 +1,267 @@
+"""Vectorised psychrometric state conversions for moist air.
+
+Every function broadcasts over scalars and numpy arrays (or pandas Series)
+and evaluates the same physics as the Mollier h,x-diagram
+(Glück, "Zustands- und Stoffwerte — Wasser — Dampf — Luft"). Inputs are cast
+to *dtype* once, so ``dtype=np.float32`` halves the memory of large sensor
+arrays; the default is float64. Scalar inputs return Python floats.
+
+For very large datasets, :func:`use_p_sat_table` switches saturation pressure
+and its inverse to a precomputed lookup table (see the function for accuracy).
+
+Units:
+    t — temperature [°C]
+    phi — relative humidity [0–1]
+    x — absolute humidity [kg/kg dry air]
+    p — total pressure [Pa]
+"""
+
+from typing import Iterable, Iterator, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pyedautils import _mollier
+
+DEFAULT_PRESSURE = 101325.0
+
+
+def _cast(dtype, *values):
+    """Cast all *values* to *dtype* arrays."""
+    return tuple(np.asarray(v, dtype=dtype) for v in values)
+
+
+def use_p_sat_table(enabled: bool = True) -> None:
+    """
+    Switches saturation pressure and its inverse to a precomputed lookup table.
+
+    The table holds ln(p_sat) from -40 to 80 °C in 0.01 K steps and is built
+    once on first use. It affects every function of this module and the
+    Mollier diagram. Versus the exact formulas the max relative error of
+    saturation pressure is 1e-7 and the max error of
+    :func:`saturation_temperature` is 6e-7 K. Values outside the range are
+    computed exactly.
+
+    Args:
+        enabled (bool, optional): *True* to use the table, *False* for the exact
+            formulas. Default True.
+    """
+    _mollier.set_p_sat_table(enabled)
+
+
+def p_sat(t, dtype=np.float64):
+    """
+    Returns the saturation vapour pressure over water (ice below 0.01 °C).
+
+    Args:
+        t: Temperature [°C].
+        dtype: Floating dtype of the computation and result. Default float64.
+
+    Returns:
+        Saturation vapour pressure [Pa].
+    """
+    return _mollier.p_sat(*_cast(dtype, t))
+
+
+def saturation_temperature(p_s, dtype=np.float64):
+    """
+    Returns the temperature at which *p_s* is the saturation vapour pressure.
+
+    Args:
+        p_s: Saturation vapour pressure [Pa].
+        dtype: Floating dtype of the result. Default float64.
+
+    Returns:
+        Temperature [°C].
+    """
+    return _mollier.temperature_p_sat(*_cast(dtype, p_s))
+
+
+def abs_humidity(t, phi, p=DEFAULT_PRESSURE, dtype=np.float64):
+    """
+    Returns the absolute humidity (humidity ratio) of moist air.
+
+    Args:
+        t: Temperature [°C].
+        phi: Relative humidity [0–1].
+        p: Total pressure [Pa]. Default 101325.
+        dtype: Floating dtype of the computation and result. Default float64.
+
+    Returns:
+        Absolute humidity [kg/kg].
+    """
+    t, phi, p = _cast(dtype, t, phi, p)
+    return _mollier._scalar_or_array(phi * _mollier.K / (p / _mollier.p_sat(t) - phi))
+
+
+def rel_humidity(t, x, p=DEFAULT_PRESSURE, dtype=np.float64):
+    """
+    Returns the relative humidity of moist air.
+
+    Args:
+        t: Temperature [°C].
+        x: Absolute humidity [kg/kg].
+        p: Total pressure [Pa]. Default 101325.
+        dtype: Floating dtype of the computation and result. Default float64.
+
+    Returns:
+        Relative humidity [0–1].
+    """
+    t, x, p = _cast(dtype, t, x, p)
+    return _mollier._scalar_or_array(x / (_mollier.K + x) * p / _mollier.p_sat(t))
+
+
+def dew_point(t, phi, dtype=np.float64):
+    """
+    Returns the dew point (frost point below 0.01 °C) of moist air.
+
+    Args:
+        t: Temperature [°C].
+        phi: Relative humidity [0–1].
+        dtype: Floating dtype of the result. Default float64.
+
+    Returns:
+        Dew point [°C]; NaN where *phi* is zero.
+    """
+    t, phi = _cast(dtype, t, phi)
+    p_v = phi * _mollier.p_sat(t)
+    return _mollier.temperature_p_sat(np.where(p_v > 0, p_v, np.nan))
+
+
+def enthalpy(t, x, dtype=np.float64):
+    """
+    Returns the specific enthalpy of moist air, as used in the Mollier diagram.
+
+    Args:
+        t: Temperature [°C].
+        x: Absolute humidity [kg/kg].
+        dtype: Floating dtype of the computation and result. Default float64.
+
+    Returns:
+        Enthalpy [kJ/kg].
+    """
+    t, x = _cast(dtype, t, x)
+    return _mollier.enthalpy(x, _mollier._t_to_y(t, x))
+
+
+def density(t, x, p=DEFAULT_PRESSURE, dtype=np.float64):
+    """
+    Returns the density of moist air.
+
+    Args:
+        t: Temperature [°C].
+        x: Absolute humidity [kg/kg].
+        p: Total pressure [Pa]. Default 101325.
+        dtype: Floating dtype of the computation and result. Default float64.
+
+    Returns:
+        Density [kg/m³].
+    """
+    t, x, p = _cast(dtype, t, x, p)
+    return _mollier._scalar_or_array(
+        p / (_mollier.R_W * (_mollier.K_0C + t)) * (1 + x) / (_mollier.K + x) / 1000)
+
+
+def mollier_xy(t, phi, p=DEFAULT_PRESSURE, dtype=np.float64) -> Tuple:
+    """
+    Returns the Mollier h,x-diagram coordinates of moist air.
+
+    Args:
+        t: Temperature [°C].
+        phi: Relative humidity [0–1].
+        p: Total pressure [Pa]. Default 101325.
+        dtype: Floating dtype of the computation and result. Default float64.
+
+    Returns:
+        tuple (x, y): Absolute humidity [kg/kg] and diagram y-coordinate [°C].
+    """
+    return _mollier.get_x_y(*_cast(dtype, t, phi, p))
+
+
+def mollier_state(x, y, p=DEFAULT_PRESSURE, dtype=np.float64) -> Tuple:
+    """
+    Returns temperature and relative humidity for Mollier diagram coordinates.
+
+    Args:
+        x: Absolute humidity [kg/kg].
+        y: Diagram y-coordinate [°C].
+        p: Total pressure [Pa]. Default 101325.
+        dtype: Floating dtype of the computation and result. Default float64.
+
+    Returns:
+        tuple (t, phi): Temperature [°C] and relative humidity [0–1].
+    """
+    x, y, p = _cast(dtype, x, y, p)
+    return _mollier.temperature(x, y), _mollier.rel_humidity(x, y, p)
+
+
+PSYCHRO_COLUMNS = ("abs_humidity", "enthalpy", "dew_point", "density", "mollier_y")
+
+
+def _enrich_frame(df: pd.DataFrame, temperature: str, humidity: str,
+                  pressure: Union[str, float], dtype, chunksize: int) -> pd.DataFrame:
+    """Append the psychrometric columns to one DataFrame."""
+    n = len(df)
+    out = {name: np.empty(n, dtype=dtype) for name in PSYCHRO_COLUMNS}
+    t_all = df[temperature].to_numpy(dtype=dtype)
+    phi_all = df[humidity].to_numpy(dtype=dtype)
+    p_all = df[pressure].to_numpy(dtype=dtype) if isinstance(pressure, str) else None
+
+    for start in range(0, n, chunksize):
+        sl = slice(start, min(start + chunksize, n))
+        t = t_all[sl]
+        phi = phi_all[sl] / 100
+        p = p_all[sl] if p_all is not None else np.asarray(pressure, dtype=dtype)
+
+        ps = _mollier.p_sat(t)
+        x = phi * _mollier.K / (p / ps - phi)
+        y = _mollier._t_to_y(t, x)
+        p_v = phi * ps
+
+        out["abs_humidity"][sl] = x
+        out["enthalpy"][sl] = _mollier.enthalpy(x, y)
+        out["dew_point"][sl] = _mollier.temperature_p_sat(np.where(p_v > 0, p_v, np.nan))
+        out["density"][sl] = _mollier.density(x, y, p)
+        out["mollier_y"][sl] = y
+
+    result = df.copy(deep=False)
+    for name, values in out.items():
+        result[name] = values
+    return result
+
+
+def enrich_psychrometrics(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    temperature: str = "temperature",
+    humidity: str = "humidity",
+    pressure: Union[str, float] = DEFAULT_PRESSURE,
+    dtype=np.float64,
+    chunksize: int = 1_000_000,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Appends psychrometric quantities to sensor data.
+
+    Adds the columns ``abs_humidity`` [kg/kg] (the Mollier x-coordinate),
+    ``enthalpy`` [kJ/kg], ``dew_point`` [°C], ``density`` [kg/m³] and
+    ``mollier_y`` [°C]. Output columns are preallocated and filled in slices
+    of *chunksize* rows, which bounds the temporary memory. Pass an iterator
+    of DataFrames (e.g. ``pd.read_csv(..., chunksize=...)``) to stream data
+    that does not fit in memory.
+
+    Args:
+        data (pd.DataFrame or iterable of pd.DataFrame): Sensor data.
+        temperature (str, optional): Temperature column [°C]. Default "temperature".
+        humidity (str, optional): Relative humidity column [%rH]. Default "humidity".
+        pressure (str or float, optional): Pressure column name or constant
+            pressure [Pa]. Default 101325.
+        dtype: Floating dtype of the computation and output columns. Default float64.
+        chunksize (int, optional): Rows per computation slice. Default 1,000,000.
+
+    Returns:
+        pd.DataFrame or iterator of pd.DataFrame: The input with the new columns
+            appended; an iterator if *data* is an iterable of DataFrames.
+    """
+    if isinstance(data, pd.DataFrame):
+        return _enrich_frame(data, temperature, humidity, pressure, dtype, chunksize)
+    return (_enrich_frame(chunk, temperature, humidity, pressure, dtype, chunksize)
+            for chunk in data)
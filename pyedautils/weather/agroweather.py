@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 import logging
 
 import pandas as pd
-import requests
 
+from pyedautils.http_client import async_http_get, http_get
 from pyedautils.geopy import (
+    aget_coordindates_ch_plz,
     get_distance_between_two_points,
     get_coordindates_ch_plz,
 )
@@ -19,6 +21,28 @@ SENSOR_MAP = {
     "rain": 6,
 }
 
+STATIONS_ENDPOINT = "https://www.agrometeo.ch/backend/api/map/models/17/stations"
+
+
+def _parse_station_data(data) -> pd.DataFrame:
+    """Converts the agrometeo.ch stations response into a DataFrame."""
+    stations = data.get("data", data)
+
+    rows = []
+    for station in stations:
+        rows.append({
+            "id": station["id"],
+            "name": station.get("name", ""),
+            "lat": float(station.get("lat_dec", 0)),
+            "lon": float(station.get("long_dec", 0)),
+            "altitude": station.get("altitude"),
+            "sensors": [s["id"] for s in station.get("sensors", [])],
+        })
+
+    df = pd.DataFrame(rows)
+    logger.info("Fetched %d agrometeo stations", len(df))
+    return df
+
 
 def get_station_data() -> pd.DataFrame:
     """
@@ -28,50 +52,38 @@ def get_station_data() -> pd.DataFrame:
         pd.DataFrame: DataFrame with station info (id, name, lat, lon, altitude, sensors).
     """
     try:
-        endpoint = "https://www.agrometeo.ch/backend/api/map/models/17/stations"
-        response = requests.get(endpoint, timeout=30)
+        response = http_get(STATIONS_ENDPOINT, timeout=30)
         response.raise_for_status()
-        data = response.json()
-
-        stations = data.get("data", data)
-
-        rows = []
-        for station in stations:
-            rows.append({
-                "id": station["id"],
-                "name": station.get("name", ""),
-                "lat": float(station.get("lat_dec", 0)),
-                "lon": float(station.get("long_dec", 0)),
-                "altitude": station.get("altitude"),
-                "sensors": [s["id"] for s in station.get("sensors", [])],
-            })
-
-        df = pd.DataFrame(rows)
-        logger.info("Fetched %d agrometeo stations", len(df))
-        return df
+        return _parse_station_data(response.json())
     except Exception as e:
         raise ValueError(f"Error fetching agrometeo station data: {e}") from e
 
 
-def find_nearest_station(lat: float, lon: float, sensor: str = None) -> int:
+async def aget_station_data() -> pd.DataFrame:
     """
-    Returns station ID of the closest agrometeo.ch station to a coordinate.
-
-    Args:
-        lat (float): Latitude in decimal degrees.
-        lon (float): Longitude in decimal degrees.
-        sensor (str, optional): Filter by sensor type: temp, globrad, relhum, or rain.
+    Async counterpart of :func:`get_station_data`.
 
     Returns:
-        int: Agrometeo station ID.
+        pd.DataFrame: DataFrame with station info (id, name, lat, lon, altitude, sensors).
     """
+    try:
+        response = await async_http_get(STATIONS_ENDPOINT, timeout=30)
+        response.raise_for_status()
+        return _parse_station_data(response.json())
+    except Exception as e:
+        raise ValueError(f"Error fetching agrometeo station data: {e}") from e
+
+
+def _check_sensor(sensor: str) -> None:
+    """Raises ValueError for unknown sensor types."""
     if sensor is not None and sensor not in SENSOR_MAP:
         raise ValueError(
             f"Unknown sensor type: {sensor}. Must be one of {list(SENSOR_MAP.keys())}"
         )
 
-    stations = get_station_data()
 
+def _nearest_station(stations: pd.DataFrame, lat: float, lon: float, sensor: str = None) -> int:
+    """Returns the ID of the station closest to (*lat*, *lon*) having *sensor*."""
     if sensor is not None:
         sensor_id = SENSOR_MAP[sensor]
         stations = stations[stations["sensors"].apply(lambda s: sensor_id in s)]
@@ -98,50 +110,55 @@ def find_nearest_station(lat: float, lon: float, sensor: str = None) -> int:
     return int(nearest["id"])
 
 
-def download_data(
-    station_id: int,
-    start_date: str,
-    end_date: str,
-    sensors: list = None,
-) -> pd.DataFrame:
+def find_nearest_station(lat: float, lon: float, sensor: str = None) -> int:
     """
-    Downloads hourly weather data from agrometeo.ch for a station.
+    Returns station ID of the closest agrometeo.ch station to a coordinate.
 
     Args:
-        station_id (int): Agrometeo station ID.
-        start_date (str): Start date in 'YYYY-MM-DD' format.
-        end_date (str): End date in 'YYYY-MM-DD' format.
-        sensors (list, optional): List of sensor types to download.
-            Defaults to ["temp", "globrad", "relhum", "rain"].
+        lat (float): Latitude in decimal degrees.
+        lon (float): Longitude in decimal degrees.
+        sensor (str, optional): Filter by sensor type: temp, globrad, relhum, or rain.
 
     Returns:
-        pd.DataFrame: DataFrame with datetime index and sensor columns.
+        int: Agrometeo station ID.
     """
-    if sensors is None:
-        sensors = ["temp", "globrad", "relhum", "rain"]
+    _check_sensor(sensor)
+    return _nearest_station(get_station_data(), lat, lon, sensor=sensor)
+
+
+async def afind_nearest_station(lat: float, lon: float, sensor: str = None) -> int:
+    """
+    Async counterpart of :func:`find_nearest_station`.
+
+    Args:
+        lat (float): Latitude in decimal degrees.
+        lon (float): Longitude in decimal degrees.
+        sensor (str, optional): Filter by sensor type: temp, globrad, relhum, or rain.
+
+    Returns:
+        int: Agrometeo station ID.
+    """
+    _check_sensor(sensor)
+    return _nearest_station(await aget_station_data(), lat, lon, sensor=sensor)
+
 
+def _download_url(station_id: int, start_date: str, end_date: str, sensors: list) -> str:
+    """Validates the sensor types and builds the agrometeo.ch data query."""
     for s in sensors:
-        if s not in SENSOR_MAP:
-            raise ValueError(
-                f"Unknown sensor type: {s}. Must be one of {list(SENSOR_MAP.keys())}"
-            )
+        _check_sensor(s)
 
     sensor_ids = [str(SENSOR_MAP[s]) for s in sensors]
     sensor_param = "%2C".join(sensor_ids)
 
-    url = (
+    return (
         f"https://www.agrometeo.ch/backend/api/meteo/data"
         f"?stations={station_id}&from={start_date}&to={end_date}"
         f"&sensors={sensor_param}&scale=hour"
     )
 
-    try:
-        response = requests.get(url, timeout=60)
-        response.raise_for_status()
-        data = response.json()
-    except Exception as e:
-        raise ValueError(f"Error downloading agrometeo data: {e}") from e
 
+def _parse_download_data(data, station_id: int, start_date: str, end_date: str) -> pd.DataFrame:
+    """Converts the agrometeo.ch data response into a DataFrame."""
     try:
         entries = data.get("data", [])
         if not entries:
@@ -174,6 +191,74 @@ def download_data(
         raise ValueError(f"Error parsing agrometeo data: {e}") from e
 
 
+def download_data(
+    station_id: int,
+    start_date: str,
+    end_date: str,
+    sensors: list = None,
+) -> pd.DataFrame:
+    """
+    Downloads hourly weather data from agrometeo.ch for a station.
+
+    Args:
+        station_id (int): Agrometeo station ID.
+        start_date (str): Start date in 'YYYY-MM-DD' format.
+        end_date (str): End date in 'YYYY-MM-DD' format.
+        sensors (list, optional): List of sensor types to download.
+            Defaults to ["temp", "globrad", "relhum", "rain"].
+
+    Returns:
+        pd.DataFrame: DataFrame with datetime index and sensor columns.
+    """
+    if sensors is None:
+        sensors = ["temp", "globrad", "relhum", "rain"]
+
+    url = _download_url(station_id, start_date, end_date, sensors)
+
+    try:
+        response = http_get(url, timeout=60)
+        response.raise_for_status()
+        data = response.json()
+    except Exception as e:
+        raise ValueError(f"Error downloading agrometeo data: {e}") from e
+
+    return _parse_download_data(data, station_id, start_date, end_date)
+
+
+async def adownload_data(
+    station_id: int,
+    start_date: str,
+    end_date: str,
+    sensors: list = None,
+) -> pd.DataFrame:
+    """
+    Async counterpart of :func:`download_data`.
+
+    Args:
+        station_id (int): Agrometeo station ID.
+        start_date (str): Start date in 'YYYY-MM-DD' format.
+        end_date (str): End date in 'YYYY-MM-DD' format.
+        sensors (list, optional): List of sensor types to download.
+            Defaults to ["temp", "globrad", "relhum", "rain"].
+
+    Returns:
+        pd.DataFrame: DataFrame with datetime index and sensor columns.
+    """
+    if sensors is None:
+        sensors = ["temp", "globrad", "relhum", "rain"]
+
+    url = _download_url(station_id, start_date, end_date, sensors)
+
+    try:
+        response = await async_http_get(url, timeout=60)
+        response.raise_for_status()
+        data = response.json()
+    except Exception as e:
+        raise ValueError(f"Error downloading agrometeo data: {e}") from e
+
+    return _parse_download_data(data, station_id, start_date, end_date)
+
+
 def download_data_by_plz(
     plz: int,
     start_date: str,
@@ -221,3 +306,53 @@ def download_data_by_plz(
         return pd.DataFrame()
 
     return result
+
+
+async def adownload_data_by_plz(
+    plz: int,
+    start_date: str,
+    end_date: str,
+    sensors: list = None,
+) -> pd.DataFrame:
+    """
+    Async counterpart of :func:`download_data_by_plz`.
+
+    The station list is fetched once and the downloads for all stations
+    run concurrently.
+
+    Args:
+        plz (int): Swiss postal code (Postleitzahl).
+        start_date (str): Start date in 'YYYY-MM-DD' format.
+        end_date (str): End date in 'YYYY-MM-DD' format.
+        sensors (list, optional): List of sensor types to download.
+            Defaults to ["temp", "globrad", "relhum", "rain"].
+
+    Returns:
+        pd.DataFrame: DataFrame with datetime index and sensor columns.
+    """
+    if sensors is None:
+        sensors = ["temp", "globrad", "relhum", "rain"]
+    for sensor in sensors:
+        _check_sensor(sensor)
+
+    lat, lon = await aget_coordindates_ch_plz(plz)
+    logger.info("PLZ %d resolved to lat=%.4f, lon=%.4f", plz, lat, lon)
+
+    if not sensors:
+        return pd.DataFrame()
+
+    stations = await aget_station_data()
+    station_sensors = {}
+    for sensor in sensors:
+        station_id = _nearest_station(stations, lat, lon, sensor=sensor)
+        station_sensors.setdefault(station_id, []).append(sensor)
+
+    frames = await asyncio.gather(*(
+        adownload_data(station_id, start_date, end_date, sensors=sensor_list)
+        for station_id, sensor_list in station_sensors.items()
+    ))
+
+    result = frames[0]
+    for df in frames[1:]:
+        result = result.join(df, how="outer")
+    return result
@@ -1,13 +1,27 @@
 # -*- coding: utf-8 -*-
 
+import io
 import logging
 
 import pandas as pd
 from pyedautils.geopy import get_distance_between_two_points
+from pyedautils.http_client import async_http_get, http_get
 
 logger = logging.getLogger(__name__)
 
 
+STATIONS_ENDPOINT = (
+    "https://data.geo.admin.ch/ch.meteoschweiz.messnetz-automatisch/"
+    "ch.meteoschweiz.messnetz-automatisch_de.csv"
+)
+
+
+def _parse_station_data(content: bytes) -> pd.DataFrame:
+    """Parses the Meteo Swiss station CSV and keeps stations with measurements."""
+    data = pd.read_csv(io.BytesIO(content), encoding='unicode_escape', sep=";")
+    return data[data['Messungen'].notna()]
+
+
 def get_current_station_data() -> pd.DataFrame:
     """
     Gets current measurement data of all Meteo Swiss stations.
@@ -16,14 +30,85 @@ def get_current_station_data() -> pd.DataFrame:
         pd.DataFrame: DataFrame with station data.
     """
     try:
-        endpoint = "https://data.geo.admin.ch/ch.meteoschweiz.messnetz-automatisch/ch.meteoschweiz.messnetz-automatisch_de.csv"
-        data = pd.read_csv(endpoint, encoding='unicode_escape', sep=";")
-        df = data[data['Messungen'].notna()]
-        return df
+        response = http_get(STATIONS_ENDPOINT, timeout=30)
+        response.raise_for_status()
+        return _parse_station_data(response.content)
+    except Exception as e:
+        raise ValueError(f"Error in getting data: {e}") from e
+
+
+async def aget_current_station_data() -> pd.DataFrame:
+    """
+    Async counterpart of :func:`get_current_station_data`.
+
+    Returns:
+        pd.DataFrame: DataFrame with station data.
+    """
+    try:
+        response = await async_http_get(STATIONS_ENDPOINT, timeout=30)
+        response.raise_for_status()
+        return _parse_station_data(response.content)
     except Exception as e:
         raise ValueError(f"Error in getting data: {e}") from e
 
 
+def _check_coordinates(lat: float, long: float) -> None:
+    """Raises ValueError for coordinates outside Switzerland."""
+    switzerland_lat_min = 45.67
+    switzerland_lat_max = 47.92
+    switzerland_long_min = 5.7
+    switzerland_long_max = 10.7
+
+    if not (switzerland_lat_min <= lat <= switzerland_lat_max and
+            switzerland_long_min <= long <= switzerland_long_max):
+        raise ValueError("Coordinates not in range for Swiss coordinate system")
+
+
+def _nearest_station(all_station_data: pd.DataFrame, lat: float, long: float,
+                     altitude: float, sensor: str) -> str:
+    """Returns the closest station within 150 m altitude that measures *sensor*."""
+
+    lats = all_station_data["Breitengrad"].astype("float")
+    lons = all_station_data["Längengrad"].astype("float")
+
+    distances = pd.DataFrame(
+        [get_distance_between_two_points((lat, long), (lats[i], lons[i]))
+         for i in range(len(lats))]
+    )
+    distances.columns = ['value']
+    distances = distances.sort_values(by='value')
+    distances = distances.reset_index()
+
+    sensor_map = {
+        "temp": "Temperatur",
+        "globrad": "Globalstrahlung",
+        "relhum": "Feuchte",
+        "rain": "Niederschlag",
+    }
+
+    if sensor not in sensor_map:
+        raise ValueError(f"Unknown sensor type: {sensor}. Must be one of {list(sensor_map.keys())}")
+
+    sensor_keyword = sensor_map[sensor]
+
+    i = 0
+    while i < len(distances):
+        id = distances.loc[i, "index"]
+        sensors = all_station_data.loc[id, "Messungen"]
+        stationID = all_station_data.loc[id, "Abk."]
+        stationIDString = all_station_data.loc[id, "Station"]
+        stationAltitude = float(all_station_data.loc[id, "Stationshöhe m ü. M."])
+        if (float(altitude) > (stationAltitude - 150.0)) and (float(altitude) < (stationAltitude + 150.0)):
+            if sensor_keyword in sensors:
+                logger.info("Closest station for %s: %s", sensor, stationIDString)
+                return stationID
+        i += 1
+
+    raise ValueError(
+        f"No station found for sensor '{sensor}' within 150m altitude of {altitude}m"
+    )
+
+
 def find_nearest_station(lat: float, long: float, altitude: float, sensor: str) -> str:
     """
     Returns station id of closest meteo swiss station to a coordinate.
@@ -38,56 +123,29 @@ def find_nearest_station(lat: float, long: float, altitude: float, sensor: str)
         str: Meteo Swiss station ID
     """
     try:
-        switzerland_lat_min = 45.67
-        switzerland_lat_max = 47.92
-        switzerland_long_min = 5.7
-        switzerland_long_max = 10.7
+        _check_coordinates(lat, long)
+        all_station_data = get_current_station_data()
+        return _nearest_station(all_station_data, lat, long, altitude, sensor)
+    except Exception as e:
+        raise ValueError(f"Error in getting data: {e}") from e
 
-        if not (switzerland_lat_min <= lat <= switzerland_lat_max and
-                switzerland_long_min <= long <= switzerland_long_max):
-            raise ValueError("Coordinates not in range for Swiss coordinate system")
 
-        all_station_data = get_current_station_data()
+async def afind_nearest_station(lat: float, long: float, altitude: float, sensor: str) -> str:
+    """
+    Async counterpart of :func:`find_nearest_station`.
 
-        lats = all_station_data["Breitengrad"].astype("float")
-        lons = all_station_data["Längengrad"].astype("float")
-
-        distances = pd.DataFrame(
-            [get_distance_between_two_points((lat, long), (lats[i], lons[i]))
-             for i in range(len(lats))]
-        )
-        distances.columns = ['value']
-        distances = distances.sort_values(by='value')
-        distances = distances.reset_index()
-
-        sensor_map = {
-            "temp": "Temperatur",
-            "globrad": "Globalstrahlung",
-            "relhum": "Feuchte",
-            "rain": "Niederschlag",
-        }
-
-        if sensor not in sensor_map:
-            raise ValueError(f"Unknown sensor type: {sensor}. Must be one of {list(sensor_map.keys())}")
-
-        sensor_keyword = sensor_map[sensor]
-
-        i = 0
-        while i < len(distances):
-            id = distances.loc[i, "index"]
-            sensors = all_station_data.loc[id, "Messungen"]
-            stationID = all_station_data.loc[id, "Abk."]
-            stationIDString = all_station_data.loc[id, "Station"]
-            stationAltitude = float(all_station_data.loc[id, "Stationshöhe m ü. M."])
-            if (float(altitude) > (stationAltitude - 150.0)) and (float(altitude) < (stationAltitude + 150.0)):
-                if sensor_keyword in sensors:
-                    logger.info("Closest station for %s: %s", sensor, stationIDString)
-                    return stationID
-            i += 1
-
-        raise ValueError(
-            f"No station found for sensor '{sensor}' within 150m altitude of {altitude}m"
-        )
+    Args:
+        lat (float): Latitude in decimal degrees.
+        long (float): Longitude in decimal degrees.
+        altitude (float): Altitude in meters above sea level.
+        sensor (str): temp, globrad, relhum or rain
 
+    Returns:
+        str: Meteo Swiss station ID
+    """
+    try:
+        _check_coordinates(lat, long)
+        all_station_data = await aget_current_station_data()
+        return _nearest_station(all_station_data, lat, long, altitude, sensor)
     except Exception as e:
         raise ValueError(f"Error in getting data: {e}") from e
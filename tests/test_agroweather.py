@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 import pandas as pd
 
 from pyedautils.weather.agroweather import (
+    adownload_data,
+    adownload_data_by_plz,
+    afind_nearest_station,
+    aget_station_data,
     get_station_data,
     find_nearest_station,
     download_data,
@@ -50,7 +54,7 @@ MOCK_DOWNLOAD_API = {
 
 class TestGetStationData(unittest.TestCase):
 
-    @patch('pyedautils.weather.agroweather.requests.get')
+    @patch('pyedautils.weather.agroweather.http_get')
     def test_returns_dataframe(self, mock_get):
         mock_response = MagicMock()
         mock_response.json.return_value = MOCK_STATIONS_API
@@ -65,7 +69,7 @@ class TestGetStationData(unittest.TestCase):
         self.assertAlmostEqual(result.iloc[0]["lat"], 46.0)
         self.assertAlmostEqual(result.iloc[0]["lon"], 8.9)
 
-    @patch('pyedautils.weather.agroweather.requests.get')
+    @patch('pyedautils.weather.agroweather.http_get')
     def test_network_error(self, mock_get):
         mock_get.side_effect = Exception("Network error")
         with self.assertRaises(ValueError):
@@ -118,7 +122,7 @@ class TestFindNearestStation(unittest.TestCase):
 
 class TestDownloadData(unittest.TestCase):
 
-    @patch('pyedautils.weather.agroweather.requests.get')
+    @patch('pyedautils.weather.agroweather.http_get')
     def test_returns_dataframe(self, mock_get):
         mock_response = MagicMock()
         mock_response.json.return_value = MOCK_DOWNLOAD_API
@@ -131,7 +135,7 @@ class TestDownloadData(unittest.TestCase):
         self.assertIn("temp", result.columns)
         self.assertEqual(result.iloc[0]["temp"], 2.5)
 
-    @patch('pyedautils.weather.agroweather.requests.get')
+    @patch('pyedautils.weather.agroweather.http_get')
     def test_default_sensors(self, mock_get):
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": []}
@@ -142,7 +146,7 @@ class TestDownloadData(unittest.TestCase):
         self.assertIsInstance(result, pd.DataFrame)
         self.assertTrue(result.empty)
 
-    @patch('pyedautils.weather.agroweather.requests.get')
+    @patch('pyedautils.weather.agroweather.http_get')
     def test_empty_data(self, mock_get):
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": []}
@@ -153,13 +157,13 @@ class TestDownloadData(unittest.TestCase):
         self.assertIsInstance(result, pd.DataFrame)
         self.assertTrue(result.empty)
 
-    @patch('pyedautils.weather.agroweather.requests.get')
+    @patch('pyedautils.weather.agroweather.http_get')
     def test_network_error(self, mock_get):
         mock_get.side_effect = Exception("Network error")
         with self.assertRaises(ValueError):
             download_data(1, "2024-01-01", "2024-01-02", sensors=["temp"])
 
-    @patch('pyedautils.weather.agroweather.requests.get')
+    @patch('pyedautils.weather.agroweather.http_get')
     def test_parse_error(self, mock_get):
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
@@ -230,5 +234,80 @@ class TestDownloadDataByPlz(unittest.TestCase):
         self.assertTrue(result.empty)
 
 
+def _mock_async_response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestAsyncAgroweather(unittest.IsolatedAsyncioTestCase):
+
+    @patch('pyedautils.weather.agroweather.async_http_get', new_callable=AsyncMock)
+    async def test_aget_station_data(self, mock_get):
+        mock_get.return_value = _mock_async_response(MOCK_STATIONS_API)
+        result = await aget_station_data()
+        self.assertEqual(len(result), 3)
+
+    @patch('pyedautils.weather.agroweather.async_http_get', new_callable=AsyncMock)
+    async def test_aget_station_data_network_error(self, mock_get):
+        mock_get.side_effect = Exception("Network error")
+        with self.assertRaises(ValueError):
+            await aget_station_data()
+
+    @patch('pyedautils.weather.agroweather.async_http_get', new_callable=AsyncMock)
+    async def test_afind_nearest_station(self, mock_get):
+        mock_get.return_value = _mock_async_response(MOCK_STATIONS_API)
+        result = await afind_nearest_station(46.0, 8.9, sensor="globrad")
+        self.assertEqual(result, 3)
+
+    @patch('pyedautils.weather.agroweather.async_http_get', new_callable=AsyncMock)
+    async def test_adownload_data(self, mock_get):
+        mock_get.return_value = _mock_async_response(MOCK_DOWNLOAD_API)
+        result = await adownload_data(1, "2024-01-01", "2024-01-02", sensors=["temp"])
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result.iloc[0]["temp"], 2.5)
+
+    @patch('pyedautils.weather.agroweather.async_http_get', new_callable=AsyncMock)
+    async def test_adownload_data_network_error(self, mock_get):
+        mock_get.side_effect = Exception("Network error")
+        with self.assertRaises(ValueError):
+            await adownload_data(1, "2024-01-01", "2024-01-02", sensors=["temp"])
+
+    async def test_adownload_data_invalid_sensor(self):
+        with self.assertRaises(ValueError):
+            await adownload_data(1, "2024-01-01", "2024-01-02", sensors=["windspeed"])
+
+    @patch('pyedautils.weather.agroweather.async_http_get', new_callable=AsyncMock)
+    @patch('pyedautils.weather.agroweather.aget_coordindates_ch_plz', new_callable=AsyncMock)
+    async def test_adownload_data_by_plz_fetches_stations_once(self, mock_plz, mock_get):
+        mock_plz.return_value = (46.0, 8.9)
+        download = {
+            "data": [
+                {"date": "2024-01-01 00:00:00", "1_1_avg": "2.5", "1_4_avg": "80"},
+                {"date": "2024-01-01 01:00:00", "1_1_avg": "2.3", "1_4_avg": "81"},
+            ]
+        }
+
+        def side_effect(url, timeout):
+            if "stations" in url and "meteo/data" not in url:
+                return _mock_async_response(MOCK_STATIONS_API)
+            return _mock_async_response(download)
+
+        mock_get.side_effect = side_effect
+        result = await adownload_data_by_plz(6048, "2024-01-01", "2024-01-02",
+                                             sensors=["temp", "relhum"])
+        self.assertEqual(len(result), 2)
+        self.assertIn("temp", result.columns)
+        station_calls = [c for c in mock_get.call_args_list if "map/models" in c.args[0]]
+        self.assertEqual(len(station_calls), 1)
+
+    @patch('pyedautils.weather.agroweather.aget_coordindates_ch_plz', new_callable=AsyncMock)
+    async def test_adownload_data_by_plz_empty_sensors(self, mock_plz):
+        mock_plz.return_value = (47.05, 8.31)
+        result = await adownload_data_by_plz(6048, "2024-01-01", "2024-01-02", sensors=[])
+        self.assertTrue(result.empty)
+
+
 if __name__ == '__main__':
     unittest.main()  # pragma: no cover
@@ -0,0 +1,126 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pyedautils._mollier import create_comfort, get_x_y
+from pyedautils.comfort import comfort_distance, comfort_statistics, in_comfort_zone
+
+
+def _point_in_polygon(x, y, polygon):
+    """Ray casting reference test against the Mollier comfort polygon."""
+    px, py = np.asarray(polygon).T
+    x0, y0, x1, y1 = px[:-1], py[:-1], px[1:], py[1:]
+    crosses = (y0 > y[:, None]) != (y1 > y[:, None])
+    x_cross = (x1 - x0) * (y[:, None] - y0) / (y1 - y0) + x0
+    return (crosses & (x[:, None] < x_cross)).sum(axis=1) % 2 == 1
+
+
+class TestInComfortZone(unittest.TestCase):
+
+    def test_scalar(self):
+        self.assertTrue(in_comfort_zone(22, 0.5))
+        self.assertFalse(in_comfort_zone(30, 0.5))
+        self.assertFalse(in_comfort_zone(float("nan"), 0.5))
+
+    def test_matches_mollier_polygon(self):
+        rng = np.random.default_rng(1)
+        t = rng.uniform(10, 35, 20000)
+        phi = rng.uniform(0, 1, 20000)
+        x, y = get_x_y(t, phi, 101325.0)
+        polygon = create_comfort((20, 26), (0.30, 0.65), (0, 0.0115), 101325.0)
+        inside = in_comfort_zone(t, phi)
+        self.assertGreater(inside.sum(), 0)
+        np.testing.assert_array_equal(inside, _point_in_polygon(x, y, polygon))
+
+    def test_custom_zone_and_abs_humidity_bound(self):
+        zone = {"abs_humidity": (0, 0.008)}
+        self.assertTrue(in_comfort_zone(24, 0.40))
+        self.assertFalse(in_comfort_zone(24, 0.60, zone))
+
+    def test_distance(self):
+        dt, dphi, dx = comfort_distance(18.0, 0.2)
+        self.assertAlmostEqual(dt, -2.0)
+        self.assertAlmostEqual(dphi, -0.1)
+        self.assertEqual(dx, 0.0)
+        dt, dphi, dx = comfort_distance(np.array([23.0, 28.0]), np.array([0.5, 0.5]))
+        np.testing.assert_allclose(dt, [0.0, 2.0])
+        np.testing.assert_allclose(dphi, 0.0)
+        self.assertGreater(dx[1], 0.0)
+
+
+class TestComfortStatistics(unittest.TestCase):
+
+    def setUp(self):
+        index = pd.date_range("2023-01-01", periods=8, freq="30min")
+        self.df = pd.DataFrame({
+            "temperature": [22, 22, 30, 15, 22, np.nan, 22, 22],
+            "humidity": [50, 50, 35, 50, 90, 50, 20, 50],
+            "room": ["A", "B"] * 4,
+        }, index=index)
+
+    def test_total(self):
+        result = comfort_statistics(self.df, by=())
+        row = result.iloc[0]
+        self.assertEqual(row["samples"], 7)
+        self.assertEqual(row["inside"], 3)
+        self.assertEqual(row["too_warm"], 1)
+        self.assertEqual(row["too_cold"], 1)
+        self.assertEqual(row["too_humid"], 1)
+        self.assertEqual(row["too_dry"], 1)
+        self.assertAlmostEqual(row["hours"], 3.5)
+        self.assertAlmostEqual(row["hours_inside"], 1.5)
+
+    def test_by_room_uses_room_interval(self):
+        result = comfort_statistics(self.df, by=("season", "room"), room="room")
+        self.assertEqual(list(result.index), [("Winter", "A"), ("Winter", "B")])
+        self.assertEqual(result.loc[("Winter", "A"), "samples"], 4)
+        self.assertAlmostEqual(result.loc[("Winter", "A"), "hours"], 4.0)
+
+    def test_by_month_with_timestamp_column_and_interval(self):
+        df = self.df.reset_index(names="timestamp")
+        result = comfort_statistics(df, by=("month",), timestamp="timestamp", interval="15min")
+        self.assertEqual(list(result.index), [1])
+        self.assertAlmostEqual(result.loc[1, "share"], 3 / 7)
+        self.assertAlmostEqual(result.loc[1, "hours_inside"], 0.75)
+
+    def test_room_intervals_differ(self):
+        fast = pd.DataFrame({"temperature": 22.0, "humidity": 50.0, "room": "A"},
+                            index=pd.date_range("2023-01-01", periods=12, freq="5min"))
+        slow = pd.DataFrame({"temperature": 22.0, "humidity": 50.0, "room": "B"},
+                            index=pd.date_range("2023-01-01", periods=3, freq="h"))
+        df = pd.concat([fast, slow])
+        result = comfort_statistics(df, by=("room",), room="room")
+        self.assertAlmostEqual(result.loc["A", "hours"], 1.0)
+        self.assertAlmostEqual(result.loc["B", "hours"], 3.0)
+        # grouped by season, every sample still counts for its own room's interval
+        total = comfort_statistics(df, by=("season",), room="room")
+        self.assertAlmostEqual(total.loc["Winter", "hours_inside"], 4.0)
+
+    def test_distance_aggregates(self):
+        result = comfort_statistics(self.df, by=("room",), room="room")
+        # room A: 22/50, 30/35, 22/90, 22/20 -> too warm by 4 K, humid by 0.25, dry by 0.1
+        self.assertAlmostEqual(result.loc["A", "dt_max"], 4.0)
+        self.assertAlmostEqual(result.loc["A", "dt_mean"], 1.0)
+        self.assertAlmostEqual(result.loc["A", "dphi_max"], 0.25)
+        self.assertAlmostEqual(result.loc["A", "dphi_mean"], 0.35 / 4)
+        self.assertGreater(result.loc["A", "dx_max"], 0.0)
+        # room B: 22/50, 15/50, 22/50 -> too cold by 5 K
+        self.assertAlmostEqual(result.loc["B", "dt_mean"], 5 / 3)
+        self.assertEqual(result.loc["B", "dphi_max"], 0.0)
+
+    def test_invalid_grouping(self):
+        with self.assertRaises(ValueError):
+            comfort_statistics(self.df, by=("weekday",))
+        with self.assertRaises(ValueError):
+            comfort_statistics(self.df, by=("room",))
+
+    def test_requires_datetime_index(self):
+        with self.assertRaises(ValueError):
+            comfort_statistics(self.df.reset_index(drop=True))
+        result = comfort_statistics(self.df.reset_index(names="time"), timestamp="time", by=())
+        self.assertEqual(result["samples"].iloc[0], 7)
+
+
+if __name__ == '__main__':
+    unittest.main()  # pragma: no cover
@@ -9,6 +9,7 @@ from pyedautils.data_quality import (
     calc_gap_duration,
     fill_missing_values_with_na,
     calc_isna_percentage,
+    calc_na_runs,
     plot_missing_values,
 )
 
@@ -121,6 +122,30 @@ class TestCalcIsnaPercentage(unittest.TestCase):
         self.assertEqual(result, 33.3)
 
 
+class TestCalcNaRuns(unittest.TestCase):
+    def setUp(self):
+        idx = pd.date_range("2024-01-01", periods=12, freq="min")
+        values = [np.nan, 1, np.nan, np.nan, 1, 1, 1, 1, np.nan, 1, 1, np.nan]
+        self.df = pd.DataFrame({"a": values}, index=idx)
+
+    def test_runs(self):
+        runs = calc_na_runs(self.df)
+        self.assertEqual(list(runs["samples"]), [1, 2, 1, 1])
+        self.assertEqual(list(runs["start"].dt.minute), [0, 2, 8, 11])
+        # a run ends at its last NaN sample
+        self.assertEqual(list(runs["end"].dt.minute), [0, 3, 8, 11])
+
+    def test_merge_within(self):
+        runs = calc_na_runs(self.df, merge_within="3min")
+        self.assertEqual(list(runs["samples"]), [3, 2])
+        self.assertEqual(list(runs["start"].dt.minute), [0, 8])
+        self.assertEqual(list(runs["end"].dt.minute), [3, 11])
+        self.assertEqual(len(calc_na_runs(self.df, merge_within="2min")), 3)
+
+    def test_no_runs(self):
+        self.assertTrue(calc_na_runs(self.df.iloc[4:8]).empty)
+
+
 class TestPlotMissingValues(unittest.TestCase):
     def test_returns_figure(self):
         idx = pd.date_range("2024-01-01", periods=100, freq="min")
@@ -144,6 +169,31 @@ class TestPlotMissingValues(unittest.TestCase):
         fig = plot_missing_values(df, column="b")
         self.assertIn("100.0%", fig.layout.title.text)
 
+    def test_regions_in_one_trace(self):
+        idx = pd.date_range("2024-01-01", periods=10000, freq="min")
+        values = np.ones(10000)
+        values[::10] = np.nan
+        df = pd.DataFrame({"temp": values}, index=idx)
+        fig = plot_missing_values(df)
+        self.assertEqual(len(fig.data), 2)
+        self.assertEqual(len(fig.layout.shapes), 0)
+        # the regions are drawn first, below the data line, on the same axis
+        self.assertEqual(fig.data[0].fill, "toself")
+        self.assertEqual(fig.data[0].yaxis, None)
+        self.assertEqual(list(fig.layout.yaxis.range), [0.5, 1.5])
+        self.assertEqual(len(fig.data[0].x), 6 * 1000)
+        self.assertEqual(len(plot_missing_values(df, merge_within="10min").data[0].x), 6)
+
+    def test_max_points(self):
+        idx = pd.date_range("2024-01-01", periods=100000, freq="min")
+        values = np.sin(np.arange(100000) / 500.0)
+        values[40000:40100] = np.nan
+        df = pd.DataFrame({"temp": values}, index=idx)
+        for method in ("minmax", "lttb"):
+            fig = plot_missing_values(df, max_points=500, downsample=method)
+            self.assertLessEqual(len(fig.data[-1].y), 500)
+            self.assertTrue(np.isnan(np.asarray(fig.data[-1].y, dtype=float)).any())
+
 
 class TestPlotMissingValuesHeatmap(unittest.TestCase):
     def test_returns_figure(self):
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import unittest
 import os
 import numpy as np
@@ -157,5 +159,13 @@ class TestComputePESEdgeCases(unittest.TestCase):
             compute_pes(df, max_iter=1)
 
 
+class TestComputePESImports(unittest.TestCase):
+    """compute_pes does not depend on the plotting stack."""
+
+    def test_no_plotly_import(self):
+        code = "import sys, pyedautils.energy_signature; sys.exit('plotly' in sys.modules)"
+        self.assertEqual(subprocess.run([sys.executable, "-c", code]).returncode, 0)
+
+
 if __name__ == '__main__':
     unittest.main()  # pragma: no cover
@@ -1,15 +1,32 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
+import os
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pandas as pd
+from unittest.mock import patch, AsyncMock, MagicMock
 from requests.exceptions import RequestException
 
+import pyedautils.geopy as geopy
 from pyedautils.geopy import (
+    DemAltitudeProvider,
+    DemTile,
+    lv95_to_wgs84,
+    wgs84_to_lv95,
+    aconvert_wsg84_to_lv95,
+    aget_altitude_lat_long,
+    aget_altitude_lv95,
+    aget_coordindates_ch_plz,
+    aget_lat_long_address,
     get_altitude_lat_long,
     get_lat_long_address,
     get_altitude_lv95,
     convert_wsg84_to_lv95,
     get_coordindates_ch_plz,
+    get_coordinates_ch_plz_many,
     get_distance_between_two_points,
     GeocodingError,
 )
@@ -17,7 +34,7 @@ from pyedautils.geopy import (
 
 class TestConvertWsg84ToLv95(unittest.TestCase):
 
-    @patch('pyedautils.geopy.requests.get')
+    @patch('pyedautils.geopy.http_get')
     def test_valid_coordinates(self, mock_get):
         mock_get.return_value.json.return_value = {
             "coordinates": [2665960.0, 1207350.0]
@@ -36,22 +53,60 @@ class TestConvertWsg84ToLv95(unittest.TestCase):
         with self.assertRaises(GeocodingError):
             convert_wsg84_to_lv95(47.0, 15.0)
 
-    @patch('pyedautils.geopy.requests.get')
+    @patch('pyedautils.geopy.http_get')
     def test_request_failure(self, mock_get):
         mock_get.side_effect = RequestException("No internet")
         with self.assertRaises(GeocodingError):
             convert_wsg84_to_lv95(47.013, 8.306)
 
 
+class TestOfflineLv95Transform(unittest.TestCase):
+
+    # Reference point from the swisstopo documentation of the approximate formulas
+    LAT = 46 + 2 / 60 + 38.87 / 3600
+    LONG = 8 + 43 / 60 + 49.79 / 3600
+
+    def test_wgs84_to_lv95_reference_point(self):
+        east, north = wgs84_to_lv95(self.LAT, self.LONG)
+        self.assertAlmostEqual(east, 2699999.76, delta=0.01)
+        self.assertAlmostEqual(north, 1099999.97, delta=0.01)
+
+    def test_lv95_to_wgs84_reference_point(self):
+        lat, long = lv95_to_wgs84(2700000.0, 1100000.0)
+        self.assertAlmostEqual(lat, 46 + 2 / 60 + 38.86 / 3600, delta=1e-6)
+        self.assertAlmostEqual(long, 8 + 43 / 60 + 49.80 / 3600, delta=1e-6)
+
+    def test_vectorised_roundtrip(self):
+        lat = np.linspace(45.9, 47.7, 50)
+        long = np.linspace(6.0, 10.4, 50)
+        east, north = wgs84_to_lv95(lat, long)
+        self.assertEqual(east.shape, (50,))
+        lat_back, long_back = lv95_to_wgs84(east, north)
+        # Both directions are ~1 m accurate; the roundtrip stays within a few metres
+        np.testing.assert_allclose(lat_back, lat, atol=5e-5)
+        np.testing.assert_allclose(long_back, long, atol=5e-5)
+
+    @patch('pyedautils.geopy.http_get')
+    def test_convert_offline_skips_network(self, mock_get):
+        result = convert_wsg84_to_lv95(self.LAT, self.LONG, offline=True)
+        mock_get.assert_not_called()
+        self.assertAlmostEqual(result[0], 2699999.76, delta=0.01)
+        self.assertAlmostEqual(result[1], 1099999.97, delta=0.01)
+
+    def test_convert_offline_out_of_range(self):
+        with self.assertRaises(GeocodingError):
+            convert_wsg84_to_lv95(57.0, 8.3, offline=True)
+
+
 class TestGetAltitudeLv95(unittest.TestCase):
 
-    @patch('pyedautils.geopy.requests.get')
+    @patch('pyedautils.geopy.http_get')
     def test_valid_coordinates(self, mock_get):
         mock_get.return_value.json.return_value = {"height": "440.5"}
         result = get_altitude_lv95([2665960.0, 1207350.0])
         self.assertEqual(result, 440.5)
 
-    @patch('pyedautils.geopy.requests.get')
+    @patch('pyedautils.geopy.http_get')
     def test_request_failure(self, mock_get):
         mock_get.side_effect = RequestException("No internet")
         with self.assertRaises(GeocodingError):
@@ -60,19 +115,18 @@ class TestGetAltitudeLv95(unittest.TestCase):
 
 class TestGetAltitudeLatLong(unittest.TestCase):
 
-    @patch('pyedautils.geopy.time.sleep')
-    @patch('pyedautils.geopy.requests.get')
-    def test_valid_coordinates(self, mock_get, mock_sleep):
+    @patch('pyedautils.geopy.http_get')
+    def test_valid_coordinates(self, mock_get):
         mock_get.return_value.json.return_value = {
             "results": [{"elevation": 440.2, "location": {"lat": 47.01, "lng": 8.31}}]
         }
         result = get_altitude_lat_long(47.01, 8.31)
         self.assertEqual(result, 440.2)
-        mock_sleep.assert_called_once_with(1)
+        args, kwargs = mock_get.call_args
+        self.assertIn("api.opentopodata.org", args[0])
 
-    @patch('pyedautils.geopy.time.sleep')
-    @patch('pyedautils.geopy.requests.get')
-    def test_elevation_none(self, mock_get, mock_sleep):
+    @patch('pyedautils.geopy.http_get')
+    def test_elevation_none(self, mock_get):
         mock_get.return_value.json.return_value = {
             "results": [{"elevation": None, "location": {"lat": 47.01, "lng": 8.31}}]
         }
@@ -95,13 +149,89 @@ class TestGetAltitudeLatLong(unittest.TestCase):
         with self.assertRaises(ValueError):
             get_altitude_lat_long(47.0, -200.0)
 
-    @patch('pyedautils.geopy.requests.get')
+    @patch('pyedautils.geopy.http_get')
     def test_request_failure(self, mock_get):
         mock_get.side_effect = RequestException("No internet")
         with self.assertRaises(GeocodingError):
             get_altitude_lat_long(47.01, 8.31)
 
 
+def _planar_dem(west, north, cell_size, shape):
+    """DEM with z = 0.5 * E - 0.25 * N at cell centres; bilinear sampling is exact."""
+    rows, cols = np.mgrid[0:shape[0], 0:shape[1]]
+    east = west + (cols + 0.5) * cell_size
+    north_c = north - (rows + 0.5) * cell_size
+    return 0.5 * (east - 2600000) - 0.25 * (north_c - 1200000)
+
+
+def _plane(east, north):
+    return 0.5 * (np.asarray(east) - 2600000) - 0.25 * (np.asarray(north) - 1200000)
+
+
+class TestDemAltitudeProvider(unittest.TestCase):
+
+    def setUp(self):
+        self.tiles = [
+            DemTile(_planar_dem(2600000, 1201000, 10, (100, 100)), 2600000, 1201000, 10),
+            DemTile(_planar_dem(2601000, 1201000, 10, (100, 100)), 2601000, 1201000, 10),
+        ]
+        self.provider = DemAltitudeProvider(self.tiles, cache_size=1)
+
+    def test_scalar_bilinear(self):
+        result = self.provider.altitude(2600123.4, 1200567.8)
+        self.assertIsInstance(result, float)
+        self.assertAlmostEqual(result, float(_plane(2600123.4, 1200567.8)))
+
+    def test_vectorised_across_tiles(self):
+        east = np.array([2600015.0, 2600995.0, 2601005.0, 2601900.0])
+        north = np.array([1200015.0, 1200500.0, 1200500.0, 1200900.0])
+        result = self.provider.altitude(east, north)
+        np.testing.assert_allclose(result, _plane(east, north))
+
+    def test_outside_coverage_is_nan(self):
+        result = self.provider.altitude([2500000.0, 2600500.0], [1200500.0, 1200500.0])
+        self.assertTrue(np.isnan(result[0]))
+        self.assertFalse(np.isnan(result[1]))
+
+    def test_lru_cache_evicts(self):
+        self.provider.altitude(2600500.0, 1200500.0)
+        self.provider.altitude(2601500.0, 1200500.0)
+        self.assertEqual(list(self.provider._cache), [1])
+
+    def test_nodata(self):
+        raster = np.full((2, 2), -9999.0)
+        provider = DemAltitudeProvider([DemTile(raster, 2600000, 1200020, 10, nodata=-9999.0)])
+        self.assertTrue(np.isnan(provider.altitude(2600010.0, 1200010.0)))
+
+    def test_npy_tile_memory_mapped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tile.npy")
+            np.save(path, _planar_dem(2600000, 1201000, 10, (100, 100)))
+            provider = DemAltitudeProvider([DemTile(path, 2600000, 1201000, 10)])
+            result = provider.altitude(2600250.0, 1200750.0)
+            self.assertIsInstance(provider._cache[0], np.memmap)
+            self.assertAlmostEqual(result, float(_plane(2600250.0, 1200750.0)))
+            del provider
+
+    @patch('pyedautils.geopy.http_get')
+    def test_get_altitude_lv95_provider(self, mock_get):
+        result = get_altitude_lv95([2600500.0, 1200500.0], provider=self.provider)
+        mock_get.assert_not_called()
+        self.assertAlmostEqual(result, float(_plane(2600500.0, 1200500.0)))
+
+    def test_get_altitude_lv95_provider_outside(self):
+        with self.assertRaises(GeocodingError):
+            get_altitude_lv95([2500000.0, 1200500.0], provider=self.provider)
+
+    @patch('pyedautils.geopy.http_get')
+    def test_get_altitude_lat_long_provider(self, mock_get):
+        lat, long = lv95_to_wgs84(2600500.0, 1200500.0)
+        result = get_altitude_lat_long(lat, long, provider=self.provider)
+        mock_get.assert_not_called()
+        east, north = wgs84_to_lv95(lat, long)
+        self.assertAlmostEqual(result, round(float(_plane(east, north)), 1))
+
+
 class TestGetLatLongAddress(unittest.TestCase):
 
     @patch('pyedautils.geopy.Nominatim')
@@ -137,31 +267,36 @@ class TestGetLatLongAddress(unittest.TestCase):
             get_lat_long_address("Some address")
 
 
+def _mock_plz_nominatim(mock_nominatim_cls):
+    table = pd.DataFrame({"postal_code": ["6048", "8001"],
+                          "latitude": [47.0145, 47.3717],
+                          "longitude": [8.3062, 8.5423]})
+    mock_nominatim_cls.return_value.query_postal_code.side_effect = (
+        lambda codes: pd.merge(pd.DataFrame({"postal_code": codes}), table, on="postal_code", how="left")
+    )
+
+
 class TestGetCoordinatesChPlz(unittest.TestCase):
 
+    def setUp(self):
+        geopy._plz_index = None
+
+    def tearDown(self):
+        geopy._plz_index = None
+
     @patch('pyedautils.geopy.pgeocode.Nominatim')
     def test_valid_plz(self, mock_nominatim_cls):
-        mock_data = MagicMock()
-        mock_data.latitude.astype.return_value = 47.0145
-        mock_data.longitude.astype.return_value = 8.3062
-        mock_nom = MagicMock()
-        mock_nom.query_postal_code.return_value = mock_data
-        mock_nominatim_cls.return_value = mock_nom
-
+        _mock_plz_nominatim(mock_nominatim_cls)
         result = get_coordindates_ch_plz(6048)
         self.assertEqual(result, (47.0145, 8.3062))
 
     @patch('pyedautils.geopy.pgeocode.Nominatim')
     def test_invalid_plz(self, mock_nominatim_cls):
-        mock_data = MagicMock()
-        mock_data.latitude.astype.return_value = float('nan')
-        mock_data.longitude.astype.return_value = float('nan')
-        mock_nom = MagicMock()
-        mock_nom.query_postal_code.return_value = mock_data
-        mock_nominatim_cls.return_value = mock_nom
-
+        _mock_plz_nominatim(mock_nominatim_cls)
         with self.assertRaises(GeocodingError):
             get_coordindates_ch_plz(424242)
+        with self.assertRaises(GeocodingError):
+            get_coordindates_ch_plz(1234)
 
     @patch('pyedautils.geopy.pgeocode.Nominatim')
     def test_pgeocode_exception(self, mock_nominatim_cls):
@@ -170,6 +305,105 @@ class TestGetCoordinatesChPlz(unittest.TestCase):
         with self.assertRaises(GeocodingError):
             get_coordindates_ch_plz(6048)
 
+    @patch('pyedautils.geopy.pgeocode.Nominatim')
+    def test_index_is_loaded_once(self, mock_nominatim_cls):
+        _mock_plz_nominatim(mock_nominatim_cls)
+        get_coordindates_ch_plz(6048)
+        get_coordindates_ch_plz(8001)
+        get_coordinates_ch_plz_many([6048])
+        mock_nominatim_cls.assert_called_once_with('ch')
+        codes = mock_nominatim_cls.return_value.query_postal_code.call_args.args[0]
+        self.assertEqual((codes[0], codes[-1], len(codes)), ("1000", "9999", 9000))
+
+    @patch('pyedautils.geopy.pgeocode.Nominatim')
+    def test_many(self, mock_nominatim_cls):
+        _mock_plz_nominatim(mock_nominatim_cls)
+        lat, lon = get_coordinates_ch_plz_many([6048, "8001", 1234, 99999, 6048.5, 999])
+        np.testing.assert_allclose(lat[:2], [47.0145, 47.3717])
+        np.testing.assert_allclose(lon[:2], [8.3062, 8.5423])
+        self.assertTrue(np.isnan(lat[2:]).all())
+        self.assertTrue(np.isnan(lon[2:]).all())
+
+
+def _json_response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+class TestAsyncGeopy(unittest.IsolatedAsyncioTestCase):
+
+    @patch('pyedautils.geopy.async_http_get', new_callable=AsyncMock)
+    async def test_aconvert_wsg84_to_lv95(self, mock_get):
+        mock_get.return_value = _json_response({"coordinates": [2665960.0, 1207350.0]})
+        result = await aconvert_wsg84_to_lv95(47.013, 8.306)
+        self.assertEqual(result, [2665960.0, 1207350.0])
+
+    async def test_aconvert_out_of_range(self):
+        with self.assertRaises(GeocodingError):
+            await aconvert_wsg84_to_lv95(57.0, 8.3)
+
+    @patch('pyedautils.geopy.async_http_get', new_callable=AsyncMock)
+    async def test_aget_altitude_lv95(self, mock_get):
+        mock_get.return_value = _json_response({"height": "440.5"})
+        result = await aget_altitude_lv95([2665960.0, 1207350.0])
+        self.assertEqual(result, 440.5)
+
+    @patch('pyedautils.geopy.async_http_get', new_callable=AsyncMock)
+    async def test_aget_altitude_lat_long_concurrent(self, mock_get):
+        mock_get.return_value = _json_response({
+            "results": [{"elevation": 440.2, "location": {"lat": 47.01, "lng": 8.31}}]
+        })
+        results = await asyncio.gather(
+            *(aget_altitude_lat_long(47.01, 8.31) for _ in range(5))
+        )
+        self.assertEqual(results, [440.2] * 5)
+        self.assertEqual(mock_get.await_count, 5)
+
+    @patch('pyedautils.geopy.async_http_get', new_callable=AsyncMock)
+    async def test_aget_altitude_lat_long_failure(self, mock_get):
+        mock_get.side_effect = RequestException("No internet")
+        with self.assertRaises(GeocodingError):
+            await aget_altitude_lat_long(47.01, 8.31)
+
+    @patch('pyedautils.geopy.Nominatim')
+    async def test_aget_lat_long_address(self, mock_nominatim_cls):
+        mock_location = MagicMock()
+        mock_location.latitude = 47.0145
+        mock_location.longitude = 8.3062
+        mock_nominatim_cls.return_value.geocode.return_value = mock_location
+        result = await aget_lat_long_address("Technikumstrasse 21, 6048 Horw")
+        self.assertEqual(result, [47.0145, 8.3062])
+
+    @patch('pyedautils.geopy.async_http_get', new_callable=AsyncMock)
+    async def test_aconvert_offline(self, mock_get):
+        result = await aconvert_wsg84_to_lv95(47.013, 8.306, offline=True)
+        mock_get.assert_not_awaited()
+        self.assertEqual(result, convert_wsg84_to_lv95(47.013, 8.306, offline=True))
+
+    @patch('pyedautils.geopy.async_http_get', new_callable=AsyncMock)
+    async def test_aget_altitude_provider(self, mock_get):
+        tile = DemTile(_planar_dem(2600000, 1201000, 10, (100, 100)), 2600000, 1201000, 10)
+        provider = DemAltitudeProvider([tile])
+        result = await aget_altitude_lv95([2600500.0, 1200500.0], provider=provider)
+        self.assertAlmostEqual(result, float(_plane(2600500.0, 1200500.0)))
+        lat, long = lv95_to_wgs84(2600500.0, 1200500.0)
+        result = await aget_altitude_lat_long(lat, long, provider=provider)
+        self.assertEqual(result, get_altitude_lat_long(lat, long, provider=provider))
+        mock_get.assert_not_awaited()
+
+    @patch('pyedautils.geopy.pgeocode.Nominatim')
+    async def test_aget_coordinates_ch_plz(self, mock_nominatim_cls):
+        _mock_plz_nominatim(mock_nominatim_cls)
+        geopy._plz_index = None
+        try:
+            self.assertEqual(await aget_coordindates_ch_plz(6048), (47.0145, 8.3062))
+            with self.assertRaises(GeocodingError):
+                await aget_coordindates_ch_plz(1234)
+            self.assertEqual(mock_nominatim_cls.call_count, 1)
+        finally:
+            geopy._plz_index = None
+
 
 class TestGetDistanceBetweenTwoPoints(unittest.TestCase):
 
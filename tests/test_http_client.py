@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import pyedautils.http_client as http_client
+from pyedautils.http_client import (
+    AsyncHttpClient,
+    HttpClient,
+    async_http_get,
+    configure_async_http_client,
+    configure_http_client,
+    get_async_http_client,
+    get_http_client,
+    http_get,
+)
+
+
+class TestHttpClient(unittest.TestCase):
+
+    def test_session_is_pooled_with_retries(self):
+        client = HttpClient(pool_maxsize=4, retries=5, backoff_factor=0.1)
+        adapter = client.session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertEqual(adapter.max_retries.backoff_factor, 0.1)
+        self.assertIs(adapter, client.session.get_adapter("http://example.com"))
+        client.close()
+
+    def test_default_rate_limits_are_merged(self):
+        client = HttpClient(rate_limits={"example.com": 0.5})
+        self.assertEqual(client.rate_limits["example.com"], 0.5)
+        self.assertIn("api.opentopodata.org", client.rate_limits)
+
+    @patch('pyedautils.http_client.time.sleep')
+    def test_rate_limit_waits_between_requests(self, mock_sleep):
+        client = HttpClient(rate_limits={"example.com": 2.0})
+        with patch.object(client.session, "get") as mock_get:
+            client.get("https://example.com/a", timeout=5)
+            client.get("https://example.com/b", timeout=5)
+        self.assertEqual(mock_get.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 2.0, delta=0.1)
+
+    @patch('pyedautils.http_client.time.sleep')
+    def test_unlimited_host_does_not_wait(self, mock_sleep):
+        client = HttpClient()
+        with patch.object(client.session, "get"):
+            client.get("https://example.com/a")
+            client.get("https://example.com/b")
+        mock_sleep.assert_not_called()
+
+
+class TestSharedClient(unittest.TestCase):
+
+    def tearDown(self):
+        http_client._client = None
+
+    def test_shared_client_is_reused(self):
+        self.assertIs(get_http_client(), get_http_client())
+
+    def test_configure_replaces_client(self):
+        old = get_http_client()
+        new = configure_http_client(pool_maxsize=2)
+        self.assertIsNot(old, new)
+        self.assertIs(get_http_client(), new)
+        self.assertEqual(new.pool_maxsize, 2)
+
+    def test_http_get_uses_shared_session(self):
+        client = get_http_client()
+        with patch.object(client.session, "get") as mock_get:
+            http_get("https://example.com", timeout=30)
+        mock_get.assert_called_once_with("https://example.com", timeout=30)
+
+
+class TestAsyncHttpClient(unittest.IsolatedAsyncioTestCase):
+
+    def tearDown(self):
+        http_client._client = None
+        http_client._async_client = None
+
+    async def test_concurrency_is_bounded(self):
+        client = AsyncHttpClient(max_concurrency=3)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def blocking(i):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return i
+
+        results = await asyncio.gather(*(client.run(blocking, i) for i in range(12)))
+        self.assertEqual(results, list(range(12)))
+        self.assertLessEqual(state["peak"], 3)
+
+    async def test_async_http_get_uses_shared_session(self):
+        client = get_http_client()
+        with patch.object(client.session, "get") as mock_get:
+            mock_get.return_value.status_code = 200
+            response = await async_http_get("https://example.com", timeout=30)
+        mock_get.assert_called_once_with("https://example.com", timeout=30)
+        self.assertEqual(response.status_code, 200)
+
+    async def test_configure_async_client(self):
+        client = configure_async_http_client(max_concurrency=2)
+        self.assertIs(get_async_http_client(), client)
+        self.assertEqual(client.max_concurrency, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()  # pragma: no cover
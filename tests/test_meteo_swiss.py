@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 import pandas as pd
 
-from pyedautils.weather.meteo_swiss import get_current_station_data, find_nearest_station
+from pyedautils.weather.meteo_swiss import (
+    afind_nearest_station,
+    aget_current_station_data,
+    find_nearest_station,
+    get_current_station_data,
+)
 
 
 MOCK_STATION_DATA = pd.DataFrame({
@@ -23,6 +28,12 @@ MOCK_STATION_DATA = pd.DataFrame({
 
 class TestGetCurrentStationData(unittest.TestCase):
 
+    def setUp(self):
+        patcher = patch('pyedautils.weather.meteo_swiss.http_get')
+        self.mock_get = patcher.start()
+        self.mock_get.return_value.content = b""
+        self.addCleanup(patcher.stop)
+
     @patch('pyedautils.weather.meteo_swiss.pd.read_csv')
     def test_returns_dataframe(self, mock_read_csv):
         mock_read_csv.return_value = MOCK_STATION_DATA.copy()
@@ -44,6 +55,11 @@ class TestGetCurrentStationData(unittest.TestCase):
         with self.assertRaises(ValueError):
             get_current_station_data()
 
+    def test_request_failure(self):
+        self.mock_get.side_effect = Exception("No internet")
+        with self.assertRaises(ValueError):
+            get_current_station_data()
+
 
 class TestFindNearestStation(unittest.TestCase):
 
@@ -92,5 +108,26 @@ class TestFindNearestStation(unittest.TestCase):
             find_nearest_station(47.01, 8.30, 2000, sensor="temp")
 
 
+class TestAsyncMeteoSwiss(unittest.IsolatedAsyncioTestCase):
+
+    @patch('pyedautils.weather.meteo_swiss.async_http_get', new_callable=AsyncMock)
+    async def test_aget_current_station_data(self, mock_get):
+        mock_get.return_value = MagicMock(
+            content=MOCK_STATION_DATA.to_csv(sep=";", index=False).encode("utf-8")
+        )
+        result = await aget_current_station_data()
+        self.assertEqual(len(result), 3)
+
+    @patch('pyedautils.weather.meteo_swiss.aget_current_station_data', new_callable=AsyncMock)
+    async def test_afind_nearest_station(self, mock_data):
+        mock_data.return_value = MOCK_STATION_DATA.copy()
+        result = await afind_nearest_station(47.01, 8.30, 450, sensor="temp")
+        self.assertEqual(result, "LUZ")
+
+    async def test_afind_coordinates_out_of_range(self):
+        with self.assertRaises(ValueError):
+            await afind_nearest_station(8.3, 47.0, 450, sensor="temp")
+
+
 if __name__ == '__main__':
     unittest.main()  # pragma: no cover
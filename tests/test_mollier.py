@@ -5,6 +5,8 @@ import pandas as pd
 from pyedautils._mollier import (
     C_PL,
     R_0,
+    _arange_inclusive,
+    _create_comfort_cached,
     create_comfort,
     density,
     enthalpy,
@@ -21,6 +23,12 @@ from pyedautils._mollier import (
     y_rhox,
 )
 from pyedautils.plots import plot_mollier_hx
+from pyedautils.plots.comfort import (
+    _bin_mollier_data,
+    _d3_ticks,
+    _mollier_isolines,
+    _pack_mollier_data,
+)
 
 
 class TestSaturationPressure(unittest.TestCase):
@@ -53,6 +61,17 @@ class TestSaturationPressure(unittest.TestCase):
         with self.assertRaises(ValueError):
             temperature_p_sat(math.exp(14.2) + 1)
 
+    def test_temperature_p_sat_not_positive(self):
+        with self.assertRaises(ValueError):
+            temperature_p_sat(np.array([611.0, 0.0]))
+
+    def test_temperature_p_sat_vectorised(self):
+        temps = np.linspace(-40.0, 80.0, 1001).reshape(7, 143)
+        t_back = temperature_p_sat(p_sat(temps.ravel()).reshape(temps.shape))
+        self.assertEqual(t_back.shape, temps.shape)
+        np.testing.assert_allclose(t_back, temps, atol=1e-8)
+        self.assertIsInstance(temperature_p_sat(611.0), float)
+
 
 class TestCoordinateFunctions(unittest.TestCase):
     """Tests for enthalpy, temperature, rel_humidity, density."""
@@ -127,6 +146,27 @@ class TestEnthalpyDensityConversions(unittest.TestCase):
         x_back = x_phiy(0.5, yv, p)
         self.assertAlmostEqual(xv, x_back, places=5)
 
+    def test_y_phix_x_phiy_vectorised(self):
+        p = 101325.0
+        t, phi = np.meshgrid(np.linspace(-20, 40, 61), np.linspace(0.05, 1.0, 20))
+        xv, yv = get_x_y(t, phi, p)
+        np.testing.assert_allclose(y_phix(phi, xv, p), yv, atol=1e-8)
+        x_back = x_phiy(phi, yv, p)
+        self.assertEqual(x_back.shape, phi.shape)
+        np.testing.assert_allclose(x_back, xv, atol=1e-9)
+        np.testing.assert_allclose(x_phiy(0.0, np.array([0.0, 20.0]), p), 0.0)
+
+    def test_x_phiy_diverging(self):
+        # no saturated state on y = 50: Newton diverges instead of returning NaN
+        with self.assertRaises(RuntimeError):
+            x_phiy(1.0, 50, 101325)
+        with self.assertRaises(RuntimeError):
+            x_phiy(np.array([0.5, 1.0]), np.array([20.0, 50.0]), 101325)
+        result = x_phiy(np.array([0.5, np.nan]), np.array([20.0, 20.0]), 101325)
+        self.assertTrue(np.isfinite(result[0]))
+        self.assertTrue(np.isnan(result[1]))
+        self.assertTrue(np.isnan(temperature_p_sat(np.array([np.nan, 1000.0])))[0])
+
 
 class TestComfortZone(unittest.TestCase):
     """Tests for create_comfort."""
@@ -147,6 +187,20 @@ class TestComfortZone(unittest.TestCase):
             self.assertGreaterEqual(x, -0.001)
             self.assertLessEqual(x, 0.02)
 
+    def test_comfort_is_cached(self):
+        _create_comfort_cached.cache_clear()
+        first = create_comfort((20, 26), (0.30, 0.65), (0, 0.0115), 101325.0)
+        second = create_comfort((26, 20), (0.65, 0.30), (0.0115, 0), 101325)
+        self.assertEqual(first, second)
+        self.assertEqual(_create_comfort_cached.cache_info().hits, 1)
+        first.append((0.0, 0.0))
+        self.assertNotEqual(len(first), len(create_comfort((20, 26), (0.30, 0.65), (0, 0.0115), 101325.0)))
+
+    def test_arange_inclusive_no_duplicate_stop(self):
+        values = _arange_inclusive(0.0, 0.3, 0.1)
+        np.testing.assert_allclose(values, [0.0, 0.1, 0.2, 0.3])
+        np.testing.assert_allclose(_arange_inclusive(0.3, 0.0, -0.1), [0.3, 0.2, 0.1, 0.0])
+
 
 class TestComfortZonePhiZeroStart(unittest.TestCase):
     """Test create_comfort with phi_min=0 (exercises the Phi==0 branch)."""
@@ -158,19 +212,36 @@ class TestComfortZonePhiZeroStart(unittest.TestCase):
 
 
 class TestScalarInternals(unittest.TestCase):
-    """Test scalar internal functions to reach full coverage."""
+    """Test scalar and array paths of the state functions."""
 
-    def test_rel_humidity_calls_scalar_p_sat(self):
-        # rel_humidity calls _p_sat_scalar internally (scalar path)
+    def test_rel_humidity_scalar(self):
         phi = rel_humidity(0.005, 20, 101325.0)
+        self.assertIsInstance(phi, float)
         self.assertGreater(phi, 0)
         self.assertLess(phi, 1)
 
     def test_rel_humidity_below_zero(self):
-        # Exercises _p_sat_scalar with t < 0.01
+        # Exercises the ice branch of p_sat (t < 0.01)
         phi = rel_humidity(0.001, -10, 101325.0)
         self.assertGreater(phi, 0)
 
+    def test_state_functions_broadcast(self):
+        p = 101325.0
+        xv, yv = get_x_y(np.array([[10.0], [20.0]]), np.array([0.3, 0.5, 0.7]), p)
+        self.assertEqual(xv.shape, (2, 3))
+        for func, args in ((rel_humidity, (xv, yv, p)), (density, (xv, yv, p)),
+                           (enthalpy, (xv, yv)), (temperature, (xv, yv)),
+                           (y_hx, (enthalpy(xv, yv), xv)), (y_rhox, (density(xv, yv, p), xv, p))):
+            self.assertEqual(np.shape(func(*args)), (2, 3))
+        np.testing.assert_allclose(rel_humidity(xv, yv, p), [[0.3, 0.5, 0.7]] * 2)
+
+    def test_float32_preserved(self):
+        t = np.array([10.0, 20.0], dtype=np.float32)
+        xv, yv = get_x_y(t, np.float32(0.5), 101325.0)
+        self.assertEqual(xv.dtype, np.float32)
+        self.assertEqual(rel_humidity(xv, yv, 101325.0).dtype, np.float32)
+        self.assertEqual(x_phiy(np.float32(0.5), yv, 101325.0).dtype, np.float32)
+
 
 class TestPlotMollierHx(unittest.TestCase):
     """Tests for plot_mollier_hx (D3 HTML output)."""
@@ -180,7 +251,8 @@ class TestPlotMollierHx(unittest.TestCase):
         self.assertIsInstance(html, str)
         self.assertIn("d3.v5.min.js", html)
         self.assertIn("drawHXCoordinates", html)
-        self.assertIn("createComfort", html)
+        self.assertIn("let comfortPolygon = [[", html)
+        self.assertNotIn("createComfort", html)
 
     def test_returns_div_fragment(self):
         html = plot_mollier_hx()
@@ -197,10 +269,14 @@ class TestPlotMollierHx(unittest.TestCase):
             "rel_humidity": (0.20, 0.70),
             "abs_humidity": (0, 0.012),
         })
-        self.assertIn("[18, 24]", html)
+        polygon = create_comfort((18, 24), (0.20, 0.70), (0, 0.012), 101325.0)
+        self.assertIn("let comfortPolygon = [[%s, %s]" % (round(polygon[0][0], 7), round(polygon[0][1], 4)), html)
+
+    def test_no_comfort_zone_polygon_is_empty(self):
+        self.assertIn("let comfortPolygon = [];", plot_mollier_hx(comfort_zone=False))
 
     def test_with_synthetic_data_all_seasons(self):
-        # Full year to cover all 4 seasons in _get_season_fast
+        # Full year to cover all 4 season codes
         timestamps = pd.date_range("2023-01-01", periods=365 * 24, freq="h")
         np.random.seed(42)
         n = len(timestamps)
@@ -230,12 +306,182 @@ class TestPlotMollierHx(unittest.TestCase):
 
     def test_no_comfort_zone(self):
         html = plot_mollier_hx(comfort_zone=False)
-        self.assertIn("[0,0]", html)
+        self.assertNotIn("rangeT", html)
 
     def test_custom_height(self):
         html = plot_mollier_hx(height=500)
         self.assertIn("500", html)
 
+    def test_data_is_binary_packed(self):
+        timestamps = pd.date_range("2023-01-01", periods=1000, freq="10min")
+        df = pd.DataFrame({"timestamp": timestamps,
+                           "humidity": np.full(1000, 50.0),
+                           "temperature": np.full(1000, 20.0)})
+        html = plot_mollier_hx(data=df)
+        self.assertIn("decodeRecords(", html)
+        self.assertNotIn('"temp":', html)
+
+    def _frame(self, n):
+        return pd.DataFrame({"timestamp": pd.date_range("2023-01-01", periods=n, freq="10min"),
+                             "humidity": np.linspace(30, 70, n),
+                             "temperature": np.linspace(15, 30, n)})
+
+    def test_render_auto(self):
+        self.assertIn('renderMode = "svg"', plot_mollier_hx(data=self._frame(100)))
+        self.assertIn('renderMode = "canvas"', plot_mollier_hx(data=self._frame(6000)))
+
+    def test_render_explicit(self):
+        html = plot_mollier_hx(data=self._frame(100), render="canvas")
+        self.assertIn('renderMode = "canvas"', html)
+        self.assertIn("d3.quadtree()", html)
+        html = plot_mollier_hx(data=self._frame(6000), render="svg")
+        self.assertIn('renderMode = "svg"', html)
+
+    def test_render_invalid(self):
+        with self.assertRaises(ValueError):
+            plot_mollier_hx(render="webgl")
+
+    def test_max_points_downsamples(self):
+        packed = _pack_mollier_data(self._frame(3000), 101325.0, max_points=500)
+        self.assertEqual(packed["n"], 500)
+        self.assertEqual(len(_decode(packed, "x", "<f4")), 500)
+        dts = _decode(packed, "dts", {"Uint8": "u1", "Uint16": "<u2"}[packed["dtsType"]])
+        self.assertTrue((dts >= 10).all())
+        self.assertEqual(_pack_mollier_data(self._frame(3000), 101325.0, max_points=None)["n"], 3000)
+
+    def test_density_mode(self):
+        html = plot_mollier_hx(data=self._frame(6000), mode="density")
+        self.assertIn("dataRecords = null", html)
+        self.assertIn('"countsType"', html)
+        self.assertNotIn("densityGrid = null", html)
+
+    def test_density_payload_independent_of_sample_count(self):
+        small = plot_mollier_hx(data=self._frame(2000), mode="density", bins=50)
+        large = plot_mollier_hx(data=self._frame(200000), mode="density", bins=50)
+        self.assertLess(len(large) - len(small), 10000)
+
+    def test_mode_invalid(self):
+        with self.assertRaises(ValueError):
+            plot_mollier_hx(mode="hexbin")
+
+
+def _decode(packed, key, dtype):
+    import base64
+    return np.frombuffer(base64.b64decode(packed[key]), dtype=dtype)
+
+
+class TestPackMollierData(unittest.TestCase):
+    """Tests for the typed-array payload of plot_mollier_hx."""
+
+    def test_roundtrip(self):
+        df = pd.DataFrame({
+            "timestamp": pd.to_datetime(["2023-07-01 12:00", "2023-01-15 08:30",
+                                         "2023-04-02 00:00", "2023-10-20 18:10"]),
+            "humidity": [50.0, 40.0, np.nan, 60.0],
+            "temperature": [25.0, 21.0, 22.0, 19.0],
+        })
+        packed = _pack_mollier_data(df, 101325.0)
+        xs = _decode(packed, "x", "<f4")
+        ys = _decode(packed, "y", "<f4")
+        # sorted by time, NaN row dropped
+        x_ref, y_ref = get_x_y(np.array([21.0, 25.0, 19.0]), np.array([0.4, 0.5, 0.6]), 101325.0)
+        np.testing.assert_allclose(xs, x_ref, rtol=1e-6)
+        np.testing.assert_allclose(ys, y_ref, rtol=1e-6)
+        np.testing.assert_array_equal(_decode(packed, "season", "u1"), [0, 2, 3])
+        self.assertEqual(packed["dtsType"], "Uint32")
+        minutes = packed["ts0"] + np.concatenate([[0], np.cumsum(_decode(packed, "dts", "<u4"))])
+        expected = pd.to_datetime(["2023-01-15 08:30", "2023-07-01 12:00", "2023-10-20 18:10"])
+        np.testing.assert_array_equal(minutes, expected.to_numpy().astype("datetime64[m]").astype(np.int64))
+
+    def test_regular_data_uses_small_deltas(self):
+        df = pd.DataFrame({"timestamp": pd.date_range("2023-01-01", periods=50, freq="10min"),
+                           "humidity": 50.0, "temperature": 20.0})
+        packed = _pack_mollier_data(df, 101325.0)
+        self.assertEqual(packed["dtsType"], "Uint8")
+        np.testing.assert_array_equal(_decode(packed, "dts", "u1"), 10)
+
+    def test_bin_counts(self):
+        df = pd.DataFrame({
+            "timestamp": pd.to_datetime(["2023-01-10", "2023-01-11", "2023-07-01", "2023-07-02"]),
+            "humidity": [50.0, 50.0, 50.0, 99.0],
+            "temperature": [0.0, 0.0, 25.0, 60.0],
+        })
+        binned = _bin_mollier_data(df, 101325.0, (0.0, 0.02), (-20.0, 50.0), (4, 7), by_season=False)
+        counts = _decode(binned, "counts", "u1").reshape(binned["layers"], binned["ny"], binned["nx"])
+        # the 60 °C sample lies outside the y domain
+        self.assertEqual(counts.sum(), 3)
+        self.assertEqual(binned["max"], 2)
+        # top row first: the winter samples (y ≈ 0) are in a lower row than the summer one
+        rows = np.nonzero(counts[0].sum(axis=1))[0]
+        self.assertEqual(counts[0, rows.max()].sum(), 2)
+        self.assertEqual(counts[0, rows.min()].sum(), 1)
+
+    def test_bin_counts_by_season(self):
+        df = pd.DataFrame({"timestamp": pd.date_range("2023-01-01", periods=365, freq="D"),
+                           "humidity": 50.0, "temperature": 20.0})
+        binned = _bin_mollier_data(df, 101325.0, (0.0, 0.02), (-20.0, 50.0), 10, by_season=True)
+        self.assertEqual(binned["layers"], 4)
+        counts = _decode(binned, "counts", "u1").reshape(4, 10, 10)
+        np.testing.assert_array_equal(counts.sum(axis=(1, 2)), [90, 92, 92, 91])
+
+    def test_no_valid_data(self):
+        self.assertIsNone(_bin_mollier_data(None, 101325.0, (0, 0.02), (-20, 50), 10, False))
+        self.assertIsNone(_pack_mollier_data(None, 101325.0))
+        df = pd.DataFrame({"timestamp": pd.date_range("2023-01-01", periods=2, freq="h"),
+                           "humidity": [np.nan, np.nan], "temperature": [20.0, 21.0]})
+        self.assertIsNone(_pack_mollier_data(df, 101325.0))
+
+
+class TestMollierIsolines(unittest.TestCase):
+    """Tests for the precomputed iso-line geometry of plot_mollier_hx."""
+
+    def test_d3_ticks(self):
+        self.assertEqual(_d3_ticks(0.1, 0.95, 10), [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
+        self.assertEqual(_d3_ticks(-25.3, 55.1, 40)[:3], [-24, -22, -20])
+        self.assertEqual(_d3_ticks(1.05, 1.4, 8), [1.05, 1.1, 1.15, 1.2, 1.25, 1.3, 1.35, 1.4])
+        self.assertEqual(_d3_ticks(3, 1, 2), [3, 2, 1])
+
+    def test_geometry(self):
+        import json
+        iso = json.loads(_mollier_isolines((0.0, 0.02), (-20.0, 50.0), 101325.0))
+        self.assertEqual(set(iso), {"t", "rho", "phi", "h"})
+        self.assertEqual(iso["phi"]["values"][-1], 1.0)
+        t_x = _decode(iso["t"], "x", "<f4")
+        t_y = _decode(iso["t"], "y", "<f4").reshape(len(iso["t"]["values"]), -1)
+        self.assertEqual(t_x[0], 0.0)
+        self.assertGreaterEqual(t_x[-1], 0.02)
+        np.testing.assert_allclose(temperature(t_x, t_y) - np.array(iso["t"]["values"])[:, None], 0.0, atol=1e-4)
+        # saturation line ends with its first point beyond the domain
+        lengths = iso["phi"]["lengths"]
+        phi_x = _decode(iso["phi"], "x", "<f4")
+        self.assertGreater(phi_x[sum(lengths) - 1], 0.02)
+        self.assertLessEqual(phi_x[sum(lengths) - 2], 0.02)
+
+    def test_cached_and_embedded(self):
+        _mollier_isolines.cache_clear()
+        html = plot_mollier_hx()
+        plot_mollier_hx(domain_x=[0.0, 0.02], domain_y=[-20, 50])
+        self.assertEqual(_mollier_isolines.cache_info().hits, 1)
+        self.assertIn("decodeIsolines(" + _mollier_isolines((0.0, 0.02), (-20.0, 50.0), 101325.0), html)
+        self.assertIn("domainY, p, isolines)", html)
+
+    def test_offline_inlines_d3(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "d3.js")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("/* local d3 */")
+            html = plot_mollier_hx(offline=path)
+        self.assertIn("<script>/* local d3 */</script>", html)
+        self.assertNotIn("d3js.org", html)
+
+    def test_offline_bundled_d3(self):
+        html = plot_mollier_hx(offline=True)
+        self.assertIn("<script>// https://d3js.org v5.", html)
+        self.assertNotIn("<script src=", html)
+        self.assertIn("d3.select(", html)
+
 
 if __name__ == '__main__':
     unittest.main()  # pragma: no cover
@@ -1,3 +1,4 @@
+import gc
 import unittest
 import os
 import numpy as np
@@ -16,6 +17,12 @@ from pyedautils.plots import (
     plot_outliers, plot_correlation, plot_scatter,
     plot_autocorrelation,
 )
+from pyedautils._plot_utils import (
+    binned_kde, downsample_indices, prepare_hourly_seasonal_data, silverman_bandwidth,
+)
+from pyedautils.data_prep._timestamps import (
+    calendar_field, normalize_timeseries, time_code_starts, time_codes, _timestamp_fields,
+)
 
 
 def _load_local_data():
@@ -122,6 +129,189 @@ class TestPlotDailyProfilesOverviewEdgeCases(unittest.TestCase):
         self.assertGreater(len(fig.data), 0)
 
 
+@patch('pyedautils.data_prep.season.get_season', side_effect=_fast_get_season)
+class TestPrepareHourlySeasonalData(unittest.TestCase):
+    """Quantile aggregation of prepare_hourly_seasonal_data."""
+
+    def test_matches_per_group_quantiles(self, _mock):
+        df = _make_synthetic_data(n_days=120)
+        result = prepare_hourly_seasonal_data(df, confidence=90.0)
+        self.assertEqual(list(result.columns),
+                         ["season", "weekday", "dayhour", "valueMedian", "valueUpper", "valueLower"])
+        self.assertEqual(len(result), 2 * 7 * 24)
+        hourly = df.groupby(df["timestamp"].dt.floor("h"))["value"].sum()
+        row = result.iloc[5]
+        values = hourly[(hourly.index.day_name() == row["weekday"])
+                        & (hourly.index.hour == row["dayhour"])
+                        & (hourly.index.map(_fast_get_season) == row["season"])]
+        self.assertAlmostEqual(row["valueMedian"], values.quantile(0.5))
+        self.assertAlmostEqual(row["valueUpper"], values.quantile(0.9))
+        self.assertAlmostEqual(row["valueLower"], values.quantile(0.1))
+
+    def test_median_confidence(self, _mock):
+        result = prepare_hourly_seasonal_data(_make_synthetic_data(n_days=14), confidence=50.0)
+        np.testing.assert_allclose(result["valueUpper"], result["valueMedian"])
+        np.testing.assert_allclose(result["valueLower"], result["valueMedian"])
+
+
+class TestTimeCodes(unittest.TestCase):
+    """Integer time keys of time_codes / time_code_starts."""
+
+    def test_codes_match_floor(self):
+        ts = pd.Series(pd.date_range("1969-12-20", "1970-03-10", freq="7h"))
+        expected = {
+            "minute": ts.dt.floor("min"),
+            "hour": ts.dt.floor("h"),
+            "day": ts.dt.floor("D"),
+            "week": ts.dt.to_period("W").dt.start_time,
+            "month": ts.dt.to_period("M").dt.start_time,
+        }
+        for unit, starts in expected.items():
+            codes = time_codes(ts, unit)
+            self.assertEqual(codes.dtype, np.int64)
+            self.assertTrue(codes.is_monotonic_increasing)
+            np.testing.assert_array_equal(time_code_starts(codes, unit), pd.DatetimeIndex(starts))
+
+    def test_local_time_and_nat(self):
+        ts = pd.Series(pd.date_range("2023-03-25 22:00", periods=4, freq="h", tz="Europe/Zurich"))
+        codes = time_codes(ts)
+        self.assertEqual(list(time_code_starts(codes).strftime("%Y-%m-%d")),
+                         [str(d) for d in ts.dt.date])
+        codes = time_codes(pd.Series([pd.Timestamp("2020-01-01"), pd.NaT]))
+        self.assertEqual(codes.dtype, "Int64")
+        self.assertTrue(pd.isna(codes[1]))
+        with self.assertRaises(ValueError):
+            time_codes(ts, "year")
+
+
+class TestNormalizeTimeseries(unittest.TestCase):
+    """Shared timestamp normalization and cached calendar fields."""
+
+    def test_shares_values(self):
+        df = pd.DataFrame({"t": pd.date_range("2023-01-01", periods=5, freq="h"), "v": np.arange(5.0)})
+        result = normalize_timeseries(df, ["timestamp", "value"])
+        self.assertEqual(list(result.columns), ["timestamp", "value"])
+        self.assertEqual(list(df.columns), ["t", "v"])
+        self.assertTrue(np.shares_memory(result["value"].to_numpy(), df["v"].to_numpy()))
+        result["value"] = 0.0
+        self.assertEqual(df["v"].sum(), 10.0)
+
+    def test_parses_and_sorts(self):
+        df = pd.DataFrame({"t": ["2023-01-02", "2023-01-01"], "v": [2.0, 1.0]}, index=[5, 7])
+        result = normalize_timeseries(df, ["timestamp", "value"], sort=True)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(result["timestamp"]))
+        self.assertEqual(list(result["value"]), [1.0, 2.0])
+        self.assertEqual(list(result.index), [0, 1])
+
+    def test_calendar_field_cached(self):
+        ts = pd.Series(pd.date_range("2023-03-25", periods=100, freq="37min", tz="Europe/Zurich"))
+        for field in ("year", "month", "day", "hour", "minute", "dayofweek"):
+            np.testing.assert_array_equal(calendar_field(ts, field), getattr(ts.dt, field))
+        first = calendar_field(ts, "hour").to_numpy()
+        self.assertTrue(np.shares_memory(calendar_field(ts.copy(deep=False), "hour").to_numpy(), first))
+        with self.assertRaises(ValueError):
+            calendar_field(ts, "week")
+
+    def test_cache_follows_edits(self):
+        df = pd.DataFrame({"timestamp": pd.date_range("2023-01-01", periods=3, freq="D"), "value": 1.0})
+        self.assertEqual(list(calendar_field(df["timestamp"], "day")), [1, 2, 3])
+        df.loc[0, "timestamp"] = pd.Timestamp("2023-01-09")
+        self.assertEqual(list(calendar_field(df["timestamp"], "day")), [9, 2, 3])
+        self.assertEqual(list(time_codes(df["timestamp"]).diff().iloc[1:]), [-7, 1])
+
+        values = pd.date_range("2023-01-01", periods=3, freq="h").to_numpy().copy()
+        ts = pd.Series(values, copy=False)
+        self.assertEqual(list(calendar_field(ts, "hour")), [0, 1, 2])
+        values[1] = np.datetime64("2023-01-01T05:00")
+        self.assertEqual(list(calendar_field(pd.Series(values, copy=False), "hour")), [0, 5, 2])
+
+    def test_cache_freed_with_data(self):
+        gc.collect()
+        before = len(_timestamp_fields)
+        df = pd.DataFrame({"timestamp": pd.date_range("2023-01-01", periods=10, freq="h"), "value": 1.0})
+        calendar_field(df["timestamp"], "hour")
+        self.assertEqual(len(_timestamp_fields), before + 1)
+        del df
+        gc.collect()
+        self.assertEqual(len(_timestamp_fields), before)
+
+
+class TestBinnedKde(unittest.TestCase):
+    """FFT kernel density of binned_kde."""
+
+    def test_matches_direct_sum(self):
+        rng = np.random.default_rng(0)
+        for values in (rng.normal(size=5000), np.r_[rng.normal(size=3000), rng.normal(20, 0.1, 300)]):
+            grid = np.linspace(values.min() - 3, values.max() + 3, 200)
+            h = silverman_bandwidth(values)
+            self.assertAlmostEqual(h, 1.06 * values.std() * values.size ** (-1 / 5))
+            direct = np.exp(-0.5 * ((grid[:, None] - values) / h) ** 2).sum(axis=1) / (values.size * h * np.sqrt(2 * np.pi))
+            np.testing.assert_allclose(binned_kde(values, grid), direct, atol=1e-3 * direct.max())
+
+    def test_weights(self):
+        grid = np.linspace(-3, 5, 81)
+        weighted = binned_kde([0.0, 1.0, 1.0, 2.0, np.nan], grid, bandwidth=0.5, weights=[1, 2, 0, 1, 5])
+        np.testing.assert_allclose(weighted, binned_kde([0.0, 1.0, 1.0, 2.0], grid, bandwidth=0.5))
+        self.assertAlmostEqual(np.trapezoid(weighted, grid), 1.0, places=6)
+
+    def test_degenerate(self):
+        grid = np.linspace(0, 1, 10)
+        self.assertTrue(np.isnan(binned_kde([], grid)).all())
+        self.assertTrue(np.isnan(binned_kde([0.5, 0.5], grid)).all())
+
+
+class TestDownsampleIndices(unittest.TestCase):
+    """Min-max and LTTB downsampling of downsample_indices."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = pd.date_range("2020-01-01", periods=100000, freq="min")
+        self.y = np.cumsum(rng.normal(size=self.x.size))
+        self.y[54321] = 1e6
+        self.y[-7] = -1e6
+        self.y[1000:1500] = np.nan
+
+    def test_bounded_with_peaks_and_gaps(self):
+        for method in ("minmax", "lttb"):
+            idx = downsample_indices(self.x, self.y, 1000, method)
+            self.assertLessEqual(idx.size, 1000)
+            self.assertTrue(np.all(np.diff(idx) > 0))
+            self.assertEqual((idx[0], idx[-1]), (0, self.x.size - 1))
+            self.assertIn(54321, idx)
+            self.assertIn(self.x.size - 7, idx)
+            self.assertTrue(np.isnan(self.y[idx]).any())
+
+    def test_every_gap_kept(self):
+        self.y[3000:3010:2] = np.nan  # five short dropouts inside one bucket
+        gaps = np.r_[1000, np.arange(3000, 3010, 2)]
+        for method in ("minmax", "lttb"):
+            idx = downsample_indices(self.x, self.y, 1000, method)
+            self.assertLessEqual(idx.size, 1000)
+            for gap in gaps:
+                self.assertIn(gap, idx)
+        # more gaps than the budget: still bounded, one gap per bucket
+        self.y[10000:12000:2] = np.nan
+        idx = downsample_indices(self.x, self.y, 100, "minmax")
+        self.assertLessEqual(idx.size, 100)
+        self.assertTrue(np.isnan(self.y[idx]).any())
+
+    def test_minmax_keeps_bucket_extremes(self):
+        y = np.random.default_rng(1).normal(size=1002)
+        idx = downsample_indices(None, y, 202, "minmax")
+        self.assertEqual(idx.size, 202)
+        for bucket in np.split(np.arange(1, 1001), 100):
+            self.assertIn(bucket[np.argmax(y[bucket])], idx)
+            self.assertIn(bucket[np.argmin(y[bucket])], idx)
+
+    def test_short_and_invalid(self):
+        np.testing.assert_array_equal(downsample_indices(self.x[:50], self.y[:50], 100), np.arange(50))
+        np.testing.assert_array_equal(downsample_indices(self.x, self.y, None), np.arange(self.x.size))
+        with self.assertRaises(ValueError):
+            downsample_indices(self.x, self.y, 1000, "every_nth")
+        with self.assertRaises(ValueError):
+            downsample_indices(self.x, self.y, 2)
+
+
 class TestPlotDailyProfiles(unittest.TestCase):
     """Tests for plot_daily_profiles with method parameter."""
 
@@ -178,6 +368,39 @@ class TestPlotDailyProfiles(unittest.TestCase):
                     "Friday", "Saturday", "Sunday"]:
             self.assertIn(day, html)
 
+    def test_overlayed_one_trace_per_weekday(self):
+        import json
+        html = plot_daily_profiles(self.df, method="overlayed")
+        data = json.loads(html.split("var figData = ", 1)[1].split(";\n", 1)[0])["data"]
+        starts = json.loads(html.split("var dayStarts = ", 1)[1].split(";\n", 1)[0])
+        labels = json.loads(html.split("var dayLabels = ", 1)[1].split(";\n", 1)[0])
+        # 7 weekday traces plus the (empty) hover highlight trace
+        self.assertEqual(len(data), 8)
+        self.assertEqual(data[-1]["x"], [])
+        monday = data[0]
+        self.assertEqual(monday["name"], "Monday")
+        self.assertEqual(len(starts[0]), 52)
+        self.assertEqual(labels[0][0], "2023-01-02")
+        # days are separated by a single null point
+        self.assertEqual(len(monday["x"]), 52 * 24 + 51)
+        self.assertIsNone(monday["x"][starts[0][1] - 1])
+        self.assertEqual(monday["x"][starts[0][1]], 0.0)
+        self.assertEqual(monday["x"][starts[0][1] + 1], 1.0)
+
+    def test_overlayed_wall_clock_days(self):
+        import json
+        import warnings
+        ts = pd.date_range("2024-01-01", periods=48, freq="h", tz="Europe/Zurich")
+        df = pd.DataFrame({"timestamp": ts, "value": np.arange(48.0)})
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            html = plot_daily_profiles(df, method="overlayed")
+        starts = json.loads(html.split("var dayStarts = ", 1)[1].split(";\n", 1)[0])
+        labels = json.loads(html.split("var dayLabels = ", 1)[1].split(";\n", 1)[0])
+        # Monday 2024-01-01 and Tuesday 2024-01-02, one segment each
+        self.assertEqual(labels[:2], [["2024-01-01"], ["2024-01-02"]])
+        self.assertEqual(starts[:2], [[0], [0]])
+
 
 @patch('pyedautils.data_prep.season.get_season', side_effect=_fast_get_season)
 class TestPlotHeatmapMedianWeeks(unittest.TestCase):
@@ -258,6 +481,28 @@ class TestPlotHeatmapCalendar(unittest.TestCase):
         fig = plot_heatmap_calendar(df)
         self.assertEqual(len(fig.data), 2)  # 2 years = 2 heatmaps
 
+    def test_hover_labels(self):
+        fig = plot_heatmap_calendar(self.df)
+        trace = fig.data[0]
+        # 2023-01-01 is a Sunday in ISO week 52 of 2022 → week 0
+        self.assertEqual(trace.customdata[6][0], "2023-01-01 (Sun)")
+        self.assertAlmostEqual(trace.z[6][0], self.df["value"].iloc[:24].sum())
+        self.assertIsNone(trace.customdata[0][0])
+        self.assertTrue(np.isnan(trace.z[0][0]))
+        self.assertIn("%{customdata}", trace.hovertemplate)
+
+    def test_month_borders(self):
+        fig = plot_heatmap_calendar(self.df)
+        # 2023: May starts on a Monday (one line), the other 10 months mid-week (three lines each)
+        self.assertEqual(len(fig.layout.shapes), 31)
+        self.assertEqual(list(fig.layout.xaxis.ticktext)[:3], ["Jan", "Feb", "Mar"])
+
+    def test_many_years(self):
+        timestamps = pd.date_range(start='2004-01-01', end='2023-12-31', freq='D')
+        df = pd.DataFrame({'timestamp': timestamps, 'value': 1.0})
+        fig = plot_heatmap_calendar(df)
+        self.assertEqual(len(fig.data), 20)
+
 
 def _load_simple_data():
     """Load the bundled simple energy signature CSV."""
@@ -452,6 +697,14 @@ class TestPlotDensitySeasons(unittest.TestCase):
         names = {t.name for t in fig.data}
         self.assertEqual(names, {"Spring", "Summer", "Fall", "Winter"})
 
+    def test_weights_column(self, _mock):
+        df = self.df.iloc[:, :2].copy()
+        df["weight"] = 1.0
+        unweighted = plot_density_seasons(self.df)
+        fig = plot_density_seasons(df, weights="weight")
+        for a, b in zip(fig.data, unweighted.data):
+            np.testing.assert_allclose(a.y, b.y, atol=1e-12)
+
 
 class TestPlotSeasonalPlots(unittest.TestCase):
     """Tests for all 4 seasonal plot functions."""
@@ -578,6 +831,15 @@ class TestPlotTimeseries(unittest.TestCase):
         fig = plot_timeseries(df, range_slider=False)
         self.assertIsNotNone(fig)
 
+    def test_max_points(self):
+        df = _make_ts_dataframe(n=50000)
+        df.iloc[12345, 0] = 100.0
+        fig = plot_timeseries(df, max_points=2000)
+        for trace in fig.data:
+            self.assertLessEqual(len(trace.x), 2000)
+        self.assertEqual(max(fig.data[0].y), 100.0)
+        self.assertEqual(len(plot_timeseries(df, max_points=None).data[0].x), 50000)
+
 
 class TestPlotDistribution(unittest.TestCase):
     def test_returns_figure(self):
@@ -0,0 +1,171 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from pyedautils._profile_cube import _centered_rolling_mean, _centroid_quantiles, _compress
+from pyedautils.plots import ProfileCube, plot_daily_profiles, plot_daily_profiles_overview, plot_heatmap_median_weeks
+
+
+def _fast_get_season(date, **kwargs):
+    """Meteorological seasons, skipping the ephem calculations."""
+    names = np.array(["Winter"] * 2 + ["Spring"] * 3 + ["Summer"] * 3 + ["Fall"] * 3 + ["Winter"])
+    return pd.Series(names[date.dt.month - 1], index=date.index)
+
+
+def _make_data(n_days=90, freq="15min"):
+    timestamps = pd.date_range("2023-01-01", periods=n_days * 96, freq=freq)
+    rng = np.random.default_rng(0)
+    values = rng.random(len(timestamps)) * 100
+    values[500:520] = np.nan
+    return pd.DataFrame({"timestamp": timestamps, "value": values})
+
+
+class TestHelpers(unittest.TestCase):
+
+    def test_centered_rolling_mean_matches_pandas(self):
+        values = np.random.default_rng(1).random(500)
+        values[[40, 41, 300]] = np.nan
+        for k in (1, 4, 7, 96):
+            expected = pd.Series(values).rolling(window=k, center=True).mean().to_numpy()
+            np.testing.assert_allclose(_centered_rolling_mean(values, k), expected)
+
+    def test_centroid_quantiles_matches_pandas(self):
+        segments = [np.sort(np.random.default_rng(i).random(n)) for i, n in enumerate((1, 2, 9, 0, 30))]
+        offsets = np.r_[0, np.cumsum([len(s) for s in segments])]
+        q = [0.05, 0.5, 0.95]
+        result = _centroid_quantiles(np.concatenate(segments), None, offsets, q)
+        for i, segment in enumerate(segments):
+            if len(segment):
+                np.testing.assert_allclose(result[:, i], pd.Series(segment).quantile(q).to_numpy())
+            else:
+                self.assertTrue(np.isnan(result[:, i]).all())
+
+    def test_compress_bounds_size_and_error(self):
+        values = np.random.default_rng(2).normal(size=20000)
+        cell = np.repeat([0, 2], 10000)
+        means, weights, offsets = _compress(cell, values, np.ones(values.size), 3, 100)
+        self.assertEqual(list(np.diff(offsets) > 0), [True, False, True])
+        self.assertLessEqual(np.diff(offsets).max(), 51)
+        self.assertEqual(weights.sum(), values.size)
+        # small centroids in the tails
+        self.assertLessEqual(weights[0], 10)
+        self.assertLess(weights[0], weights.max() / 10)
+
+        q = [0.01, 0.25, 0.5, 0.75, 0.99]
+        result = _centroid_quantiles(means, weights, offsets, q)
+        for i, segment in ((0, values[:10000]), (2, values[10000:])):
+            ranks = np.searchsorted(np.sort(segment), result[:, i]) / segment.size
+            np.testing.assert_allclose(ranks, q, atol=0.01)
+
+
+@patch("pyedautils.data_prep.season.get_season", side_effect=_fast_get_season)
+class TestProfileCube(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.df = _make_data()
+
+    def test_statistics_match_groupby(self, _mock):
+        cube = ProfileCube.from_data(self.df, k=96)
+        ts = self.df["timestamp"]
+        self.assertEqual(cube.count.shape, (4, 7, 1440))
+        self.assertEqual(cube.count.sum(), self.df["value"].notna().sum())
+
+        keys = [ts.dt.dayofweek, ts.dt.hour * 60 + ts.dt.minute]
+        mean = self.df.groupby(keys)["value"].mean()
+        for (weekday, slot), value in mean.items():
+            self.assertAlmostEqual(cube.mean(by_season=False)[weekday, slot], value)
+        # January to March 2023: Winter (index 3) and Spring (index 0)
+        std = self.df[ts.dt.month <= 2].groupby(keys)["value"].std()
+        for (weekday, slot), value in std.items():
+            self.assertAlmostEqual(cube.std()[3, weekday, slot], value)
+
+        detrended = self.df["value"] - self.df["value"].rolling(96, center=True).mean()
+        expected = detrended.groupby(keys).mean()
+        for (weekday, slot), value in expected.items():
+            self.assertAlmostEqual(cube.detrended_mean()[weekday, slot], value)
+
+    def test_hourly_quantiles_match_groupby(self, _mock):
+        cube = ProfileCube.from_data(self.df, k=None)
+        hourly = self.df.groupby(self.df["timestamp"].dt.floor("h"))["value"].sum()
+        winter = hourly[hourly.index.month <= 2]
+        cell = winter[(winter.index.dayofweek == 2) & (winter.index.hour == 7)]
+        result = cube.hourly_quantiles([0.1, 0.5])
+        self.assertEqual(result.shape, (2, 4, 7, 24))
+        np.testing.assert_allclose(result[:, 3, 2, 7], cell.quantile([0.1, 0.5]).to_numpy())
+        # no Summer data
+        self.assertTrue(np.isnan(result[:, 1]).all())
+
+    def test_merge_exact(self, _mock):
+        first, second = self.df.iloc[:4000], self.df.iloc[4000:]
+        whole = ProfileCube.from_data(self.df, k=None)
+        merged = ProfileCube.from_data(first, k=None).merge(ProfileCube.from_data(second, k=None))
+        self.assertIsNone(merged.compression)
+        np.testing.assert_array_equal(merged.count, whole.count)
+        np.testing.assert_allclose(merged.total, whole.total)
+        np.testing.assert_array_equal(merged.hourly_offsets, whole.hourly_offsets)
+        np.testing.assert_allclose(merged.hourly_quantiles([0.1, 0.5, 0.9]), whole.hourly_quantiles([0.1, 0.5, 0.9]))
+
+        with self.assertRaises(ValueError):
+            ProfileCube.from_data(first, k=96).merge(ProfileCube.from_data(second, k=None))
+
+    def test_merge_sketches(self, _mock):
+        df = _make_data(n_days=3 * 365, freq="h").iloc[:3 * 365 * 24]
+        years = [ProfileCube.from_data(part, k=None, compression=50)
+                 for _, part in df.groupby(df["timestamp"].dt.year)]
+        merged = years[0].merge(years[1]).merge(years[2])
+        exact = ProfileCube.from_data(df, k=None)
+        self.assertEqual(merged.compression, 50)
+        self.assertEqual(merged.hourly_weights.sum(), exact.hourly_values.size)
+        self.assertLess(merged.hourly_values.size, exact.hourly_values.size)
+        # rank error of the medians
+        median = merged.hourly_quantiles([0.5])[0].ravel()
+        offsets = exact.hourly_offsets
+        for cell in np.flatnonzero(np.diff(offsets)):
+            segment = exact.hourly_values[offsets[cell]:offsets[cell + 1]]
+            self.assertAlmostEqual(np.searchsorted(segment, median[cell]) / segment.size, 0.5, delta=0.08)
+
+        fig = plot_daily_profiles_overview(df, compression=50)
+        self.assertEqual(len(fig.data), len(plot_daily_profiles_overview(df).data))
+
+    def test_without_detrending(self, _mock):
+        cube = ProfileCube.from_data(self.df, k=None)
+        with self.assertRaises(ValueError):
+            cube.detrended_mean()
+        with self.assertRaises(ValueError):
+            plot_daily_profiles(cube, method="decomposed")
+
+    def test_time_zone_wall_clock(self, _mock):
+        df = pd.DataFrame({"timestamp": pd.date_range("2023-01-02", periods=4, freq="h", tz="UTC"),
+                           "value": [1.0, 2.0, 3.0, 4.0]})
+        cube = ProfileCube.from_data(df.assign(timestamp=df["timestamp"].dt.tz_localize(None)),
+                                     loc_time_zone="Europe/Zurich", k=None)
+        aware = ProfileCube.from_data(df.assign(timestamp=df["timestamp"].dt.tz_convert("Europe/Zurich")), k=None)
+        np.testing.assert_array_equal(aware.count[3, 0, [60, 120, 180, 240]], 1)
+        np.testing.assert_array_equal(cube.count[3, 0, [0, 60, 120, 180]], 1)
+
+    def test_plots_accept_cube(self, _mock):
+        cube = ProfileCube.from_data(self.df, loc_time_zone="UTC", k=672)
+        for method in ("mean", "decomposed"):
+            from_cube = plot_daily_profiles(cube, method=method)
+            from_data = plot_daily_profiles(self.df, method=method)
+            for a, b in zip(from_cube.data, from_data.data):
+                np.testing.assert_array_equal(a.x, b.x)
+                np.testing.assert_array_equal(a.y, b.y)
+
+        from_cube = plot_heatmap_median_weeks(cube)
+        from_data = plot_heatmap_median_weeks(self.df)
+        for a, b in zip(from_cube.data, from_data.data):
+            np.testing.assert_array_equal(a.z, b.z)
+
+        fig = plot_daily_profiles_overview(cube)
+        self.assertEqual(len(fig.data), len(plot_daily_profiles_overview(self.df).data))
+
+        with self.assertRaises(ValueError):
+            plot_daily_profiles(cube, method="overlayed")
+
+
+if __name__ == "__main__":
+    unittest.main()
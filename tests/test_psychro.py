@@ -0,0 +1,161 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pyedautils import _mollier
+from pyedautils.psychro import (
+    abs_humidity,
+    density,
+    dew_point,
+    enrich_psychrometrics,
+    enthalpy,
+    mollier_state,
+    mollier_xy,
+    p_sat,
+    rel_humidity,
+    saturation_temperature,
+    use_p_sat_table,
+)
+
+
+class TestPsychro(unittest.TestCase):
+
+    def setUp(self):
+        self.t = np.array([-10.0, 0.0, 20.0, 35.0])
+        self.phi = np.array([0.9, 0.5, 0.5, 0.3])
+        self.p = 101325.0
+
+    def test_scalar_returns_float(self):
+        for value in (p_sat(20.0), abs_humidity(20.0, 0.5), dew_point(20.0, 0.5),
+                      enthalpy(20.0, 0.007), density(20.0, 0.007)):
+            self.assertIsInstance(value, float)
+
+    def test_matches_mollier(self):
+        x, y = mollier_xy(self.t, self.phi, self.p)
+        xm, ym = _mollier.get_x_y(self.t, self.phi, self.p)
+        np.testing.assert_allclose(x, xm)
+        np.testing.assert_allclose(y, ym)
+        np.testing.assert_allclose(abs_humidity(self.t, self.phi, self.p), xm)
+        np.testing.assert_allclose(enthalpy(self.t, x), _mollier.enthalpy(xm, ym))
+        np.testing.assert_allclose(density(self.t, x, self.p), _mollier.density(xm, ym, self.p))
+
+    def test_roundtrips(self):
+        x = abs_humidity(self.t, self.phi, self.p)
+        np.testing.assert_allclose(rel_humidity(self.t, x, self.p), self.phi)
+        t_back, phi_back = mollier_state(*mollier_xy(self.t, self.phi, self.p), self.p)
+        np.testing.assert_allclose(t_back, self.t, atol=1e-10)
+        np.testing.assert_allclose(phi_back, self.phi)
+        np.testing.assert_allclose(saturation_temperature(p_sat(self.t)), self.t, atol=1e-8)
+
+    def test_known_values(self):
+        # 20 °C / 50 %rH: x ≈ 7.3 g/kg, h ≈ 38.5 kJ/kg, dew point ≈ 9.3 °C
+        self.assertAlmostEqual(abs_humidity(20.0, 0.5) * 1000, 7.3, delta=0.1)
+        self.assertAlmostEqual(enthalpy(20.0, abs_humidity(20.0, 0.5)), 38.5, delta=0.5)
+        self.assertAlmostEqual(dew_point(20.0, 0.5), 9.3, delta=0.1)
+
+    def test_dew_point_saturated_and_dry(self):
+        np.testing.assert_allclose(dew_point(self.t, 1.0), self.t, atol=1e-8)
+        self.assertTrue(np.isnan(dew_point(20.0, 0.0)))
+
+    def test_broadcasting(self):
+        t = np.linspace(0, 30, 4)[:, None]
+        phi = np.linspace(0.2, 0.8, 3)[None, :]
+        self.assertEqual(abs_humidity(t, phi).shape, (4, 3))
+        self.assertEqual(dew_point(t, phi).shape, (4, 3))
+        x, y = mollier_xy(t, phi)
+        self.assertEqual(y.shape, (4, 3))
+
+    def test_float32(self):
+        x = abs_humidity(self.t, self.phi, self.p, dtype=np.float32)
+        self.assertEqual(x.dtype, np.float32)
+        self.assertEqual(enthalpy(self.t, x, dtype=np.float32).dtype, np.float32)
+        self.assertEqual(dew_point(self.t, self.phi, dtype=np.float32).dtype, np.float32)
+        x_ref = abs_humidity(self.t, self.phi, self.p)
+        np.testing.assert_allclose(x, x_ref, rtol=1e-5)
+
+    def test_series_input(self):
+        t = pd.Series(self.t)
+        phi = pd.Series(self.phi)
+        np.testing.assert_allclose(abs_humidity(t, phi), abs_humidity(self.t, self.phi))
+
+
+class TestPSatTable(unittest.TestCase):
+
+    def tearDown(self):
+        use_p_sat_table(False)
+
+    def test_table_accuracy(self):
+        t = np.linspace(-40.0, 80.0, 200001)
+        exact = p_sat(t)
+        use_p_sat_table()
+        np.testing.assert_allclose(p_sat(t), exact, rtol=1e-7)
+        np.testing.assert_allclose(saturation_temperature(exact), t, atol=6e-7)
+
+    def test_inverse_accuracy_over_pressure_range(self):
+        # pressures spread over the table, and densely across the ice/water join
+        p_s = np.r_[np.geomspace(p_sat(-40.0), p_sat(80.0), 1000001), np.linspace(611.0, 611.5, 100001)]
+        exact = saturation_temperature(p_s)
+        use_p_sat_table()
+        np.testing.assert_allclose(saturation_temperature(p_s), exact, rtol=0, atol=6e-7)
+
+    def test_outside_range_is_exact(self):
+        t = np.array([-60.0, -40.5, 80.5, 95.0])
+        exact = p_sat(t)
+        t_exact = saturation_temperature(exact)
+        use_p_sat_table()
+        np.testing.assert_array_equal(p_sat(t), exact)
+        np.testing.assert_array_equal(saturation_temperature(exact), t_exact)
+
+    def test_table_shared_by_mollier(self):
+        use_p_sat_table()
+        self.assertTrue(_mollier._use_p_sat_table)
+        x, y = mollier_xy(20.0, 0.5)
+        self.assertAlmostEqual(_mollier.y_phix(0.5, x, 101325.0), y, places=5)
+        use_p_sat_table(False)
+        self.assertFalse(_mollier._use_p_sat_table)
+
+
+class TestEnrichPsychrometrics(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=25, freq="h"),
+            "temperature": np.linspace(-5.0, 30.0, 25),
+            "humidity": np.linspace(20.0, 90.0, 25),
+        })
+        self.df.loc[3, "humidity"] = np.nan
+
+    def test_columns_match_functions(self):
+        result = enrich_psychrometrics(self.df)
+        t = self.df["temperature"].to_numpy()
+        phi = self.df["humidity"].to_numpy() / 100
+        x = abs_humidity(t, phi)
+        np.testing.assert_allclose(result["abs_humidity"], x)
+        np.testing.assert_allclose(result["enthalpy"], enthalpy(t, x))
+        np.testing.assert_allclose(result["dew_point"], dew_point(t, phi))
+        np.testing.assert_allclose(result["density"], density(t, x))
+        np.testing.assert_allclose(result["mollier_y"], mollier_xy(t, phi)[1])
+        self.assertTrue(result.loc[3, ["abs_humidity", "dew_point"]].isna().all())
+        self.assertNotIn("enthalpy", self.df.columns)
+
+    def test_slices_match_single_pass(self):
+        pd.testing.assert_frame_equal(enrich_psychrometrics(self.df, chunksize=7),
+                                      enrich_psychrometrics(self.df))
+
+    def test_chunk_iterator(self):
+        chunks = (self.df.iloc[i:i + 10] for i in range(0, len(self.df), 10))
+        result = enrich_psychrometrics(chunks)
+        self.assertNotIsInstance(result, pd.DataFrame)
+        pd.testing.assert_frame_equal(pd.concat(list(result)), enrich_psychrometrics(self.df))
+
+    def test_pressure_column_and_dtype(self):
+        df = self.df.assign(p=95000.0)
+        result = enrich_psychrometrics(df, pressure="p", dtype=np.float32)
+        self.assertEqual(result["density"].dtype, np.float32)
+        expected = enrich_psychrometrics(self.df, pressure=95000.0)
+        np.testing.assert_allclose(result["density"], expected["density"], rtol=1e-5)
+
+
+if __name__ == '__main__':
+    unittest.main()  # pragma: no cover
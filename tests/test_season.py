@@ -74,6 +74,14 @@ class TestSeasonFunction(unittest.TestCase):
         pd_datetime_series = pd.Series([datetime(2024, 3, 31, 3, 5), datetime(2024, 6, 22), datetime(2024, 9, 24), datetime(2024, 12, 24)])
         expected_seasons = pd.Series(["Spring", "Summer", "Fall", "Winter"])
         assert_series_equal(get_season(date=pd_datetime_series), expected_seasons)
+
+    def test_pandas_series_matches_scalar(self):
+        # The vectorised Series path must agree with the scalar path
+        dates = pd.Series(pd.date_range("2023-01-01", "2025-12-31", freq="7h"), name="hour")
+        for kwargs in ({}, {"tracking_type": "meteorological"}, {"hemisphere": "south"}):
+            with self.subTest(**kwargs):
+                expected = pd.Series([get_season(d.to_pydatetime(), **kwargs) for d in dates], name="hour")
+                assert_series_equal(get_season(dates, **kwargs), expected)
                 
 if __name__ == '__main__':
     unittest.main() # pragma: no cover